@@ -0,0 +1,87 @@
+"""
+Benchmark coroutine listeners with fire_async.
+
+Each change is saved by slow I/O listeners: database writes (simulated with a sleep) and HTTP pushes to a local
+stand-in server that answers after a delay. Awaiting the listeners one after another adds up the delays. Running them
+concurrently overlaps them.
+
+Run:
+
+    python -m benchmarks.bench_async
+"""
+from __future__ import print_function
+
+import asyncio
+import time
+
+from event_signal import signaler
+
+
+DELAY = 0.02
+DB_LISTENERS = 5
+HTTP_LISTENERS = 5
+CHANGES = 5
+
+
+async def handle_request(reader, writer):
+    """Local stand-in for an HTTP endpoint that answers after a delay."""
+    await reader.readuntil(b'\r\n\r\n')
+    await asyncio.sleep(DELAY)
+    writer.write(b'HTTP/1.1 204 No Content\r\nContent-Length: 0\r\n\r\n')
+    await writer.drain()
+    writer.close()
+
+
+def make_db_write():
+    async def db_write(value):
+        await asyncio.sleep(DELAY)  # Database round trip
+    return db_write
+
+
+def make_http_push(port):
+    async def http_push(value):
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        writer.write('POST /value/{} HTTP/1.1\r\nHost: localhost\r\nContent-Length: 0\r\n\r\n'.format(value).encode())
+        await writer.drain()
+        await reader.read()
+        writer.close()
+    return http_push
+
+
+class Model(object):
+    @signaler
+    def set_x(self, value):
+        self.x = value
+
+
+async def run(model, **options):
+    start = time.perf_counter()
+    for i in range(CHANGES):
+        await model.set_x.fire_async("change", i, **options)
+    return time.perf_counter() - start
+
+
+async def main():
+    server = await asyncio.start_server(handle_request, '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        model = Model()
+        for _ in range(DB_LISTENERS):
+            model.set_x.on("change", make_db_write())
+        for _ in range(HTTP_LISTENERS):
+            model.set_x.on("change", make_http_push(port))
+
+        listeners = DB_LISTENERS + HTTP_LISTENERS
+        print("{} changes, {} listeners, {:.0f} ms of I/O each".format(CHANGES, listeners, DELAY * 1000))
+        for name, options in (("sequential", {'concurrent': False}),
+                              ("limit=3", {'limit': 3}),
+                              ("concurrent", {})):
+            seconds = await run(model, **options)
+            print("{:<12} {:>8.1f} ms per change".format(name, seconds / CHANGES * 1000))
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,76 @@
+"""
+Benchmark loading records with 30 fields into an observed model with and without a batch.
+
+Every field has a "change" callback (like a bound widget). The batch calls each callback once with the final value.
+
+Run:
+
+    python -m benchmarks.bench_batch
+"""
+from __future__ import print_function
+
+import time
+
+from event_signal import signaler_property, batch
+
+
+FIELDS = ['f{}'.format(i) for i in range(30)]
+RECORDS = [dict((field, i * 100 + j) for j, field in enumerate(FIELDS)) for i in range(50)]
+
+
+def observed_field(name):
+    """Return a signaler_property that stores the value in the '_' + name attribute."""
+    attr = '_' + name
+
+    def fget(self):
+        return getattr(self, attr, None)
+
+    def fset(self, value):
+        setattr(self, attr, value)
+
+    return signaler_property(fget, fset)
+
+
+Record = type('Record', (object,), dict((field, observed_field(field)) for field in FIELDS))
+
+
+def load(model, records):
+    for record in records:
+        for field, value in record.items():
+            setattr(model, field, value)
+
+
+def bench(use_batch):
+    """Return the number of change callbacks and the seconds to load all of the records."""
+    model = Record()
+    calls = [0]
+
+    def changed(self, value):
+        calls[0] += 1
+
+    for field in FIELDS:
+        Record.__dict__[field].on("change", changed)
+
+    start = time.perf_counter()
+    if use_batch:
+        with batch():
+            load(model, RECORDS)
+    else:
+        load(model, RECORDS)
+    seconds = time.perf_counter() - start
+
+    for field in FIELDS:
+        Record.__dict__[field].off("change", changed)
+    return calls[0], seconds
+
+
+def main():
+    plain_calls, plain_seconds = bench(False)
+    batch_calls, batch_seconds = bench(True)
+    print("no batch  {:>6} change callbacks  {:.4f} sec".format(plain_calls, plain_seconds))
+    print("batch     {:>6} change callbacks  {:.4f} sec".format(batch_calls, batch_seconds))
+    print("callback reduction {:.0f}x".format(plain_calls / float(batch_calls)))
+
+
+if __name__ == '__main__':
+    main()
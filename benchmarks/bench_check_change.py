@@ -0,0 +1,69 @@
+"""
+Benchmark setting a large list with the different signaler_property check_change strategies.
+
+Every strategy sets a new list that is equal to the current value except for the last item, so 'equality' compares all
+of the items while 'identity' and a version key do not look at the items. 'verbatim' fires the 'change' signal with the
+given value instead of calling the getter again.
+
+Run:
+
+    python -m benchmarks.bench_check_change
+"""
+from __future__ import print_function
+
+import operator
+import timeit
+
+from event_signal import signaler_property
+from event_signal.signaler_prop import same_key
+
+
+NUMBER = 2000
+SIZE = 100000
+
+
+class Values(list):
+    """List with a version number that the owner increments for every edit."""
+    def __init__(self, items, version=0):
+        super(Values, self).__init__(items)
+        self.version = version
+
+
+class Model(object):
+    def __init__(self):
+        self._values = Values(range(SIZE))
+
+    def get_values(self):
+        return self._values
+
+    def set_values(self, values):
+        self._values = values
+
+    equality = signaler_property(get_values, set_values)
+    identity = signaler_property(get_values, set_values, check_change='identity')
+    version = signaler_property(get_values, set_values, check_change=same_key(operator.attrgetter('version')))
+    verbatim = signaler_property(get_values, set_values, check_change='identity', verbatim=True)
+    unchecked = signaler_property(get_values, set_values, check_change=False)
+
+
+for prop in (Model.equality, Model.identity, Model.version, Model.verbatim, Model.unchecked):
+    prop.on('change', lambda self, value: None)
+
+
+def bench_set(name, number=NUMBER):
+    """Return the microseconds to set a new list."""
+    model = Model()
+    values = [Values(range(SIZE), version=i + 1) for i in range(2)]
+    values[1][-1] = -1
+    stmt = 'setattr(model, name, values[0]); setattr(model, name, values[1])'
+    env = {'model': model, 'name': name, 'values': values}
+    return min(timeit.repeat(stmt, globals=env, number=number, repeat=3)) / (number * 2) * 1e6
+
+
+def main():
+    for name in ('equality', 'identity', 'version', 'verbatim', 'unchecked'):
+        print("{:<10} {:>10.2f} us".format(name, bench_set(name)))
+
+
+if __name__ == '__main__':
+    main()
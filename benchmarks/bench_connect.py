@@ -0,0 +1,77 @@
+"""
+Benchmark connecting, disconnecting, and getting the callback functions of a signal.
+
+Run:
+
+    python -m benchmarks.bench_connect
+"""
+from __future__ import print_function
+
+import timeit
+
+from event_signal import signaler, get_signal, on_signal, off_signal
+
+
+NUMBER = 200000
+
+
+def callback(value):
+    pass
+
+
+def make_signaler():
+    """Return a signaler with a few callbacks connected to the change signal."""
+    def set_x(value):
+        pass
+
+    sig = signaler(set_x)
+    for _ in range(3):
+        sig.on("change", lambda value: None)
+    return sig
+
+
+def bench_on_off(number=NUMBER):
+    """Return the number of on/off pairs per second."""
+    sig = make_signaler()
+
+    def on_off():
+        on_signal(sig, "change", callback)
+        off_signal(sig, "change", callback)
+
+    return number / min(timeit.repeat(on_off, number=number, repeat=3))
+
+
+def bench_get_signal(number=NUMBER):
+    """Return the number of get_signal calls per second."""
+    sig = make_signaler()
+    return number / min(timeit.repeat(lambda: get_signal(sig, "change"), number=number, repeat=3))
+
+
+class Listener(object):
+    def notify(self, value):
+        pass
+
+
+def bench_many_listeners(count=5000):
+    """Return the seconds to connect and then disconnect a bound method for many listeners to one signal."""
+    sig = make_signaler()
+    listeners = [Listener() for _ in range(count)]
+
+    def setup_teardown():
+        for listener in listeners:
+            sig.on("change", listener.notify)
+        for listener in listeners:
+            sig.off("change", listener.notify)
+
+    return min(timeit.repeat(setup_teardown, number=1, repeat=3))
+
+
+def main():
+    print("on/off      {:>12,.0f} pairs/sec".format(bench_on_off()))
+    print("get_signal  {:>12,.0f} calls/sec".format(bench_get_signal()))
+    for count in (1000, 5000):
+        print("{:>5} listeners on/off {:>9.4f} sec".format(count, bench_many_listeners(count)))
+
+
+if __name__ == '__main__':
+    main()
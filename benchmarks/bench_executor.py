@@ -0,0 +1,62 @@
+"""
+Benchmark the latency of the producer that emits a Signal with slow (I/O bound) listeners.
+
+Inline the producer waits for every listener. With an executor the producer only submits the callbacks, and the
+listeners finish in the worker threads.
+
+Run:
+
+    python -m benchmarks.bench_executor
+"""
+from __future__ import print_function
+
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from event_signal import Signal
+
+
+EMITS = 200
+LISTENERS = 4
+DELAY = 0.001
+
+
+def listener(value):
+    time.sleep(DELAY)  # Blocking I/O
+
+
+def bench(executor=None):
+    """Return the average emit latency and the seconds until every listener finished."""
+    class Producer(object):
+        changed = Signal(int, executor=executor)
+
+    producer = Producer()
+    for _ in range(LISTENERS):
+        producer.changed.connect(lambda value: listener(value))
+
+    futures = []
+    latency = 0
+    start = time.perf_counter()
+    for i in range(EMITS):
+        emit_start = time.perf_counter()
+        result = producer.changed.emit(i)
+        latency += time.perf_counter() - emit_start
+        if result:
+            futures.extend(result)
+    wait(futures)
+    return latency / EMITS, time.perf_counter() - start
+
+
+def main():
+    print("{} emits, {} listeners, {:.0f} ms of blocking I/O each".format(EMITS, LISTENERS, DELAY * 1000))
+    latency, total = bench()
+    print("{:<10} emit {:>9.1f} us  all listeners done {:>7.3f} sec".format("inline", latency * 1e6, total))
+    for workers in (1, 4, 16):
+        with ThreadPoolExecutor(workers) as executor:
+            latency, total = bench(executor)
+        print("{:<10} emit {:>9.1f} us  all listeners done {:>7.3f} sec".format(
+            "{} workers".format(workers), latency * 1e6, total))
+
+
+if __name__ == '__main__':
+    main()
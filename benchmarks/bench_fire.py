@@ -0,0 +1,60 @@
+"""
+Benchmark the fire throughput of a signal.
+
+Compares firing a signal with plain callbacks to firing a signal where a callback disconnects and reconnects a callback
+while the signal is firing (like `bind_signals` does).
+
+Run:
+
+    python -m benchmarks.bench_fire
+"""
+from __future__ import print_function
+
+import timeit
+
+from event_signal import signaler
+
+
+NUMBER = 200000
+
+
+def make_signaler(reentrant=False):
+    """Return a signaler with 3 callbacks connected to the change signal."""
+    def set_x(value):
+        pass
+
+    sig = signaler(set_x)
+
+    def callback1(value):
+        pass
+
+    def callback2(value):
+        if reentrant:
+            # Modify the callbacks while the signal is firing
+            sig.off("change", callback1)
+            sig.on("change", callback1)
+
+    def callback3(value):
+        pass
+
+    sig.on("change", callback1)
+    sig.on("change", callback2)
+    sig.on("change", callback3)
+    return sig
+
+
+def bench_fire(reentrant=False, number=NUMBER):
+    """Return the number of fires per second."""
+    sig = make_signaler(reentrant)
+    seconds = min(timeit.repeat(lambda: sig.fire("change", 1), number=number, repeat=3))
+    return number / seconds
+
+
+def main():
+    for reentrant in (False, True):
+        rate = bench_fire(reentrant)
+        print("fire reentrant={!s:<5} {:>12,.0f} fires/sec".format(reentrant, rate))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark listener objects that connect to a shared Signal while the cyclic garbage collector is disabled.
+
+Strong callbacks keep every listener alive. Weak callbacks let the listeners be freed by reference counting alone and
+are removed from the signal.
+
+Run:
+
+    python -m benchmarks.bench_gc
+"""
+from __future__ import print_function
+
+import gc
+import time
+import weakref
+
+from event_signal import Signal
+
+
+COUNT = 5000
+
+
+class Model(object):
+    changed = Signal(object)
+
+
+class Listener(object):
+    def __init__(self):
+        self.value = None
+
+    def notify(self, value):
+        self.value = value
+
+
+def bench_listeners(weak, count=COUNT):
+    """Return the number of listeners alive after they were deleted, the connected callbacks, and the seconds."""
+    model = Model()
+    refs = []
+
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(count):
+            listener = Listener()
+            model.changed.connect(listener.notify, weak=weak)
+            model.changed.emit(1)
+            refs.append(weakref.ref(listener))
+            del listener
+        seconds = time.perf_counter() - start
+
+        alive = sum(1 for ref in refs if ref() is not None)
+        connected = len(model.changed.get_signal("change"))
+    finally:
+        gc.enable()
+    return alive, connected, seconds
+
+
+def main():
+    for weak in (False, True):
+        alive, connected, seconds = bench_listeners(weak)
+        print("weak={!s:<5} alive listeners {:>6} connected {:>6}  {:.3f} sec".format(weak, alive, connected, seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark creating many objects whose class has signalers with class level callback functions.
+
+Measures the memory of the per object signalers and the latency of the first access to a signaler and a
+signaler_property of every object.
+
+Run:
+
+    python -m benchmarks.bench_instances
+"""
+from __future__ import print_function
+
+import time
+import tracemalloc
+
+from event_signal import signaler, signaler_property
+
+
+COUNT = 20000
+
+
+class Point(object):
+    def __init__(self):
+        self._x = 0
+        self._y = 0
+
+    @signaler
+    def set_x(self, value):
+        self._x = value
+
+    @set_x.on("before_change")
+    @set_x.on("change")
+    def x_changed(self, value):
+        pass
+
+    @signaler_property
+    def y(self):
+        return self._y
+
+    @y.setter
+    def y(self, value):
+        self._y = value
+
+    @y.on("before_change")
+    @y.on("change")
+    def y_changed(self, value):
+        pass
+
+
+def first_access(points):
+    """Access the signaler and signaler_property of every point for the first time."""
+    for point in points:
+        point.set_x
+        point.y
+
+
+def main():
+    points = [Point() for _ in range(COUNT)]
+    start = time.perf_counter()
+    first_access(points)
+    seconds = time.perf_counter() - start
+
+    points = [Point() for _ in range(COUNT)]
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        first_access(points)
+        size = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+    print("first access  {:>8.0f} ns per object".format(seconds / COUNT * 1e9))
+    print("memory        {:>8.0f} bytes per object".format(size / COUNT))
+
+
+if __name__ == '__main__':
+    main()
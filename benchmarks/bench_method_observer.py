@@ -0,0 +1,102 @@
+"""
+Benchmark a MethodObserver class with 50 methods that nobody observes.
+
+The eager class wraps every method in a signaler when the class is created (the previous MethodObserverMeta). The
+MethodObserver class keeps the functions until a callback function is connected.
+
+The policy benchmark creates classes with 300 private helper methods and 10 setters with different observation
+policies.
+
+Run:
+
+    python -m benchmarks.bench_method_observer
+"""
+from __future__ import print_function
+
+import timeit
+
+from event_signal import MethodObserver, MethodObserverMeta, observable, signaler
+
+
+METHODS = 50
+NUMBER = 200000
+
+
+def make_methods():
+    def make(i):
+        def method(self, value):
+            self.value = value
+        method.__name__ = method.__qualname__ = 'method_{}'.format(i)
+        return method
+    return {'method_{}'.format(i): make(i) for i in range(METHODS)}
+
+
+def make_plain():
+    return type('Plain', (object,), make_methods())
+
+
+def make_eager():
+    return type('Eager', (object,), {name: signaler(func) for name, func in make_methods().items()})
+
+
+def make_lazy():
+    return type('Lazy', (MethodObserver,), make_methods())
+
+
+def make_helper_methods(mark=False):
+    methods = make_methods()
+    for i in range(300):
+        def helper(self):
+            pass
+        methods['_helper_{}'.format(i)] = helper
+    for i in range(10):
+        def setter(self, value):
+            self.value = value
+        methods['set_{}'.format(i)] = observable(setter) if mark else setter
+    return methods
+
+
+def bench_policies():
+    policies = [
+        ('plain', lambda: type('Plain', (object,), make_helper_methods())),
+        ('observe all', lambda: type('All', (MethodObserver,), make_helper_methods())),
+        ('observe public', lambda: type('Public', (MethodObserver,), make_helper_methods(), observe='public')),
+        ('include set_*', lambda: type('Include', (MethodObserver,), make_helper_methods(), include='set_*')),
+        ('observe marked', lambda: type('Marked', (MethodObserver,), make_helper_methods(True), observe='marked')),
+        ('metaclass public', lambda: MethodObserverMeta('Meta', (object,), make_helper_methods(), observe='public')),
+        ]
+    print("Create a class with {} methods".format(METHODS + 310))
+    for name, make in policies:
+        create = timeit.timeit(make, number=200) / 200
+        print("{:<16} {:8.1f} us".format(name, create * 1e6))
+
+
+def main():
+    bench_policies()
+    print()
+
+    classes = [('plain', make_plain), ('eager signaler', make_eager), ('MethodObserver', make_lazy)]
+    print("{} methods".format(METHODS))
+    for name, make in classes:
+        create = timeit.timeit(make, number=1000) / 1000
+        cls = make()
+
+        # First call of every method on a new object
+        first = timeit.timeit(lambda: [getattr(cls(), 'method_{}'.format(i))(1) for i in range(METHODS)],
+                              number=1000) / (1000 * METHODS)
+
+        obj = cls()
+        obj.method_0(1)
+        call = timeit.timeit('obj.method_0(1)', globals={'obj': obj}, number=NUMBER) / NUMBER
+        print("{:<16} create class {:8.1f} us, first call {:6.3f} us, call {:6.3f} us".format(
+            name, create * 1e6, first * 1e6, call * 1e6))
+
+    cls = make_lazy()
+    obj = cls()
+    obj.method_0.on('change', lambda value: None)
+    call = timeit.timeit('obj.method_0(1)', globals={'obj': obj}, number=NUMBER) / NUMBER
+    print("{:<16} observed call {:6.3f} us".format('MethodObserver', call * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark small writes into a large ObservableArray compared to replacing the array of a signaler_property.
+
+The signaler_property has to copy the array for every write, compare it with the old array, and the callback function
+gets the whole array. The ObservableArray writes in place and the callback function gets the index that changed.
+
+Run:
+
+    python -m benchmarks.bench_observable_array
+"""
+from __future__ import print_function
+
+import timeit
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from event_signal import signaler_property
+from event_signal.observable_array import ObservableArray
+
+
+NUMBER = 10000
+SIZE = 1000000
+
+
+class Model(object):
+    def __init__(self):
+        self._samples = numpy.zeros(SIZE)
+
+    def get_samples(self):
+        return self._samples
+
+    def set_samples(self, samples):
+        self._samples = samples
+
+    samples = signaler_property(get_samples, set_samples, check_change='array')
+
+    @samples.on('change')
+    def samples_changed(self, samples):
+        pass
+
+
+def bench(stmt, env, number=NUMBER):
+    """Return the microseconds for one write."""
+    return min(timeit.repeat(stmt, globals=env, number=number, repeat=3)) / number * 1e6
+
+
+def main():
+    if numpy is None:
+        print("numpy is not installed")
+        return
+
+    plain = numpy.zeros(SIZE)
+    unobserved = ObservableArray(numpy.zeros(SIZE))
+    observed = ObservableArray(numpy.zeros(SIZE))
+    observed.on('change', lambda index: None)
+    model = Model()
+    env = {'plain': plain, 'unobserved': unobserved, 'observed': observed, 'model': model, 'i': 12345}
+
+    results = [
+        ("ndarray[i] = 1", bench('plain[i] = 1', env)),
+        ("ObservableArray unobserved", bench('unobserved[i] = 1', env)),
+        ("ObservableArray observed", bench('observed[i] = 1', env)),
+        ("ObservableArray held", bench('with observed.hold():\n    observed[i] = 1\n    observed[i + 10] = 2', env) / 2),
+        ("signaler_property copy", bench('new = model.samples.copy(); new[i] += 1; model.samples = new', env,
+                                         number=NUMBER // 100)),
+        ]
+    for name, us in results:
+        print("{:<28} {:>10.2f} us".format(name, us))
+
+
+if __name__ == '__main__':
+    main()
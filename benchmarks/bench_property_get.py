@@ -0,0 +1,64 @@
+"""
+Benchmark reading a signaler_property value compared to reading a builtin property value.
+
+The target is at most 1.5x the time of a builtin property read.
+
+Run:
+
+    python -m benchmarks.bench_property_get
+"""
+from __future__ import print_function
+
+import timeit
+
+from event_signal import signaler_property
+
+
+NUMBER = 1000000
+TARGET = 1.5
+
+
+class Bare(object):
+    def __init__(self):
+        self._x = 0
+
+    @property
+    def x(self):
+        return self._x
+
+
+class Observed(object):
+    def __init__(self):
+        self._x = 0
+
+    @signaler_property
+    def x(self):
+        return self._x
+
+    @x.setter
+    def x(self, value):
+        self._x = value
+
+    @x.on("change")
+    def x_changed(self, value):
+        pass
+
+
+def bench_read(obj, number=NUMBER):
+    """Return the nanoseconds to read the x value."""
+    return min(timeit.repeat('obj.x', globals={'obj': obj}, number=number, repeat=5)) / number * 1e9
+
+
+def main():
+    observed = Observed()
+    observed.x = 1  # Make sure a signaler instance exists
+    bare_ns = bench_read(Bare())
+    observed_ns = bench_read(observed)
+    ratio = observed_ns / bare_ns
+    print("property read           {:>8.1f} ns".format(bare_ns))
+    print("signaler_property read  {:>8.1f} ns".format(observed_ns))
+    print("ratio {:.2f}x (target <= {:.1f}x)".format(ratio, TARGET))
+
+
+if __name__ == '__main__':
+    main()
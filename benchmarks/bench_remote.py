@@ -0,0 +1,103 @@
+"""
+Benchmark emitting signals in another process with a SignalBridge.
+
+Throughput sends many messages from a child process and measures the messages per second that the parent emits for
+different batch sizes. Latency sends a ping to the child which answers with a pong for every message.
+
+Run:
+
+    python -m benchmarks.bench_remote
+"""
+from __future__ import print_function
+
+import multiprocessing
+import socket
+import threading
+import time
+
+from event_signal import SignalBridge
+
+
+MESSAGES = 100000
+PINGS = 2000
+
+
+def send_messages(conn, count, batch_size):
+    with SignalBridge(conn, batch_size=batch_size) as bridge:
+        value = bridge.remote("value")
+        for i in range(count):
+            value.emit(i)
+
+
+def pong(conn):
+    with SignalBridge(conn, flush_interval=0) as bridge:
+        bridge.forward(bridge.signal("ping"), "pong")
+        bridge.signal("stop").connect(bridge.close)  # The forked child also holds the parent's end (no EOF)
+        bridge.run()
+
+
+def bench_throughput(ctx, make_pair, batch_size, count=MESSAGES):
+    """Return the number of messages per second."""
+    parent, child = make_pair()
+    received = [0]
+
+    def value(i):
+        received[0] += 1
+
+    bridge = SignalBridge(parent)
+    bridge.signal("value").connect(value)
+    start = time.perf_counter()
+    process = ctx.Process(target=send_messages, args=(child, count, batch_size))
+    process.start()
+    child.close()
+    bridge.run()
+    seconds = time.perf_counter() - start
+    process.join()
+    bridge.close()
+    assert received[0] == count, received[0]
+    return count / seconds
+
+
+def bench_latency(ctx, make_pair, count=PINGS):
+    """Return the mean round trip time in seconds."""
+    parent, child = make_pair()
+    process = ctx.Process(target=pong, args=(child,))
+    process.start()
+    child.close()
+
+    bridge = SignalBridge(parent, flush_interval=0)
+    received = threading.Event()
+    bridge.signal("pong").connect(lambda i: received.set())
+    bridge.start()
+    ping = bridge.remote("ping")
+    times = []
+    for i in range(count):
+        received.clear()
+        start = time.perf_counter()
+        ping.emit(i)
+        received.wait()
+        times.append(time.perf_counter() - start)
+    bridge.remote("stop").emit()
+    bridge.close()
+    process.join()
+    times.sort()
+    return sum(times) / count, times[count // 2], times[int(count * 0.99)]
+
+
+def main():
+    ctx = multiprocessing.get_context()
+    pairs = [("pipe", ctx.Pipe)]
+    if hasattr(socket, "AF_UNIX"):
+        pairs.append(("unix socket", socket.socketpair))
+
+    for name, make_pair in pairs:
+        for batch_size in (1, 16, 256):
+            rate = bench_throughput(ctx, make_pair, batch_size)
+            print("{:<12} batch_size {:>4}: {:>12,.0f} messages/sec".format(name, batch_size, rate))
+        mean, median, p99 = bench_latency(ctx, make_pair)
+        print("{:<12} round trip: mean {:.1f} us, median {:.1f} us, p99 {:.1f} us".format(
+            name, mean * 1e6, median * 1e6, p99 * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark sharing a numeric value between processes with a shared_property compared to a multiprocessing.Queue.
+
+The shared_property writes the value into shared memory. The Queue pickles every value and the other process has to
+read all of them.
+
+Run:
+
+    python -m benchmarks.bench_shared
+"""
+from __future__ import print_function
+
+import multiprocessing
+import time
+import timeit
+
+from event_signal import shared_property, share_state
+
+
+COUNT = 100000
+
+
+class Model(object):
+    value = shared_property('d')
+
+
+def write_shared(name, count):
+    model = Model()
+    with share_state(model, name, create=False):
+        for i in range(count):
+            model.value = i
+
+
+def write_queue(queue, count):
+    for i in range(count):
+        queue.put(i)
+    queue.put(None)
+
+
+def bench_shared(ctx, count=COUNT):
+    """Return the number of values per second that were written while the main process polls for changes."""
+    model = Model()
+    changes = [0]
+    Model.value.on(model, 'change', lambda value: changes.__setitem__(0, changes[0] + 1))
+    with share_state(model) as state:
+        try:
+            state.start(interval=0.001)
+            start = time.perf_counter()
+            process = ctx.Process(target=write_shared, args=(state.name, count))
+            process.start()
+            process.join()
+            seconds = time.perf_counter() - start
+            time.sleep(0.01)
+            assert model.value == count - 1
+        finally:
+            state.unlink()
+    return count / seconds, changes[0]
+
+
+def bench_queue(ctx, count=COUNT):
+    """Return the number of values per second that were sent and received through a Queue."""
+    queue = ctx.Queue()
+    start = time.perf_counter()
+    process = ctx.Process(target=write_queue, args=(queue, count))
+    process.start()
+    last = None
+    while True:
+        value = queue.get()
+        if value is None:
+            break
+        last = value
+    process.join()
+    assert last == count - 1
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    ctx = multiprocessing.get_context()
+    rate, changes = bench_shared(ctx)
+    print("shared_property: {:>12,.0f} values/sec ({} change signals while polling every 1 ms)".format(rate, changes))
+    print("Queue:           {:>12,.0f} values/sec".format(bench_queue(ctx)))
+
+    model = Model()
+    with share_state(model) as state:
+        try:
+            number = 200000
+            read = timeit.timeit(lambda: model.value, number=number)
+            write = timeit.timeit('model.value += 1', globals={'model': model}, number=number)
+        finally:
+            state.unlink()
+    print("read {:.3f} us, write {:.3f} us".format(read / number * 1e6, write / number * 1e6))
+
+
+if __name__ == '__main__':
+    main()
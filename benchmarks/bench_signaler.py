@@ -0,0 +1,85 @@
+"""
+Benchmark calling signalers and setting signaler_property values that nobody is listening to.
+
+Run:
+
+    python -m benchmarks.bench_signaler
+"""
+from __future__ import print_function
+
+import timeit
+
+from event_signal import signaler, signaler_property
+
+
+NUMBER = 200000
+
+
+class Bare(object):
+    def __init__(self):
+        self._x = 0
+
+    def get_x(self):
+        return self._x
+
+    def set_x(self, value):
+        self._x = value
+
+    @property
+    def x(self):
+        return self._x
+
+    @x.setter
+    def x(self, value):
+        self._x = value
+
+
+class Observed(object):
+    def __init__(self):
+        self._x = 0
+
+    def get_x(self):
+        return self._x
+
+    @signaler(getter=get_x)
+    def set_x(self, value):
+        self._x = value
+
+    @signaler_property
+    def x(self):
+        return self._x
+
+    @x.setter
+    def x(self, value):
+        self._x = value
+
+
+def bench(stmt, number=NUMBER):
+    """Return the nanoseconds per call of the given function."""
+    return min(timeit.repeat(stmt, number=number, repeat=3)) / number * 1e9
+
+
+def set_attr(obj):
+    def run():
+        obj.x = 1
+        obj.x = 2
+    return run
+
+
+def main():
+    bare = Bare()
+    observed = Observed()
+    observed_set_x = observed.set_x
+    results = [
+        ("bare method call", bench(lambda: bare.set_x(1))),
+        ("unobserved signaler call", bench(lambda: observed.set_x(1))),
+        ("unobserved signaler call (pre-bound)", bench(lambda: observed_set_x(1))),
+        ("property set (x2)", bench(set_attr(bare))),
+        ("unobserved signaler_property set (x2)", bench(set_attr(observed))),
+        ]
+    for name, ns in results:
+        print("{:<40} {:>8.0f} ns".format(name, ns))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark calling signaler methods with 0, 1, and 3 arguments.
+
+The generic BoundSignalerDecoratorInstance takes `*args, **kwargs` and passes them on to the 'before_change' callbacks,
+the method, and the 'change' callbacks. The generated class (see `bound_signaler_class`) has the parameters of the
+method and passes them on directly.
+
+Run:
+
+    python -m benchmarks.bench_signaler_args
+"""
+from __future__ import print_function
+
+import timeit
+
+from event_signal import signaler
+from event_signal.signaler import BoundSignalerDecoratorInstance, bound_signaler_class
+
+
+NUMBER = 200000
+
+
+class Model(object):
+    @signaler
+    def reset(self):
+        self.x = self.y = self.z = 0
+
+    @signaler
+    def set_x(self, x):
+        self.x = x
+
+    @signaler
+    def move(self, x, y, z):
+        self.x, self.y, self.z = x, y, z
+
+
+def listener(*args):
+    pass
+
+
+CALLS = [('0 args', 'reset', ()), ('1 arg', 'set_x', (1,)), ('3 args', 'move', (1, 2, 3))]
+
+
+def bench(listen):
+    for name, attr, args in CALLS:
+        descriptor = getattr(Model, attr)
+        results = []
+        for cls in (BoundSignalerDecoratorInstance, bound_signaler_class(descriptor.func)):
+            sig = cls(descriptor, Model())
+            if listen == 'instance listeners':
+                sig.on('before_change', listener)
+                sig.on('change', listener)
+            results.append(timeit.timeit(lambda: sig(*args), number=NUMBER) / NUMBER)
+        print("{:<8} {:<24} generic {:6.3f} us, generated {:6.3f} us ({:.0%} faster)".format(
+            name, listen, results[0] * 1e6, results[1] * 1e6, 1 - results[1] / results[0]))
+
+
+def main():
+    bench('no listeners')
+    for _, attr, _ in CALLS:
+        getattr(Model, attr).on('before_change', listener)
+        getattr(Model, attr).on('change', listener)
+    bench('class listeners')
+    bench('instance listeners')
+
+
+if __name__ == '__main__':
+    main()
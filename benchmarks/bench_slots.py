@@ -0,0 +1,86 @@
+"""
+Benchmark a class with 10 observed signaler_property fields.
+
+Compares a __slots__ class that stores the instance signalers in slots, the same class with a __dict__, and the
+__signalers__ dictionary that is used when a descriptor does not know its attribute name.
+
+Run:
+
+    python -m benchmarks.bench_slots
+"""
+from __future__ import print_function
+
+import timeit
+import tracemalloc
+
+from event_signal import signaler_property, signaler_slots
+
+
+COUNT = 5000
+NUMBER = 20000
+FIELDS = ['f{}'.format(i) for i in range(10)]
+
+
+def observed_field(name):
+    """Return a signaler_property that stores the value in the '_' + name attribute."""
+    attr = '_' + name
+
+    def fget(self):
+        return getattr(self, attr)
+
+    def fset(self, value):
+        setattr(self, attr, value)
+
+    return signaler_property(fget, fset)
+
+
+def make_class(name, slots=None, named=True):
+    """Create a model class with 10 observed fields."""
+    attrs = {'__init__': lambda self: [setattr(self, '_' + field, 0) for field in FIELDS] and None}
+    if slots is not None:
+        attrs['__slots__'] = slots
+    for field in FIELDS:
+        attrs[field] = observed_field(field)
+    cls = type(name, (object,), attrs)
+    if not named:
+        for field in FIELDS:
+            cls.__dict__[field].storage_name = None
+    return cls
+
+
+SlotsModel = make_class('SlotsModel', tuple('_' + field for field in FIELDS) + signaler_slots(*FIELDS))
+DictModel = make_class('DictModel')
+SignalersModel = make_class('SignalersModel', named=False)
+
+
+def set_all(obj, value):
+    for field in FIELDS:
+        setattr(obj, field, value)
+
+
+def bench(cls):
+    """Return the bytes per object after every field was set and the nanoseconds to set all fields."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = [cls() for _ in range(COUNT)]
+        for obj in objects:
+            set_all(obj, 1)
+        size = (tracemalloc.get_traced_memory()[0] - before) / COUNT
+    finally:
+        tracemalloc.stop()
+
+    obj = objects[0]
+    values = iter(range(10 ** 9))
+    seconds = min(timeit.repeat(lambda: set_all(obj, next(values)), number=NUMBER, repeat=5))
+    return size, seconds / NUMBER * 1e9
+
+
+def main():
+    for cls in (SlotsModel, DictModel, SignalersModel):
+        size, ns = bench(cls)
+        print("{:<15} {:>6.0f} bytes per object  {:>7.0f} ns to set 10 fields".format(cls.__name__, size, ns))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark firing a signal from multiple threads while another thread connects and disconnects callback functions.
+
+Firing reads the precompiled dispatch function without a lock. Connecting and disconnecting take the SIGNAL_LOCK and
+the next fire compiles a new dispatch function. Run it with a free-threaded CPython build (python3.13t) to measure
+without the GIL.
+
+Run:
+
+    python -m benchmarks.bench_threads
+"""
+from __future__ import print_function
+
+import sys
+import threading
+import time
+
+from event_signal import Signal
+
+
+SECONDS = 0.5
+
+
+class Model(object):
+    changed = Signal(int)
+
+
+def listener(value):
+    pass
+
+
+def bench(fire_threads, mutate):
+    """Return the number of fires and connection changes per second."""
+    model = Model()
+    model.changed.connect(listener)
+    stop = threading.Event()
+    fires = [0] * fire_threads
+    changes = [0]
+
+    def fire(i):
+        emit = model.changed.emit
+        count = 0
+        while not stop.is_set():
+            for _ in range(100):
+                emit(1)
+            count += 100
+        fires[i] = count
+
+    def mutator():
+        connect = model.changed.connect
+        disconnect = model.changed.disconnect
+        count = 0
+        while not stop.is_set():
+            func = lambda value: None
+            connect(func)
+            disconnect(func)
+            count += 1
+        changes[0] = count
+
+    threads = [threading.Thread(target=fire, args=(i,)) for i in range(fire_threads)]
+    if mutate:
+        threads.append(threading.Thread(target=mutator))
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(SECONDS)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - start
+    return sum(fires) / seconds, changes[0] / seconds
+
+
+def main():
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)
+    print("Python {} GIL {}".format(sys.version.split()[0], "enabled" if is_gil_enabled() else "disabled"))
+    for fire_threads in (1, 2, 4, 8):
+        for mutate in (False, True):
+            fires, changes = bench(fire_threads, mutate)
+            print("{} fire threads{:<12} {:>12,.0f} fires/sec {:>10,.0f} connect+disconnect/sec".format(
+                fire_threads, " + mutator" if mutate else "", fires, changes))
+
+
+if __name__ == '__main__':
+    main()
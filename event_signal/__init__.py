@@ -1,11 +1,25 @@
-from .interface import SignalError, get_signal, on_signal, off_signal, fire_signal, block_signals, add_signal, \
-    copy_signals, copy_signals_as_bound, SignalerInstance
+from .interface import SignalError, get_signal, on_signal, off_signal, fire_signal, fire_signal_async, block_signals, \
+    blocked, batch, is_blocked, add_signal, copy_signals, copy_signals_as_bound, SignalerInstance, signaler_slots
+from .rate_limit import Throttle, Debounce, rate_limit, get_scheduler, set_scheduler, ThreadScheduler, \
+    AsyncioScheduler, ManualScheduler
+from .executor import ExecutorCallback, submit_callbacks
+from .queued import Dispatcher, get_dispatcher, process_events, QueuedCallback
 from .signaler import signaler
-from .signaler_prop import signaler_property, SignalerPropertyInstance
-from .method_observer_metaclass import MethodObserver, MethodObserverMeta
+from .signaler_prop import signaler_property, SignalerPropertyBase, SignalerPropertyInstance, update
+from .shared import shared_property, SharedState, share_state, get_shared_state
+from .method_observer_metaclass import MethodObserver, MethodObserverMeta, observable
 
 from .signal_qt import Signal
+from .remote import RemoteSignal, SignalBridge
 
 from .binder import is_property, is_signaler_property, get_signaler, bind_signals, unbind_signals, bind, unbind
 
 from .qt_binder import get_qt_signal_name, connect_qt, bind_qt, unbind_qt, qt_override_block_signals
+
+
+def __getattr__(name):
+    """Import ObservableArray when it is first used, so importing event_signal does not import numpy."""
+    if name == 'ObservableArray':
+        from .observable_array import ObservableArray
+        return ObservableArray
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
@@ -2,6 +2,7 @@
 from .interface import SignalerInstance
 from .signaler_prop import signaler_property
 from .signaler import signaler
+from .method_observer_metaclass import LazyMethod
 
 
 __all__ = ["is_property", "is_signaler_property", "get_signaler", "bind_signals", "unbind_signals", "bind", "unbind",
@@ -40,6 +41,7 @@ def get_signaler(obj, property_name):
             prop = getattr(obj.__class__, property_name)
             sig = signaler_property(fget=prop.fget, fset=prop.fset, fdel=prop.fdel)
             setattr(obj.__class__, property_name, sig)
+            sig.__set_name__(obj.__class__, property_name)
 
         prop = getattr(obj.__class__, property_name)
         return prop.get_signaler_instance(obj)
@@ -60,6 +62,8 @@ def get_signaler(obj, property_name):
 
     # Force the setter to be a SignalerInstance (Signal, signaler, signaler_property)
     setter = getattr(obj, setter_name)
+    if isinstance(setter, LazyMethod):
+        setter = setter.observe()  # MethodObserver method that was not observed yet
     if not isinstance(setter, SignalerInstance):
         sig = None
 
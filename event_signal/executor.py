@@ -0,0 +1,109 @@
+"""
+Call callback functions in a `concurrent.futures` executor, so slow callback functions do not block the thread that
+fires the signal.
+
+Example:
+
+    .. code-block:: python
+
+        pool = ThreadPoolExecutor(4)
+
+        class Model(object):
+            changed = Signal(object, executor=pool)  # emit returns a list of futures
+
+            @signaler(executor=pool)  # The 'change' callbacks run in the pool
+            def set_x(self, value):
+                self._x = value
+
+        model = Model()
+        model.changed.connect(save_to_disk)
+        futures = model.changed.emit(1)
+
+        model.set_x.on("change", print)
+        model.set_x.on("before_change", upload, executor=pool)  # Run a single callback in the pool
+"""
+import traceback
+
+from .interface import CallbackWrapper, callback_key, bind_instance
+
+
+__all__ = ['ExecutorCallback', 'uses_executor', 'submit_callbacks']
+
+
+def report_error(future):
+    """Print the error of a callback function that nobody waits for."""
+    if not future.cancelled() and future.exception() is not None:
+        exc = future.exception()
+        traceback.print_exception(type(exc), exc, exc.__traceback__)
+
+
+class ExecutorCallback(CallbackWrapper):
+    """Callback function that is submitted to an executor when it is called. Calling it returns the future.
+
+    Errors are printed, because the thread that fired the signal does not wait for the result.
+    """
+    __slots__ = ('callback', 'key', 'executor')
+
+    returns_future = True
+
+    def __init__(self, callback, executor):
+        """Initialize the executor callback.
+
+        Args:
+            callback (callable): Callback function to call in the executor.
+            executor (concurrent.futures.Executor): Executor that calls the callback function.
+        """
+        self.callback = callback
+        self.key = callback_key(callback)
+        self.executor = executor
+
+    @property
+    def func(self):
+        """Return the wrapped callback function."""
+        if isinstance(self.callback, CallbackWrapper):
+            return self.callback.func
+        return self.callback
+
+    def __call__(self, *args, **kwargs):
+        future = self.executor.submit(self.callback, *args, **kwargs)
+        future.add_done_callback(report_error)
+        return future
+
+    def __get__(self, instance, owner=None):
+        """Return an executor callback with the callback function bound to the instance."""
+        if instance is None:
+            return self
+        return self.__class__(bind_instance(self.callback, instance), self.executor)
+
+    def __repr__(self):
+        return '<{} {!r} {!r}>'.format(self.__class__.__name__, self.callback, self.executor)
+
+
+def uses_executor(func):
+    """Return if the callback function submits itself to an executor (an ExecutorCallback that may be wrapped)."""
+    while isinstance(func, CallbackWrapper):
+        if isinstance(func, ExecutorCallback):
+            return True
+        func = getattr(func, 'callback', None)
+    return False
+
+
+def submit_callbacks(executor, callers, args=(), kwargs=None):
+    """Submit every callback function to the executor and return the list of futures. Errors are printed.
+
+    Callback functions that were connected with their own executor (ExecutorCallback) are submitted to that executor.
+    Wrappers of an ExecutorCallback (like a Throttle) are called directly, so the callback is only submitted once.
+    """
+    if kwargs is None:
+        kwargs = {}
+    futures = []
+    for func in callers:
+        if isinstance(func, ExecutorCallback):
+            futures.append(func(*args, **kwargs))
+        elif uses_executor(func):
+            func(*args, **kwargs)
+        else:
+            future = executor.submit(func, *args, **kwargs)
+            future.add_done_callback(report_error)
+            futures.append(future)
+    return futures
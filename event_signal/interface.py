@@ -1,23 +1,551 @@
+import contextlib
+import functools
+import inspect
+import itertools
+import threading
+import types
+import weakref
+from collections import OrderedDict
 from future.utils import raise_from
 
 
 __all__ = ['SignalError', "get_signal", "on_signal", "off_signal", "fire_signal", "block_signals", "add_signal",
-           "copy_signals", "copy_signals_as_bound", 'SignalerInstance', 'SignalerDescriptorInstance']
+           "copy_signals", "copy_signals_as_bound", "fire_signal_async", "get_callers",
+           'SignalerInstance', 'SignalerDescriptorInstance',
+           'blocked', 'is_blocked', 'callback_key', 'CallbackWrapper', 'WeakCallback', 'CallbackSet', 'get_callbacks',
+           'weak_bound_signaler',
+           'SIGNAL_SLOTS', 'SIGNAL_NAMES', 'signal_slot', 'register_signal', 'SignalTable',
+           'BEFORE_CHANGE', 'CHANGE', 'BEFORE_DELETE', 'DELETE', 'CHANGED_FIELDS', 'SIGNALER_SLOTS',
+           'fire_nothing', 'compile_dispatch', 'update_dispatch', 'invalidate_dispatch', 'get_dispatch',
+           'bind_instance', 'instance_caller', 'compile_bound_dispatch', 'get_bound_dispatch',
+           'get_bound_dispatch_table',
+           'BOUND_SIGNALER_SLOTS', 'BoundSignalerInstance', 'signaler_slot_name', 'signaler_slots',
+           'BatchState', 'BATCH_STATE', 'deferred_key', 'get_deferred', 'defer_signal', 'batch', 'SIGNAL_LOCK']
 
 
 class SignalError(ValueError):
     pass
 
 
-def get_signal(obj, signal_type):
-    """Return a list of callback functions that are connected to the signal."""
+SIGNAL_LOCK = threading.RLock()
+"""Lock for connecting, disconnecting, and blocking callback functions.
+
+Changing the callback functions takes this lock and builds a new immutable snapshot and dispatch function. Firing a
+signal only reads the precompiled dispatch function and never takes the lock (only to compile a missing dispatch).
+"""
+
+
+SIGNAL_SLOTS = {}
+"""Global registry of signal names to integer slots."""
+
+SIGNAL_NAMES = []
+"""Signal names in slot order."""
+
+
+def signal_slot(signal_type):
+    """Return the integer slot for a registered signal name or None if the signal name is not registered."""
+    return SIGNAL_SLOTS.get(signal_type, None)
+
+
+def register_signal(signal_type):
+    """Register a signal name and return its integer slot.
+
+    SignalTables that are created after a signal name is registered store that signal in their fixed size list.
+    """
+    try:
+        return SIGNAL_SLOTS[signal_type]
+    except KeyError:
+        slot = SIGNAL_SLOTS[signal_type] = len(SIGNAL_NAMES)
+        SIGNAL_NAMES.append(signal_type)
+        return slot
+
+
+BEFORE_CHANGE = register_signal("before_change")
+CHANGE = register_signal("change")
+BEFORE_DELETE = register_signal("before_delete")
+DELETE = register_signal("delete")
+CHANGED_FIELDS = register_signal("changed_fields")
+
+
+class SignalTable(object):
+    """Mapping of signal names to values that is used for a SignalerInstance's event_signals and event_dispatch.
+
+    Registered signal names are stored by slot in the fixed size `builtin` list. Custom signal names are stored in
+    the `custom` dict, which is only created when needed. Signalers access their built-in signals directly with
+    `table.builtin[CHANGE]`, which is None if the value does not exist.
+
+    An object's `event_signals` table is linked to its `event_dispatch` table. Setting or removing a signal's callback
+    functions removes the precompiled dispatch function of that signal from the linked table.
+    """
+    __slots__ = ('builtin', 'custom', 'linked')
+
+    def __init__(self, items=None, linked=None):
+        self.builtin = [None] * len(SIGNAL_NAMES)
+        self.custom = None
+        self.linked = linked
+        if items:
+            for key, value in dict(items).items():
+                self[key] = value
+
+    def __getitem__(self, signal_type):
+        try:
+            value = self.builtin[SIGNAL_SLOTS[signal_type]]
+        except (KeyError, IndexError):
+            if self.custom is None:
+                raise KeyError(signal_type)
+            return self.custom[signal_type]
+        if value is None:
+            raise KeyError(signal_type)
+        return value
+
+    def __setitem__(self, signal_type, value):
+        if isinstance(value, CallbackSet):
+            value.table = (self, signal_type)  # append() and remove() remove the precompiled dispatch function
+        try:
+            self.builtin[SIGNAL_SLOTS[signal_type]] = value
+        except (KeyError, IndexError):
+            if self.custom is None:
+                self.custom = {}
+            self.custom[signal_type] = value
+        if self.linked is not None:
+            self.linked.pop(signal_type, None)
+
+    def __delitem__(self, signal_type):
+        if self.pop(signal_type, None) is None:
+            raise KeyError(signal_type)
+
+    def get(self, signal_type, default=None):
+        try:
+            return self[signal_type]
+        except KeyError:
+            return default
+
+    def pop(self, signal_type, *default):
+        try:
+            slot = SIGNAL_SLOTS[signal_type]
+            value = self.builtin[slot]
+            self.builtin[slot] = None
+        except (KeyError, IndexError):
+            if self.custom is None:
+                value = None
+            else:
+                value = self.custom.pop(signal_type, None)
+        if value is None:
+            if default:
+                return default[0]
+            raise KeyError(signal_type)
+        if self.linked is not None:
+            self.linked.pop(signal_type, None)
+        return value
+
+    def __contains__(self, signal_type):
+        return self.get(signal_type, None) is not None
+
+    def keys(self):
+        keys = [SIGNAL_NAMES[slot] for slot, value in enumerate(self.builtin) if value is not None]
+        if self.custom:
+            keys.extend(self.custom)
+        return keys
+
+    def values(self):
+        return [self[key] for key in self.keys()]
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __eq__(self, other):
+        try:
+            return dict(self.items()) == dict(other.items())
+        except AttributeError:
+            return NotImplemented
+
+    def __ne__(self, other):
+        eq = self.__eq__(other)
+        if eq is NotImplemented:
+            return eq
+        return not eq
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, dict(self.items()))
+
+
+def callback_key(func):
+    """Return the identity key for a callback function.
+
+    Bound methods and signalers are created every time they are accessed, so they are identified by their instance and
+    function.
+    """
+    if isinstance(func, types.MethodType):
+        return id(func.__self__), id(func.__func__)
+    elif isinstance(func, BoundSignalerInstance):
+        # Same key as the method that the signaler observes (a MethodObserver method can become a signaler)
+        descriptor = func.descriptor
+        return id(func.instance), id(getattr(descriptor, 'func', None) or descriptor)
+    elif isinstance(func, types.BuiltinMethodType) and not isinstance(func.__self__, types.ModuleType):
+        return id(func.__self__), func.__name__
+    elif isinstance(func, CallbackWrapper):
+        return func.key
+
     try:
-        # Get the blocked functions not the temporary fake signal type used when blocked
-        if "blocked-" + signal_type in obj.event_signals:
-            sig = obj.event_signals["blocked-" + signal_type]
+        # Method like objects that are created for every access (like a MethodObserver's LazyMethod)
+        return id(func.__self__), id(func.__func__)
+    except AttributeError:
+        return id(func)
+
+
+def weak_bound_signaler(sig, callback=None):
+    """Return a function that returns the object's signaler or None if the object was deleted (like WeakMethod).
+
+    Args:
+        sig (BoundSignalerInstance): Signaler of an object that is created every time it is accessed.
+        callback (callable)[None]: Called with the weak reference when the object is deleted.
+    """
+    descriptor = sig.descriptor
+    instance_ref = weakref.ref(sig.instance, callback)
+
+    def ref():
+        instance = instance_ref()
+        if instance is None:
+            return None
+        return descriptor.get_signaler_instance(instance)
+    return ref
+
+
+class CallbackWrapper(object):
+    """Base class for callable objects that wrap a callback function (like WeakCallback).
+
+    A wrapper has the `key` of the callback function that it wraps, so disconnecting the original callback function
+    removes the wrapper. The `func` property returns the wrapped callback function.
+    """
+    __slots__ = ()
+
+    per_instance = False  # The wrapper keeps state for every object that it is bound to (like a Throttle)
+    returns_future = False  # Calling the wrapper returns a future (like an ExecutorCallback)
+
+    @property
+    def func(self):
+        """Return the wrapped callback function."""
+        raise NotImplementedError
+
+
+class WeakCallback(CallbackWrapper):
+    """Callback function that only keeps a weak reference to the function that it calls.
+
+    Bound methods use a `weakref.WeakMethod`, so the callback does not keep the method's instance alive. When the
+    function is deleted the WeakCallback removes itself from the signal. A dead WeakCallback that is still called
+    while a signal is firing removes itself and does nothing.
+    """
+    __slots__ = ('ref', 'key', 'owner', 'signal_type', '__weakref__')
+
+    def __init__(self, func, owner=None, signal_type=None):
+        """Initialize the weak callback.
+
+        Args:
+            func (callable): Callback function to keep a weak reference to.
+            owner (object)[None]: Object that has the signal that this callback is connected to.
+            signal_type (str)[None]: Signal name that this callback is connected to.
+
+        Raises:
+            TypeError: If a weak reference cannot be created for the function.
+        """
+        self.key = callback_key(func)
+        self.signal_type = signal_type
+        self.owner = None
+        if owner is not None:
+            try:
+                self.owner = weakref.ref(owner)
+            except TypeError:
+                self.owner = lambda: owner
+
+        # Do not keep this object alive from the weakref callback
+        self_ref = weakref.ref(self)
+
+        def removed(ref):
+            callback = self_ref()
+            if callback is not None:
+                callback.prune()
+
+        if isinstance(func, types.MethodType):
+            self.ref = weakref.WeakMethod(func, removed)
+        elif isinstance(func, BoundSignalerInstance):
+            self.ref = weak_bound_signaler(func, removed)
         else:
+            self.ref = weakref.ref(func, removed)
+
+    @property
+    def func(self):
+        """Return the callback function or None if it was deleted."""
+        return self.ref()
+
+    def prune(self):
+        """Remove this callback from the signal that it is connected to."""
+        owner = self.owner() if self.owner is not None else None
+        if owner is not None:
+            with SIGNAL_LOCK:
+                try:
+                    if owner.event_signals[self.signal_type].remove_item(self):
+                        invalidate_dispatch(owner, self.signal_type)
+                except (KeyError, AttributeError):
+                    pass
+
+    def __call__(self, *args, **kwargs):
+        func = self.ref()
+        if func is None:
+            self.prune()
+            return None
+        return func(*args, **kwargs)
+
+    def __repr__(self):
+        return '<{} {!r}>'.format(self.__class__.__name__, self.ref())
+
+
+class CallbackSet(object):
+    """Insertion ordered set of callback functions that is indexed by identity.
+
+    Adding, removing, and checking if a callback function exists are O(1). Iterating uses an immutable snapshot tuple,
+    so callback functions can be added or removed while iterating. Changes take the SIGNAL_LOCK, so callback functions
+    can be added and removed from multiple threads.
+
+    `append` and `remove` work like the list that used to store the callback functions. They also remove the
+    precompiled dispatch function of the SignalTable that stores this set. A signal without callback functions stores
+    an empty tuple until the first callback function is connected (see `on_signal`).
+    """
+    __slots__ = ('_funcs', '_snapshot', 'table')
+    __hash__ = None
+
+    def __init__(self, funcs=()):
+        self._funcs = {}
+        self._snapshot = None
+        self.table = None  # (SignalTable, signal_type) that stores this set
+        for func in funcs:
+            self.add(func)
+
+    @property
+    def snapshot(self):
+        """Return an immutable tuple of the callback functions in the order they were added."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            with SIGNAL_LOCK:
+                snapshot = self._snapshot = tuple(self._funcs.values())
+        return snapshot
+
+    def add(self, func):
+        """Add the callback function. Return True if it was added or False if it already existed."""
+        key = callback_key(func)
+        with SIGNAL_LOCK:
+            existing = self._funcs.get(key, None)
+            if existing is not None and not (isinstance(existing, WeakCallback) and existing.ref() is None):
+                return False
+            self._funcs[key] = func
+            self._snapshot = None
+        return True
+
+    def discard(self, func):
+        """Remove the callback function. Return True if it existed."""
+        with SIGNAL_LOCK:
+            try:
+                del self._funcs[callback_key(func)]
+            except KeyError:
+                return False
+            self._snapshot = None
+        return True
+
+    def remove_item(self, item):
+        """Remove the exact item that is stored (like a WeakCallback). Return True if it was removed.
+
+        The item is also removed when it is the callback of the stored CallbackWrapper.
+        """
+        with SIGNAL_LOCK:
+            stored = self._funcs.get(item.key, None)
+            if stored is not item and (stored is None or getattr(stored, 'callback', None) is not item):
+                return False
+            del self._funcs[item.key]
+            self._snapshot = None
+        return True
+
+    def append(self, func):
+        """Add the callback function like `list.append`. A callback function that already exists is not added."""
+        if self.add(func):
+            self.changed()
+
+    def remove(self, func):
+        """Remove the callback function like `list.remove`.
+
+        Raises:
+            ValueError: If the callback function does not exist.
+        """
+        if not self.discard(func):
+            raise ValueError('{!r} is not a callback function of this signal'.format(func))
+        self.changed()
+
+    def changed(self):
+        """Remove the precompiled dispatch function of the signal that stores this set."""
+        table = self.table
+        if table is not None and table[0].linked is not None:
+            table[0].linked.pop(table[1], None)
+
+    def clear(self):
+        """Remove all of the callback functions."""
+        with SIGNAL_LOCK:
+            self._funcs = {}
+            self._snapshot = None
+
+    def copy(self):
+        """Return a copy of this CallbackSet."""
+        return self.__class__(self.snapshot)
+
+    def __contains__(self, func):
+        return callback_key(func) in self._funcs
+
+    def __iter__(self):
+        return iter(self.snapshot)
+
+    def __len__(self):
+        return len(self._funcs)
+
+    def __getitem__(self, index):
+        return self.snapshot[index]
+
+    def __eq__(self, other):
+        if isinstance(other, CallbackSet):
+            other = other.snapshot
+        try:
+            return self.snapshot == tuple(other)
+        except TypeError:
+            return NotImplemented
+
+    def __ne__(self, other):
+        eq = self.__eq__(other)
+        if eq is NotImplemented:
+            return eq
+        return not eq
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, list(self.snapshot))
+
+
+def get_callbacks(obj, signal_type):
+    """Return the CallbackSet for the signal. Sequences of callbacks are converted to a CallbackSet.
+
+    Raises:
+        KeyError: If the signal does not exist.
+        AttributeError: If the object does not have any signals.
+    """
+    sig = obj.event_signals[signal_type]
+    if not isinstance(sig, CallbackSet):
+        with SIGNAL_LOCK:
             sig = obj.event_signals[signal_type]
-        return [func for func in sig]
+            if not isinstance(sig, CallbackSet):
+                sig = obj.event_signals[signal_type] = CallbackSet(sig)
+    return sig
+
+
+def fire_nothing(*args, **kwargs):
+    """Dispatch function for a signal that does not have any callback functions to call."""
+    pass
+
+
+def compile_dispatch(funcs):
+    """Return a single callable that calls all of the given callback functions in order.
+
+    The returned dispatch function is specialised for the number of callbacks. No callbacks returns `fire_nothing`, a
+    single callback is returned as is, and multiple callbacks are called from an immutable tuple. Callback wrappers
+    that return a future (see `returns_future`) are called by a dispatch function that returns the list of futures
+    and has a true `returns_future` attribute.
+    """
+    funcs = tuple(funcs)
+    length = len(funcs)
+    if any(getattr(func, 'returns_future', False) for func in funcs):
+        flags = tuple(getattr(func, 'returns_future', False) for func in funcs)
+
+        def fire_all_futures(*args, **kwargs):
+            futures = []
+            for func, returns_future in zip(funcs, flags):
+                result = func(*args, **kwargs)
+                if returns_future:
+                    futures.append(result)
+            return futures
+        fire_all_futures.returns_future = True
+        return fire_all_futures
+    elif length == 0:
+        return fire_nothing
+    elif length == 1:
+        return funcs[0]
+
+    def fire_all(*args, **kwargs):
+        for func in funcs:
+            func(*args, **kwargs)
+    return fire_all
+
+
+def update_dispatch(obj, signal_type):
+    """Rebuild and return the precompiled dispatch function for the signal.
+
+    This is called whenever the signal is blocked or unblocked and when the signal fires after the callback functions
+    changed (see `invalidate_dispatch`). A blocked signal dispatches to `fire_nothing`.
+
+    The dispatch function is compiled with the SIGNAL_LOCK, so it is never built from callback functions that were
+    changed while it was compiling.
+    """
+    with SIGNAL_LOCK:
+        try:
+            dispatch = compile_dispatch(obj.event_signals[signal_type])
+            if is_blocked(obj, signal_type):
+                dispatch = fire_nothing
+        except (KeyError, AttributeError, TypeError) as error:
+            err = SignalError("Invalid 'signal_type' given ({:s}). Cannot connect a function to this "
+                              "signal.".format(repr(signal_type)))
+            raise_from(err, error)
+            # raise err from error
+
+        try:
+            obj.event_dispatch[signal_type] = dispatch
+        except AttributeError:
+            obj.event_dispatch = SignalTable({signal_type: dispatch})
+            signals = obj.event_signals
+            if type(signals) is SignalTable and signals.linked is None:
+                signals.linked = obj.event_dispatch
+    return dispatch
+
+
+def invalidate_dispatch(obj, signal_type):
+    """Remove the precompiled dispatch function for the signal, so it is rebuilt the next time the signal fires."""
+    try:
+        obj.event_dispatch.pop(signal_type, None)
+    except AttributeError:
+        pass
+    bound_dispatch = getattr(obj, 'event_bound_dispatch', None)
+    if bound_dispatch is not None:
+        bound_dispatch.pop(signal_type, None)
+
+
+def get_dispatch(obj, signal_type):
+    """Return the precompiled dispatch function that calls all of the callback functions for a signal."""
+    try:
+        return obj.event_dispatch[signal_type]
+    except (KeyError, AttributeError):
+        return update_dispatch(obj, signal_type)
+
+
+def get_signal(obj, signal_type):
+    """Return a list of callback functions that are connected to the signal.
+
+    Weak callbacks return the function that they reference. Weak callbacks that were deleted are not returned.
+    """
+    try:
+        sig = obj.event_signals[signal_type]
+        if isinstance(sig, CallbackSet):
+            sig = sig.snapshot
+        funcs = [func.func if isinstance(func, CallbackWrapper) else func for func in sig]
+        return [func for func in funcs if func is not None]
     except (KeyError, AttributeError) as error:
         err = SignalError("Invalid 'signal_type' given ({:s}). Cannot connect a function to this "
                           "signal.".format(repr(signal_type)))
@@ -25,74 +553,230 @@ def get_signal(obj, signal_type):
         # raise err from error
 
 
-def on_signal(obj, signal_type, func):
-    """Connect a callback function to a signal."""
-    try:
-        # Connect to the blocked functions not the temporary fake signal type used when blocked
-        if "blocked-" + signal_type in obj.event_signals:
-            sig = obj.event_signals["blocked-" + signal_type]
-        else:
-            sig = obj.event_signals[signal_type]
-        if func not in sig:
-            sig.append(func)
-    except (KeyError, AttributeError):
-        if not hasattr(obj, "event_signals"):
-            obj.event_signals = {}
-        obj.event_signals[signal_type] = [func]
+def on_signal(obj, signal_type, func, weak=False, throttle=None, debounce=None, executor=None, dispatcher=None,
+              coalesce=False):
+    """Connect a callback function to a signal.
+
+    Callback functions are stored in an ordered CallbackSet, so connecting is O(1). A signal that is currently firing
+    will finish calling the callback functions that were connected when the fire started.
+
+    Args:
+        obj (object): Object that has the signal.
+        signal_type (str): Signal name to direct which signal to use
+        func (callable): Callback function
+        weak (bool)[False]: Only keep a weak reference to the callback function (see WeakCallback). The callback is
+            removed when the function (or the instance of a bound method) is deleted.
+        throttle (float)[None]: Call the callback function at most once every throttle seconds (see Throttle).
+        debounce (float)[None]: Call the callback function after the signal did not fire for debounce seconds
+            (see Debounce).
+        executor (concurrent.futures.Executor)[None]: Submit the callback function to this executor instead of
+            calling it in the thread that fires the signal (see ExecutorCallback).
+        dispatcher (Dispatcher/threading.Thread/bool)[None]: Call the callback function in the dispatcher's thread.
+            Signals that fire in other threads are queued until the thread calls `process_events()` (see
+            QueuedCallback). True uses the current thread's dispatcher.
+        coalesce (bool)[False]: Only keep the latest queued call of a dispatcher connection.
+    """
+    if isinstance(obj, BoundSignalerInstance):
+        obj = obj.own_signals()  # Only change the callback functions of this object
+    if weak:
+        func = WeakCallback(func, obj, signal_type)
+    if executor is not None:
+        from .executor import ExecutorCallback
+        func = ExecutorCallback(func, executor)
+    if dispatcher is not None and dispatcher is not False:
+        from .queued import QueuedCallback
+        func = QueuedCallback(func, dispatcher, coalesce=coalesce)
+    if throttle is not None or debounce is not None:
+        from .rate_limit import rate_limit
+        func = rate_limit(func, throttle=throttle, debounce=debounce)
+
+    with SIGNAL_LOCK:
+        try:
+            sig = get_callbacks(obj, signal_type)
+        except (KeyError, AttributeError):
+            if not hasattr(obj, "event_signals"):
+                obj.event_signals = SignalTable(linked=getattr(obj, 'event_dispatch', None))
+            sig = obj.event_signals[signal_type] = CallbackSet()
+        if sig.add(func):
+            invalidate_dispatch(obj, signal_type)
 
 
 def off_signal(obj, signal_type, func):
-    """Disconnect a callback function from a signal."""
-    try:
-        # Disconnect from blocked functions not the temporary fake signal type used when blocked
-        if "blocked-" + signal_type in obj.event_signals:
-            sig = obj.event_signals["blocked-" + signal_type]
-        else:
-            sig = obj.event_signals[signal_type]
+    """Disconnect a callback function from a signal.
+
+    Callback functions are stored in an ordered CallbackSet, so disconnecting is O(1). A signal that is currently firing
+    will finish calling the callback functions that were connected when the fire started.
+    """
+    if isinstance(obj, BoundSignalerInstance):
+        obj = obj.own_signals()  # Only change the callback functions of this object
+
+    with SIGNAL_LOCK:
+        try:
+            sig = get_callbacks(obj, signal_type)
+        except (KeyError, AttributeError):
+            return False
+
         if func is None:
             existed = len(sig) > 0
-            try:
-                sig.clear()
-            except AttributeError:
-                del sig[:]  # Python 2.7
+            sig.clear()
         else:
-            existed = func in sig
-            try:
-                sig.remove(func)
-            except:
-                pass
-        return existed
-    except (KeyError, AttributeError):
-        return False
+            existed = sig.discard(func)
+        if existed:
+            invalidate_dispatch(obj, signal_type)
+    return existed
 
 
 def fire_signal(obj, signal_type, *args, **kwargs):
-    """Call all fo the callback functions for a signal."""
+    """Call all fo the callback functions for a signal.
+
+    Callback functions that are connected or disconnected while the signal is firing do not change the current fire.
+
+    The precompiled dispatch function is only used if the object's `event_signals` is a SignalTable that is linked to
+    the `event_dispatch` table. Other containers (like a dict of lists) can be changed directly, so their callback
+    functions are read every time the signal fires.
+    """
+    signals = getattr(obj, 'event_signals', None)
+    if type(signals) is not SignalTable or signals.linked is None:
+        for func in get_callers(obj, signal_type):
+            func(*args, **kwargs)
+        return
+
+    try:
+        dispatch = obj.event_dispatch[signal_type]
+    except (KeyError, AttributeError):
+        dispatch = update_dispatch(obj, signal_type)
+    dispatch(*args, **kwargs)
+
+
+def get_callers(obj, signal_type):
+    """Return a tuple of the callback functions that are called when the signal fires. A blocked signal returns ()."""
     try:
         sig = obj.event_signals[signal_type]
     except (KeyError, AttributeError) as error:
-        sig = []
         err = SignalError("Invalid 'signal_type' given ({:s}). Cannot connect a function to this "
                           "signal.".format(repr(signal_type)))
         raise_from(err, error)
         # raise err from error
+    if is_blocked(obj, signal_type):
+        return ()
+    elif isinstance(sig, CallbackSet):
+        return sig.snapshot
+    return tuple(sig)
+
+
+async def call_async(callers, args=(), kwargs=None, concurrent=True, limit=None):
+    """Call the callback functions and await the callback functions that return an awaitable (async def).
+
+    Regular callback functions are called inline in order. Coroutine callback functions are run concurrently with
+    `asyncio.gather` after every callback function was called.
+
+    Args:
+        callers (tuple): Callback functions to call.
+        args (tuple)[()]: Arguments to pass to the callback functions.
+        kwargs (dict)[None]: Named arguments to pass to the callback functions.
+        concurrent (bool)[True]: If False await each coroutine before the next callback function is called.
+        limit (int)[None]: Maximum number of coroutines that run at the same time.
+
+    Raises:
+        ValueError: If the limit is less than 1.
+    """
+    import asyncio
+
+    if limit is not None and limit < 1:
+        raise ValueError("limit must be at least 1, not {!r}".format(limit))
+    if kwargs is None:
+        kwargs = {}
+
+    if not concurrent:
+        for func in callers:
+            result = func(*args, **kwargs)
+            if inspect.isawaitable(result):
+                await result
+        return
+
+    awaitables = []
+    try:
+        for func in callers:
+            result = func(*args, **kwargs)
+            if inspect.isawaitable(result):
+                awaitables.append(result)
+    except BaseException:
+        for result in awaitables:
+            if inspect.iscoroutine(result):
+                result.close()  # Never awaited
+        raise
+
+    if not awaitables:
+        return
+    elif limit is not None and limit < len(awaitables):
+        semaphore = asyncio.Semaphore(limit)
+
+        async def limited(awaitable):
+            async with semaphore:
+                return await awaitable
+        awaitables = [limited(awaitable) for awaitable in awaitables]
+    elif len(awaitables) == 1:
+        await awaitables[0]
+        return
+    await asyncio.gather(*awaitables)
+
+
+def fire_signal_async(obj, signal_type, *args, concurrent=True, limit=None, **kwargs):
+    """Return a coroutine that calls all of the callback functions for a signal and awaits the coroutine callbacks.
+
+    The callback functions are collected when this function is called, so blocking the signal afterwards does not
+    change this fire.
+
+    Example:
+
+        .. code-block:: python
+
+            async def save(value):
+                await db.write(value)
 
-    for func in sig:
-        func(*args, **kwargs)
+            on_signal(obj, "change", save)
+            await fire_signal_async(obj, "change", 1, limit=10)
+
+    Args:
+        obj (object): Object with signals.
+        signal_type (str): Signal name to direct which signal to use
+        *args: Arguments to pass to the callback functions
+        concurrent (bool)[True]: If False await each coroutine callback before the next callback function is called.
+        limit (int)[None]: Maximum number of coroutine callbacks that run at the same time.
+        **kwargs: Named arguments to pass to the callback functions
+    """
+    return call_async(get_callers(obj, signal_type), args, kwargs, concurrent=concurrent, limit=limit)
 
 
 def init_signals(obj):
     # Make sure the event signals are initialized
     if not hasattr(obj, '__signalerinstances__'):
-        obj.__signalerinstances__ = [name for name in dir(obj)
-                                     if isinstance(getattr(obj.__class__, name, None), SignalerInstance) or
-                                        isinstance(getattr(obj, name, None), SignalerInstance)]
+        # Instance signalers that are stored for a class attribute are found through the class attribute
+        cls = obj.__class__
+        storage_names = set(getattr(getattr(cls, name, None), 'storage_name', None) for name in dir(cls))
+        obj.__signalerinstances__ = [name for name in dir(obj) if name not in storage_names and
+                                     (isinstance(getattr(cls, name, None), SignalerInstance) or
+                                      isinstance(getattr(obj, name, None), SignalerInstance))]
+
+
+def is_blocked(obj, signal_type):
+    """Return if the signal is blocked."""
+    try:
+        return obj.event_blocked.get(signal_type, 0) > 0
+    except AttributeError:
+        return False
 
 
 def block_signals(obj, signal_type=None, block=True):
-    """Temporarily block signals from being called."""
+    """Temporarily block signals from being called.
+
+    Blocking is counted for each signal. A signal that was blocked multiple times stays blocked until it is unblocked
+    the same number of times.
+    """
     # Make sure the event signals are initialized
     init_signals(obj)
+    if isinstance(obj, BoundSignalerInstance):
+        obj = obj.own_signals()  # Only change the callback functions of this object
 
     # Check the signal type
     if signal_type is None:
@@ -110,23 +794,158 @@ def block_signals(obj, signal_type=None, block=True):
     elif not isinstance(signal_type, (list, tuple)):
         signal_type = [signal_type]
 
+    if not hasattr(obj, "event_blocked"):
+        with SIGNAL_LOCK:
+            if not hasattr(obj, "event_blocked"):
+                obj.event_blocked = {}
+
     # Block all of the signal types for this object
     for signal in signal_type:
-        if block:
-            if "blocked-" + signal not in obj.event_signals:
-                try:
-                    sigs = obj.event_signals[signal]
-                    if sigs:
-                        obj.event_signals[signal] = []
-                        obj.event_signals["blocked-" + signal] = sigs
-                except KeyError:
-                    pass
+        try:
+            if signal not in obj.event_signals:
+                continue
+        except AttributeError:
+            break
+
+        with SIGNAL_LOCK:
+            count = obj.event_blocked.get(signal, 0)
+            if block:
+                obj.event_blocked[signal] = count + 1
+            elif count > 1:
+                obj.event_blocked[signal] = count - 1
+            else:
+                obj.event_blocked.pop(signal, None)
+            update_dispatch(obj, signal)
+
+
+@contextlib.contextmanager
+def blocked(obj, signal_type=None):
+    """Context manager to block signals while the with block runs. Blocked contexts can be nested.
+
+    Example:
+
+        .. code-block:: python
+
+            with blocked(m.set_x, "change"):
+                m.set_x(1)  # Does not call the "change" callback functions
+
+    Args:
+        obj (object): Object with the signals to block.
+        signal_type (str)[None]: Signal name to block or None to block all signals.
+    """
+    block_signals(obj, signal_type, True)
+    try:
+        yield obj
+    finally:
+        block_signals(obj, signal_type, False)
+
+
+class BatchState(threading.local):
+    """Thread local state of the active batch contexts (see `batch`)."""
+    depth = 0
+    generation = 0
+    all_objects = 0
+    objects = None
+    pending = None
+
+
+BATCH_STATE = BatchState()
+BATCH_GENERATIONS = itertools.count(1)  # Unique number of the outermost batch in every thread
+
+
+def deferred_key(sig, signal_type):
+    """Return the key of a deferred signal. Signalers that are created for every access use their object."""
+    if isinstance(sig, BoundSignalerInstance):
+        return id(sig.descriptor), id(sig.instance), signal_type
+    return id(sig), signal_type
+
+
+def get_deferred(sig, signal_type):
+    """Return the (args, kwargs) that are deferred for the signal or None if the signal is not deferred."""
+    pending = BATCH_STATE.pending
+    if not pending:
+        return None
+    try:
+        return pending[deferred_key(sig, signal_type)][2:]
+    except KeyError:
+        return None
+
+
+def defer_signal(sig, signal_type, args, kwargs=None):
+    """Store the signal arguments until the outermost batch exits. Return True if the signal was deferred.
+
+    A deferred signal replaces the arguments that were deferred earlier for the same signaler and signal, so the
+    callback functions are only called once with the final value.
+    """
+    state = BATCH_STATE
+    if not state.depth:
+        return False
+    if not state.all_objects:
+        objects = state.objects
+        if id(sig) not in objects and id(getattr(sig, 'instance', sig)) not in objects:
+            return False
+    state.pending[deferred_key(sig, signal_type)] = (sig, signal_type, args, kwargs or {})
+    return True
+
+
+@contextlib.contextmanager
+def batch(obj=None):
+    """Context manager that defers the "change" signals until the outermost batch exits. Batches can be nested.
+
+    Every signaler and signaler_property fires its "change" signal once with the final value when the outermost batch
+    exits. The "before_change" signals are not deferred.
+
+    Example:
+
+        .. code-block:: python
+
+            with batch():
+                for record in records:
+                    m.x = record.x  # The "change" callback functions are only called once with the last x value
+
+            with batch(m):  # Only defer the signals of m
+                m.x = 1
+                m.y = 2
+
+    Args:
+        obj (object)[None]: Only defer the signals of this object (or signaler) or None to defer all signals.
+    """
+    state = BATCH_STATE
+    if state.depth == 0:
+        state.objects = {}
+        state.pending = OrderedDict()
+        state.generation = next(BATCH_GENERATIONS)
+    state.depth += 1
+    if obj is None:
+        state.all_objects += 1
+    else:
+        state.objects[id(obj)] = state.objects.get(id(obj), 0) + 1
+
+    try:
+        yield obj
+    finally:
+        if obj is None:
+            state.all_objects -= 1
+        elif state.objects[id(obj)] > 1:
+            state.objects[id(obj)] -= 1
         else:
-            try:
-                obj.event_signals[signal] = obj.event_signals["blocked-" + signal]
-                del obj.event_signals["blocked-" + signal]
-            except KeyError:
-                pass
+            del state.objects[id(obj)]
+        state.depth -= 1
+
+        if state.depth == 0:
+            pending = state.pending
+            state.objects = state.pending = None
+            for sig, signal_type, args, kwargs in pending.values():
+                if isinstance(sig, BoundSignalerInstance):
+                    # The object's current signaler. The object may have connected its own callbacks in the batch
+                    sig = sig.descriptor.get_signaler_instance(sig.instance)
+                limiter = getattr(sig, 'limiter', None) if signal_type == 'change' else None
+                if limiter is not None:
+                    limiter(*args, **kwargs)  # Rate limited 'change' signal (see signaler_property throttle)
+                elif isinstance(sig, SignalerInstance):
+                    sig.fire(signal_type, *args, **kwargs)
+                else:
+                    fire_signal(sig, signal_type, *args, **kwargs)  # Object with signals (see on_signal)
 
 
 def add_signal(obj, signal_type, assign_signal_functions=True):
@@ -162,11 +981,17 @@ def add_signal(obj, signal_type, assign_signal_functions=True):
         if not hasattr(obj, "fire"):
             obj.fire = fire_signal.__get__(obj, obj.__class__)
 
+    if isinstance(obj, BoundSignalerInstance):
+        obj = obj.own_signals()  # Only change the callback functions of this object
+
     # Add signal dictionary
+    if not hasattr(obj, "event_dispatch"):
+        obj.event_dispatch = SignalTable()
     if not hasattr(obj, "event_signals"):
-        obj.event_signals = {}
+        obj.event_signals = SignalTable(linked=obj.event_dispatch)
     if signal_type not in obj.event_signals:
-        obj.event_signals[signal_type] = []
+        obj.event_signals[signal_type] = CallbackSet()
+        invalidate_dispatch(obj, signal_type)
 
     return obj
 
@@ -183,12 +1008,16 @@ def copy_signals(old_sig, sig):
 
     # Map all of the connected callbacks as bound methods to the instance
     for key, funcs in old_sig.event_signals.items():
-        if key not in sig.event_signals:
-            sig.event_signals[key] = []
-
-        # Bind the methods and add them to the signals
-        bound_funcs = [func for func in funcs if func not in sig.event_signals[key]]
-        sig.event_signals[key] = sig.event_signals[key] + bound_funcs
+        existing = sig.event_signals.get(key, ())
+        callbacks = sig.event_signals[key] = CallbackSet(existing)
+        for func in funcs:
+            if isinstance(func, WeakCallback):
+                func = func.ref()
+                if func is not None:
+                    callbacks.add(WeakCallback(func, sig, key))
+            else:
+                callbacks.add(func)
+        invalidate_dispatch(sig, key)
 
 
 def copy_signals_as_bound(old_sig, sig, instance):
@@ -204,25 +1033,185 @@ def copy_signals_as_bound(old_sig, sig, instance):
 
     # Map all of the connected callbacks as bound methods to the instance
     for key, funcs in old_sig.event_signals.items():
-        if key not in sig.event_signals:
-            sig.event_signals[key] = []
+        existing = sig.event_signals.get(key, ())
+        callbacks = sig.event_signals[key] = CallbackSet(existing)
 
         # Bind the methods and add them to the signals
-        bound_funcs = [func.__get__(instance, instance.__class__) for func in funcs]
-        sig.event_signals[key] = sig.event_signals[key] + bound_funcs
+        for func in funcs:
+            if isinstance(func, WeakCallback):
+                func = func.ref()
+                if func is not None:
+                    callbacks.add(WeakCallback(bind_instance(func, instance), sig, key))
+            else:
+                callbacks.add(bind_instance(func, instance))
+        invalidate_dispatch(sig, key)
+
+
+def bind_instance(func, instance):
+    """Return the function bound to the instance like a method. Callables that are not descriptors are returned."""
+    try:
+        return func.__get__(instance, instance.__class__)
+    except AttributeError:
+        return func
+
+
+def instance_caller(func):
+    """Return a function that calls the func like a method of the instance that is given as the first argument."""
+    if isinstance(func, types.FunctionType):
+        return func
+    elif isinstance(func, WeakCallback):
+        def call_weak(instance, *args, **kwargs):
+            target = func.ref()
+            if target is None:
+                func.prune()
+                return None
+            return bind_instance(target, instance)(*args, **kwargs)
+        return call_weak
+    elif not hasattr(func, '__get__'):
+        def call_unbound(instance, *args, **kwargs):
+            return func(*args, **kwargs)
+        return call_unbound
+
+    def call_bound(instance, *args, **kwargs):
+        return func.__get__(instance, instance.__class__)(*args, **kwargs)
+    return call_bound
+
+
+def compile_bound_dispatch(funcs):
+    """Return a single callable that calls all of the given class level callback functions as methods of an instance.
+
+    The returned dispatch function takes the instance as the first argument. Like `compile_dispatch` no callbacks
+    returns `fire_nothing` and a single function is called directly.
+    """
+    callers = tuple(instance_caller(func) for func in funcs)
+    length = len(callers)
+    if length == 0:
+        return fire_nothing
+    elif length == 1:
+        return callers[0]
+
+    def fire_all_bound(instance, *args, **kwargs):
+        for caller in callers:
+            caller(instance, *args, **kwargs)
+    return fire_all_bound
+
+
+def get_bound_dispatch_table(obj):
+    """Return the table of bound dispatch functions of a class level descriptor. The table is created with the lock.
+
+    Every BoundSignalerInstance of the descriptor keeps a reference to this table, so there is only one table that
+    `invalidate_dispatch` clears. It is linked to the descriptor's `event_dispatch` table (see SignalTable).
+    """
+    table = getattr(obj, 'event_bound_dispatch', None)
+    if table is None:
+        with SIGNAL_LOCK:
+            table = getattr(obj, 'event_bound_dispatch', None)
+            if table is None:
+                table = obj.event_bound_dispatch = SignalTable()
+                dispatch = getattr(obj, 'event_dispatch', None)
+                if type(dispatch) is SignalTable:
+                    dispatch.linked = table
+    return table
+
+
+def is_weak_key(instance):
+    """Return if the instance can be a key of a weakref.WeakKeyDictionary."""
+    try:
+        weakref.ref(instance)
+        hash(instance)
+        return True
+    except TypeError:
+        return False
+
+
+def compile_per_instance_dispatch(obj, signal_type, dispatch):
+    """Return a bound dispatch function for callback functions that keep state for each object (see `per_instance`).
+
+    These callback wrappers keep their bound copy for an object in a weakref.WeakKeyDictionary. An object that cannot
+    be a weak key (unhashable or __slots__ without __weakref__) gets its own signals instead, so the bound copy is
+    kept by the object's stored signaler.
+    """
+    def fire_per_instance(instance, *args, **kwargs):
+        if is_weak_key(instance):
+            dispatch(instance, *args, **kwargs)
+        else:
+            sig = obj.get_signaler_instance(instance)
+            if isinstance(sig, BoundSignalerInstance):
+                sig = sig.own_signals()
+            fire_signal(sig, signal_type, *args, **kwargs)
+    return fire_per_instance
+
+
+def get_bound_dispatch(obj, signal_type):
+    """Return the dispatch function that calls the class level callback functions of obj bound to an instance.
+
+    The dispatch function takes the instance as the first argument. It is shared by every BoundSignalerInstance that
+    does not have instance specific callback functions and is removed by `invalidate_dispatch`. Like `update_dispatch`
+    a signal that is blocked at the class level dispatches to `fire_nothing`.
+    """
+    table = getattr(obj, 'event_bound_dispatch', None)
+    if table is None:
+        table = get_bound_dispatch_table(obj)
+    dispatch = table.get(signal_type, None)
+    if dispatch is None:
+        with SIGNAL_LOCK:
+            try:
+                funcs = obj.event_signals[signal_type]
+                dispatch = compile_bound_dispatch(funcs)
+                if any(getattr(func, 'per_instance', False) for func in funcs):
+                    dispatch = compile_per_instance_dispatch(obj, signal_type, dispatch)
+                if is_blocked(obj, signal_type):
+                    dispatch = fire_nothing
+                table[signal_type] = dispatch
+            except (KeyError, AttributeError, TypeError) as error:
+                err = SignalError("Invalid 'signal_type' given ({:s}). Cannot connect a function to this "
+                                  "signal.".format(repr(signal_type)))
+                raise_from(err, error)
+                # raise err from error
+    return dispatch
+
+
+SIGNALER_SLOTS = ('event_signals', 'event_dispatch', 'event_blocked', '_name', 'bind_methods', '_set_from_widget',
+                  '__signalerinstances__', '__weakref__')
+"""Instance attributes that a SignalerInstance uses. Classes that are created for every object use these __slots__."""
+
+BOUND_SIGNALER_SLOTS = ('_event_signals', '_event_dispatch', 'event_blocked', '_name', 'bind_methods',
+                        '_set_from_widget', '__signalerinstances__', '__weakref__', 'descriptor', 'instance',
+                        '_bound_dispatch')
+"""Instance attributes that a BoundSignalerInstance uses."""
 
 
 class SignalerInstance(object):
-    """Emulates a function that has signals. This class is returned when signaler is used as a decorator."""
+    """Emulates a function that has signals. This class is returned when signaler is used as a decorator.
+
+    The SignalerInstance base classes do not have any storage. Subclasses either have a __dict__ or define __slots__
+    with SIGNALER_SLOTS.
+    """
+    __slots__ = ()
+
+    event_bound_dispatch = None  # Class level descriptors create it with get_bound_dispatch_table
 
     def __init__(self):
-        self.event_signals = {}
-        self.name = str(id(self))
+        self.event_dispatch = SignalTable()
+        self.event_signals = SignalTable(linked=self.event_dispatch)
+
+    @property
+    def name(self):
+        """Return the name of this signaler. The name is the id of the object unless a name was given."""
+        try:
+            return self._name
+        except AttributeError:
+            return str(id(self))
+
+    @name.setter
+    def name(self, name):
+        self._name = name
 
     # ========== Callbacks ==========
     get_signal = get_signal
 
-    def on(self, signal_type, func=None):
+    def on(self, signal_type, func=None, weak=False, throttle=None, debounce=None, executor=None, dispatcher=None,
+           coalesce=False):
         """Connect a callback function to a signal. If a function is not given then a decorator function is returned.
 
         Example:
@@ -249,17 +1238,26 @@ class SignalerInstance(object):
         Args:
             signal_type (str): Signal name to direct which signal to use
             func (callable)[None]: Callback function
+            weak (bool)[False]: Only keep a weak reference to the callback function.
+            throttle (float)[None]: Call the callback function at most once every throttle seconds.
+            debounce (float)[None]: Call the callback function after the signal did not fire for debounce seconds.
+            executor (concurrent.futures.Executor)[None]: Submit the callback function to this executor.
+            dispatcher (Dispatcher/threading.Thread/bool)[None]: Call the callback function in the dispatcher's
+                thread. True uses the current thread's dispatcher.
+            coalesce (bool)[False]: Only keep the latest queued call of a dispatcher connection.
 
         Returns:
             func (callable): The callable function that was given or a decorator to decorate a function.
         """
         if func is None:
             def decorator(func):
-                self.on(signal_type, func)
+                self.on(signal_type, func, weak=weak, throttle=throttle, debounce=debounce, executor=executor,
+                        dispatcher=dispatcher, coalesce=coalesce)
                 return func
             return decorator
 
-        on_signal(self, signal_type, func)
+        on_signal(self, signal_type, func, weak=weak, throttle=throttle, debounce=debounce, executor=executor,
+                  dispatcher=dispatcher, coalesce=coalesce)
         return func
 
     def off(self, signal_type, func=None):
@@ -319,8 +1317,46 @@ class SignalerInstance(object):
             *args: Arguments to pass to the callback functions
             **kwargs: Named arguments to pass to the callback functions
         """
-        # Main process fire a normal signal
-        fire_signal(self, signal_type, *args, **kwargs)
+        # Main process fire a normal signal. Resolve registered signal names to their slot
+        try:
+            dispatch = self.event_dispatch.builtin[SIGNAL_SLOTS[signal_type]]
+        except (KeyError, IndexError):
+            dispatch = self.event_dispatch.get(signal_type, None)
+        except AttributeError:  # Subclass with its own event_signals or event_dispatch dict
+            return fire_signal(self, signal_type, *args, **kwargs)
+        if dispatch is None:
+            dispatch = update_dispatch(self, signal_type)
+        dispatch(*args, **kwargs)
+
+    get_callers = get_callers
+
+    def fire_async(self, signal_type, *args, concurrent=True, limit=None, **kwargs):
+        """Return a coroutine that calls all of the callback functions for a signal and awaits the coroutine callbacks.
+
+        Example:
+
+            .. code-block:: python
+
+                class MyClass:
+                    @signaler
+                    def set_x(self, value):
+                        self._x = value
+
+                    @set_x.on("change")
+                    async def save_x(self, value):
+                        await db.write("x", value)
+
+                m = MyClass()
+                await m.set_x.fire_async("change", 1)
+
+        Args:
+            signal_type (str): Signal name to direct which signal to use
+            *args: Arguments to pass to the callback functions
+            concurrent (bool)[True]: If False await each coroutine callback before the next callback is called.
+            limit (int)[None]: Maximum number of coroutine callbacks that run at the same time.
+            **kwargs: Named arguments to pass to the callback functions
+        """
+        return call_async(self.get_callers(signal_type), args, kwargs, concurrent=concurrent, limit=limit)
 
     def block(self, signal_type=None, block=True):
         """Temporarily block a specific signal or all signals from calling their callback functions.
@@ -371,26 +1407,258 @@ class SignalerInstance(object):
         return block_signals(self, signal_type=signal_type, block=block)
 
 
+def signaler_slot_name(name, owner=None):
+    """Return the instance attribute name that stores the instance signaler of the given class attribute name.
+
+    The name is private to the owner class (`_Owner__name_signaler`) like the mangled name of `__name_signaler`, so a
+    subclass that overrides the attribute stores a separate instance signaler.
+    """
+    attr = '__{}_signaler'.format(name)
+    owner_name = getattr(owner, '__name__', '').lstrip('_')
+    if not owner_name:
+        return attr
+    return '_{}{}'.format(owner_name, attr)
+
+
+def signaler_slots(*names):
+    """Return the __slots__ that a class needs to store the instance signalers of the given class attribute names.
+
+    The private slot names are mangled with the class name when the class is created.
+
+    Example:
+
+        .. code-block:: python
+
+            class Point(object):
+                __slots__ = ('_x', '__weakref__') + signaler_slots('x')
+
+                @signaler_property
+                def x(self):
+                    return self._x
+
+                @x.setter
+                def x(self, value):
+                    self._x = value
+    """
+    return tuple(signaler_slot_name(name) for name in names)
+
+
 class SignalerDescriptorInstance(SignalerInstance):
-    """Class that can easily be used as a class descriptor"""
+    """Class that can easily be used as a class descriptor.
+
+    The class attribute name is given to `__set_name__`, so the instance signaler is stored in the instance attribute
+    `signaler_slot_name(name, owner)`. This can be an item in the instance __dict__ or a slot (see `signaler_slots`).
+    Without a name or a slot the instance signalers are stored in an `instance.__signalers__` dictionary.
+    """
+    __slots__ = ()
+
+    storage_name = None
+    storage_empty = False  # No object stored its signaler in the storage attribute yet
+    signalers_dict = True  # The objects may store their signalers in an __signalers__ dictionary
+    shared_class = None  # (func, class) of the signalers that are created while storage_empty (see signaler.__get__)
+
+    def __set_name__(self, owner, name):
+        """Store the instance signalers in the instance attribute for the class attribute name.
+
+        A slot or the instance __dict__ always stores the signaler, so the objects of these classes never look for
+        `__signalers__`. Signalers that share the class level callback functions are not stored, so the storage
+        attribute is only read after a signaler was stored. Reading an empty slot raises an AttributeError.
+        """
+        self.storage_name = signaler_slot_name(name, owner)
+        slot = isinstance(getattr(owner, self.storage_name, None), types.MemberDescriptorType)
+        self.storage_empty = True
+        self.shared_class = None
+        self.signalers_dict = not (slot or getattr(owner, '__dictoffset__', 0))
+
     def get_signaler_instance(self, instance=None):
-        """Return (maybe create) the instance CallbackManager."""
+        """Return (maybe create) the instance CallbackManager.
+
+        A BoundSignalerInstance that shares the class level callback functions is not stored on the instance. Like a
+        bound method it is created again for every access, so the object and its signaler do not keep each other
+        alive. It is stored when it needs its own state (see `BoundSignalerInstance.needs_storage`).
+        """
         if instance is None:
             return self
 
-        # Make sure the instance keeps track of all it's signalers
-        if not hasattr(instance, '__signalers__'):
-            instance.__signalers__ = {}
+        sig = self.find_signaler_instance(instance)
+        if sig is None:
+            sig = self.create_signaler_instance(instance)
+            if not isinstance(sig, BoundSignalerInstance) or sig.needs_storage():
+                self.store_signaler_instance(instance, sig)
+        return sig
+
+    def find_signaler_instance(self, instance):
+        """Return the signaler instance that is stored on the instance or None."""
+        storage_name = self.storage_name
+        if storage_name is not None and not self.storage_empty:
+            sig = getattr(instance, storage_name, None)
+            if sig is not None:
+                return sig
+
+        if storage_name is None or self.signalers_dict:
+            signalers = getattr(instance, '__signalers__', None)
+            if signalers is not None:
+                return signalers.get(self, None)
+        return None
+
+    def store_signaler_instance(self, instance, sig):
+        """Store the signaler instance on the instance."""
+        storage_name = self.storage_name
+        if storage_name is not None:
+            try:
+                self.storage_empty = False  # Before the attribute is set, so other threads read it
+                self.shared_class = None
+                setattr(instance, storage_name, sig)
+                return
+            except AttributeError:
+                pass  # __slots__ class without the slot
 
-        # Get the signaler
+        # Make sure the instance keeps track of all it's signalers
         try:
-            return instance.__signalers__[self]  # return an event handler object for the instance
-        except KeyError:
-            # Create the signaler instance
-            sig = self.create_signaler_instance(instance)
-            instance.__signalers__[self] = sig
-            return sig
+            if not hasattr(instance, '__signalers__'):
+                instance.__signalers__ = {}
+        except AttributeError as error:
+            err = AttributeError("{!r} object cannot store the signaler instance. Add {!r} to the "
+                                 "__slots__.".format(instance.__class__.__name__, storage_name or '__signalers__'))
+            raise_from(err, error)
+            # raise err from error
+        instance.__signalers__[self] = sig
 
     def create_signaler_instance(self, instance=None):
         """Create and return a signaler instance."""
         raise NotImplementedError
+
+
+class BoundSignalerInstance(SignalerInstance):
+    """SignalerInstance for one object that shares the callback functions of its class level descriptor.
+
+    The class level callback functions are bound to the object when a signal fires. The object only gets its own copy
+    of the callback functions (bound to the object) when the signals are changed or blocked for this object (see
+    `own_signals`). Until then the signaler is not stored on the object and is created for every access like a bound
+    method.
+
+    Subclasses define __slots__ with BOUND_SIGNALER_SLOTS.
+    """
+    __slots__ = ()
+
+    def __init__(self, descriptor, instance):
+        self.descriptor = descriptor
+        self.instance = instance
+        self._event_signals = None
+        self._event_dispatch = None
+        self._bound_dispatch = descriptor.event_bound_dispatch
+        if self._bound_dispatch is None:
+            self._bound_dispatch = get_bound_dispatch_table(descriptor)
+
+    @property
+    def shares_signals(self):
+        """Return if this object still uses the callback functions of the class level descriptor."""
+        return self._event_signals is None
+
+    def needs_storage(self):
+        """Return if this signaler has state for the object, so it has to be stored on the object."""
+        return self._event_signals is not None
+
+    def own_signals(self):
+        """Copy the class level callback functions for this object and store the signaler on the object.
+
+        A signaler that was created for the object before another signaler was stored uses the tables of the stored
+        signaler, so both of them change the same callback functions. Return the stored signaler.
+        """
+        with SIGNAL_LOCK:
+            descriptor = self.descriptor
+            stored = descriptor.find_signaler_instance(self.instance)
+            if stored is None:
+                descriptor.store_signaler_instance(self.instance, self)
+                stored = self
+
+            if self._event_signals is None:
+                if stored is not self:
+                    stored.own_signals()
+                    self.event_blocked = stored.event_blocked
+                    self._event_dispatch = stored._event_dispatch
+                    self._event_signals = stored._event_signals
+                else:
+                    # Firing threads that see the new table compile the dispatch after the lock is released
+                    self.event_blocked = {}
+                    self._event_dispatch = SignalTable()
+                    self._event_signals = SignalTable(linked=self._event_dispatch)
+                    copy_signals_as_bound(descriptor, self, self.instance)
+        return stored
+
+    @property
+    def event_signals(self):
+        """Return the signals for this object.
+
+        While the object shares the class level callback functions this returns a new table with the class level
+        callback functions bound to the object. Changing that table does not change the signals.
+        """
+        signals = self._event_signals
+        if signals is None:
+            descriptor = self.descriptor
+            instance = self.instance
+            signals = SignalTable()
+            for signal_type in descriptor.event_signals.keys():
+                signals[signal_type] = tuple(bind_instance(func, instance)
+                                             for func in get_signal(descriptor, signal_type))
+        return signals
+
+    @event_signals.setter
+    def event_signals(self, value):
+        self._event_signals = value
+
+    @property
+    def event_dispatch(self):
+        """Return the precompiled dispatch functions for this object's own signals."""
+        if self._event_signals is None:
+            return SignalTable()  # The shared signals use the descriptor's bound dispatch table
+        return self._event_dispatch
+
+    @event_dispatch.setter
+    def event_dispatch(self, value):
+        self._event_dispatch = value
+
+    def __eq__(self, other):
+        """Like bound methods the signalers of the same object and class level descriptor are equal."""
+        if isinstance(other, BoundSignalerInstance):
+            return self.instance is other.instance and self.descriptor is other.descriptor
+        return NotImplemented
+
+    def __ne__(self, other):
+        eq = self.__eq__(other)
+        if eq is NotImplemented:
+            return eq
+        return not eq
+
+    def __hash__(self):
+        return hash((id(self.instance), id(self.descriptor)))
+
+    @property
+    def __name__(self):
+        """Return the name of the class level descriptor."""
+        try:
+            return self.descriptor.__name__
+        except AttributeError:
+            raise AttributeError("{!r} object has no attribute '__name__'".format(self.__class__.__name__))
+
+    def get_signal(self, signal_type):
+        """Return a list of callback functions that are connected to the signal for this object."""
+        if self._event_signals is None:
+            instance = self.instance
+            return [bind_instance(func, instance) for func in get_signal(self.descriptor, signal_type)]
+        return get_signal(self, signal_type)
+
+    def fire(self, signal_type, *args, **kwargs):
+        """Call all of the callback functions that are associated with a signal for this object."""
+        if self._event_signals is None:
+            get_bound_dispatch(self.descriptor, signal_type)(self.instance, *args, **kwargs)
+        else:
+            super(BoundSignalerInstance, self).fire(signal_type, *args, **kwargs)
+
+    def get_callers(self, signal_type):
+        """Return a tuple of the callback functions that are called when the signal fires for this object."""
+        if self._event_signals is None:
+            instance = self.instance
+            return tuple(functools.partial(instance_caller(func), instance)
+                         for func in get_callers(self.descriptor, signal_type))
+        return get_callers(self, signal_type)
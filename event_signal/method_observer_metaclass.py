@@ -1,24 +1,281 @@
-from future.utils import with_metaclass
-
+import fnmatch
+import functools
+import re
 import types
-from .signaler import signaler
+from .interface import SIGNAL_LOCK
+from .signaler import signaler, FUNC_METADATA
+
+
+__all__ = ["MethodObserverMeta", "MethodObserver", "observable", "observable_method", "LazyMethod"]
+
+
+class LazyMethod(functools.partial):
+    """Method of an object whose class level function is not observed yet.
+
+    Calling it calls the function directly. Connecting a callback function replaces the class attribute with a
+    signaler and connects the callback function to the object's signaler.
+
+    The `method` is the observable_method class attribute that created this object, so aliases of the same function
+    are observed separately.
+    """
+    __slots__ = ('method',)
+
+    @property
+    def __func__(self):
+        return self.func
+
+    @property
+    def __self__(self):
+        return self.args[0]
+
+    def __getattr__(self, name):
+        """Return the function's metadata (__name__, __qualname__, ...)."""
+        if name in FUNC_METADATA:
+            if name == '__wrapped__':
+                return self.func
+            return getattr(self.func, name)
+        raise AttributeError("{!r} object has no attribute {!r}".format(self.__class__.__name__, name))
+
+    def class_attribute(self):
+        """Return the class level observable_method or the signaler that replaced it."""
+        return self.method.observed() or self.method
+
+    def observe(self):
+        """Replace the class attribute with a signaler and return the object's signaler."""
+        sig = self.method.observe()
+        instance = self.args[0]
+        return sig.__get__(instance, instance.__class__)
+
+    def on(self, signal_type, func=None, **kwargs):
+        """Connect a callback function to the object's signaler (see `signaler.on`)."""
+        return self.observe().on(signal_type, func, **kwargs)
+
+    def off(self, signal_type, func=None):
+        """Disconnect a callback function. Return False if the method was never observed."""
+        if isinstance(self.class_attribute(), observable_method):
+            return False
+        return self.observe().off(signal_type, func)
+
+    def get_signal(self, signal_type):
+        return self.observe().get_signal(signal_type)
+
+    def fire(self, signal_type, *args, **kwargs):
+        return self.observe().fire(signal_type, *args, **kwargs)
+
+    def block(self, signal_type=None, block=True):
+        return self.observe().block(signal_type, block)
+
+
+class observable_method(object):
+    """Class attribute for a MethodObserver function that becomes a signaler when a callback function is connected.
+
+    Until then the function is called directly without any signals.
+    """
+    __slots__ = ('func', 'owner', 'name')
+
+    def __init__(self, func):
+        self.func = func
+        self.owner = None
+        self.name = getattr(func, '__name__', None)
+
+    def __set_name__(self, owner, name):
+        self.owner = owner
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        method = LazyMethod(self.func, instance)
+        method.method = self
+        return method
+
+    def __call__(self, *args, **kwargs):
+        return self.func(*args, **kwargs)
+
+    @property
+    def __isabstractmethod__(self):
+        """Return if the function is an abc.abstractmethod."""
+        return getattr(self.func, '__isabstractmethod__', False)
+
+    def __getattr__(self, name):
+        """Return the function's metadata (__name__, __qualname__, ...)."""
+        if name in FUNC_METADATA:
+            if name == '__wrapped__':
+                return self.func
+            return getattr(self.func, name)
+        raise AttributeError("{!r} object has no attribute {!r}".format(self.__class__.__name__, name))
+
+    def observed(self):
+        """Return the signaler that replaced this function or None."""
+        sig = self.owner.__dict__.get(self.name, None) if self.owner is not None else None
+        if isinstance(sig, signaler) and sig.func is self.func:
+            return sig
+        return None
+
+    def observe(self):
+        """Replace the class attribute with a signaler of the function and return the signaler."""
+        with SIGNAL_LOCK:
+            sig = self.observed()
+            if sig is None:
+                sig = signaler(self.func)
+                if self.owner is not None:
+                    sig.__set_name__(self.owner, self.name)
+                    setattr(self.owner, self.name, sig)
+            return sig
+
+    def on(self, signal_type, func=None, **kwargs):
+        """Connect a class level callback function (see `signaler.on`)."""
+        return self.observe().on(signal_type, func, **kwargs)
 
+    def off(self, signal_type, func=None):
+        """Disconnect a class level callback function. Return False if the method was never observed."""
+        sig = self.observed()
+        if sig is None:
+            return False
+        return sig.off(signal_type, func)
 
-__all__ = ["MethodObserverMeta", "MethodObserver"]
+    def get_signal(self, signal_type):
+        return self.observe().get_signal(signal_type)
+
+    def fire(self, signal_type, *args, **kwargs):
+        return self.observe().fire(signal_type, *args, **kwargs)
+
+    def block(self, signal_type=None, block=True):
+        return self.observe().block(signal_type, block)
+
+    def __repr__(self):
+        return '<{} {!r}>'.format(self.__class__.__name__, self.func)
+
+
+OBSERVE_MODES = ('all', 'public', 'marked')
+POLICY_NAMES = ('__observe__', '__observe_include__', '__observe_exclude__')
+
+
+def observable(func):
+    """Decorator that marks a function to be observed whatever the class observation policy is."""
+    func.__observable__ = True
+    return func
+
+
+def compile_patterns(patterns):
+    """Return a compiled regular expression that matches any of the fnmatch name patterns or None."""
+    if not patterns:
+        return None
+    elif isinstance(patterns, str):
+        patterns = (patterns,)
+    return re.compile('|'.join(fnmatch.translate(pattern) for pattern in patterns))
+
+
+def get_policy(bases, namespace, observe=None, include=None, exclude=None):
+    """Return the (mode, include, exclude) observation policy for a new class with compiled name patterns.
+
+    Keyword arguments override the class attributes `__observe__`, `__observe_include__`, and `__observe_exclude__`
+    which are inherited from the base classes.
+
+    Raises:
+        ValueError: If the mode is not 'all', 'public', or 'marked'.
+    """
+    policy = []
+    for name, value in zip(POLICY_NAMES, (observe, include, exclude)):
+        if value is None:
+            value = namespace.get(name, None)
+        if value is None:
+            for base in bases:
+                value = getattr(base, name, None)
+                if value is not None:
+                    break
+        policy.append(value)
+
+    mode = policy[0] or 'all'
+    if mode not in OBSERVE_MODES:
+        raise ValueError('Invalid observe mode {!r}. Use one of {}'.format(mode, OBSERVE_MODES))
+    return mode, compile_patterns(policy[1]), compile_patterns(policy[2])
+
+
+def is_observed(name, value, mode='all', include=None, exclude=None):
+    """Return if a class attribute should be an observable_method with the given policy."""
+    val_type = type(value)
+    if name.startswith('__') or (val_type is not types.FunctionType and val_type is not types.MethodType):
+        return False
+    elif getattr(value, '__observable__', False):
+        return True
+    elif mode == 'marked' or (mode == 'public' and name.startswith('_')):
+        return False
+    elif include is not None and include.match(name) is None:
+        return False
+    return exclude is None or exclude.match(name) is None
 
 
 class MethodObserverMeta(type):
-    """Meta class that makes all functions signalers."""
-    def __new__(typ, name, bases, attr):
-        # Replace each function with a Signalar that can have custom methods connected to it.
-        for name, value in attr.items():
-            val_type = type(value)
-            if not name.startswith("__") and (val_type is types.FunctionType or val_type is types.MethodType):
-                attr[name] = signaler(value)
+    """Meta class that makes the functions observable.
+
+    The functions are replaced with an observable_method that calls the function directly. The first time a callback
+    function is connected (`obj.method.on(...)` or `Class.method.on(...)`) the class attribute is replaced with a
+    signaler, so methods that nobody observes do not pay for the signals.
+
+    The functions that are observed are selected with class keyword arguments or class attributes which subclasses
+    inherit (see MethodObserver).
+    """
+    def __new__(typ, name, bases, attr, observe=None, include=None, exclude=None, **kwargs):
+        # Replace each function with an observable method that can have custom methods connected to it.
+        policy = get_policy(bases, attr, observe, include, exclude)
+        for key, value in attr.items():
+            if is_observed(key, value, *policy):
+                attr[key] = observable_method(value)
+        for key, value in zip(POLICY_NAMES, (observe, include, exclude)):
+            if value is not None:
+                attr[key] = value
+
+        return super(MethodObserverMeta, typ).__new__(typ, name, bases, attr, **kwargs)
+
+    def __init__(cls, name, bases, attr, observe=None, include=None, exclude=None, **kwargs):
+        super(MethodObserverMeta, cls).__init__(name, bases, attr, **kwargs)
+
+
+class MethodObserver(object):
+    """Class mixin that makes functions observable signaler functions that can be connected to.
+
+    The subclass is set up in `__init_subclass__`, so it can be combined with classes that have other metaclasses.
+
+    Example:
+
+        .. code-block:: python
+
+            class Model(MethodObserver, observe='public', exclude=('get_*', 'is_*')):
+                def set_x(self, x):  # Observed
+                    self._x = x
+
+                def get_x(self):  # Not observed
+                    return self._x
+
+                def _update(self):  # Not observed
+                    pass
+
+                @observable
+                def _reset(self):  # Observed
+                    pass
 
-        return super(MethodObserverMeta, typ).__new__(typ, name, bases, attr)
+            class Helpers(MethodObserver):
+                __observe__ = 'marked'  # Class attributes work like the keyword arguments and are inherited
+                __observe_include__ = ('set_*',)
+                __observe_exclude__ = ()
 
+    Keyword Args:
+        observe (str)['all']: 'all' functions (without dunder methods), 'public' functions that do not start with an
+            underscore, or only the 'marked' functions.
+        include (tuple)[None]: Only observe the function names that match one of these fnmatch patterns.
+        exclude (tuple)[None]: Do not observe the function names that match one of these fnmatch patterns.
 
-class MethodObserver(with_metaclass(MethodObserverMeta, object)):
-    """Class mixin that makes all functions signaler functions that can be connected to."""
-    pass
+    Functions that are decorated with `@observable` are always observed.
+    """
+    def __init_subclass__(cls, observe=None, include=None, exclude=None, **kwargs):
+        super(MethodObserver, cls).__init_subclass__(**kwargs)
+        for key, value in zip(POLICY_NAMES, (observe, include, exclude)):
+            if value is not None:
+                setattr(cls, key, value)
+        policy = get_policy(cls.__bases__, vars(cls))
+        for key, value in list(vars(cls).items()):
+            if is_observed(key, value, *policy):
+                method = observable_method(value)
+                method.__set_name__(cls, key)
+                setattr(cls, key, method)
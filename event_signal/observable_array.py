@@ -0,0 +1,275 @@
+"""
+NumPy array that fires a 'change' signal with the index of the elements that were written.
+
+Example:
+
+    .. code-block:: python
+
+        class Model(object):
+            def __init__(self):
+                self.samples = ObservableArray(numpy.zeros(1000000))
+
+        model = Model()
+        model.samples.on('change', lambda index: redraw(model.samples[index]))
+
+        model.samples[10:20] = 1  # change slice(10, 20, None)
+        model.samples *= 2  # change Ellipsis (the whole array)
+
+        with model.samples.hold():  # Merge the writes into the bounding region
+            model.samples[5] = 1
+            model.samples[100] = 2
+        # change (slice(5, 101, None),)
+
+The 'change' signal fires for `__setitem__`, in-place ufuncs (`a += 1`, `numpy.add(a, 1, out=a)`, `numpy.add.at`),
+the in-place methods `fill`, `sort`, `partition`, and `put`, and `numpy.copyto`, `numpy.place`, `numpy.putmask`, and
+`numpy.fill_diagonal`.
+
+Warning:
+    Slices and other views of the array are ObservableArrays with their own signals. Writing through a view
+    (`a[1:3][0] = 1`, `a.T[0] = 1`, `a.flat[0] = 1`) does not fire the signal of the array it came from.
+"""
+import contextlib
+import operator
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from .interface import SignalerInstance, SignalTable, SIGNAL_LOCK, BATCH_STATE, defer_signal
+
+
+__all__ = ['ObservableArray', 'get_region', 'merge_regions', 'region_index']
+
+
+if numpy is not None:
+    ndarray = numpy.ndarray
+    INPLACE_FUNCTIONS = {numpy.copyto: 'dst', numpy.place: 'arr', numpy.putmask: 'a', numpy.fill_diagonal: 'a'}
+    """Array functions that write into their first argument and the name of the argument."""
+else:
+    class ndarray(object):
+        """Base class of ObservableArray when numpy is not installed."""
+        __slots__ = ()
+
+    INPLACE_FUNCTIONS = {}
+
+
+def get_region(index, shape):
+    """Return the bounding region ((start, stop), ...) of every dimension that the index selects or None if it is empty.
+
+    Indexes that are not understood (like field names) select the whole array.
+    """
+    if not isinstance(index, tuple):
+        index = (index,)
+    ndim = len(shape)
+    keys = []
+    used = 0
+    for key in index:
+        if isinstance(key, (list, ndarray)):
+            key = numpy.asarray(key)
+            used += key.ndim if key.dtype == bool else 1
+        elif key is not None and key is not Ellipsis and not isinstance(key, str):
+            used += 1
+        keys.append(key)
+
+    try:
+        region = []
+        for key in keys:
+            if key is None or isinstance(key, str):
+                continue
+            elif key is Ellipsis:
+                for _ in range(ndim - used):
+                    region.append((0, shape[len(region)]))
+                used = ndim
+            elif isinstance(key, slice):
+                selected = range(*key.indices(shape[len(region)]))
+                if not selected:
+                    return None
+                region.append((min(selected[0], selected[-1]), max(selected[0], selected[-1]) + 1))
+            elif isinstance(key, ndarray) and key.dtype == bool:
+                if key.ndim == 0:
+                    continue
+                for indices in key.nonzero():
+                    if not indices.size:
+                        return None
+                    region.append((int(indices.min()), int(indices.max()) + 1))
+            elif isinstance(key, ndarray):
+                if not key.size:
+                    return None
+                size = shape[len(region)]
+                key = numpy.where(key < 0, key + size, key)
+                region.append((int(key.min()), int(key.max()) + 1))
+            else:
+                size = shape[len(region)]
+                i = operator.index(key)
+                if i < 0:
+                    i += size
+                region.append((i, i + 1))
+    except (TypeError, ValueError, IndexError):
+        return tuple((0, size) for size in shape)
+
+    region.extend((0, size) for size in shape[len(region):])
+    return tuple(region)
+
+
+def merge_regions(region, other):
+    """Return the bounding region of both regions. Either region can be None."""
+    if region is None:
+        return other
+    elif other is None:
+        return region
+    return tuple((min(start, other_start), max(stop, other_stop))
+                 for (start, stop), (other_start, other_stop) in zip(region, other))
+
+
+def region_index(region):
+    """Return the tuple of slices that selects the region."""
+    return tuple(slice(start, stop) for start, stop in region)
+
+
+class ObservableArray(ndarray, SignalerInstance):
+    """numpy.ndarray that fires a 'change' signal with the index that was written.
+
+    The signal tables are only created when a callback function is connected, so views and results of the array do
+    not pay for the signals.
+
+    Writes can be merged into one 'change' signal with the bounding region of the writes (a tuple of slices):
+
+        * `hold()` merges the writes until `flush()` is called or the hold context exits.
+        * `event_signal.batch()` merges the writes until the outermost batch exits.
+    """
+    _held = 0
+    _region = None
+    _batch = None
+    _batch_region = None
+
+    def __new__(cls, data, dtype=None, copy=True):
+        """Create the array.
+
+        Args:
+            data (array_like): Values of the array.
+            dtype (numpy.dtype)[None]: Data type of the array.
+            copy (bool)[True]: If False use the data's memory when possible.
+        """
+        if numpy is None:
+            raise ImportError('ObservableArray requires numpy')
+        if copy:
+            return numpy.array(data, dtype=dtype).view(cls)
+        return numpy.asarray(data, dtype=dtype).view(cls)
+
+    def __init__(self, *args, **kwargs):
+        pass  # The signal tables are created when they are first used (see __getattr__)
+
+    def __getattr__(self, name):
+        """Create the signal tables the first time they are used."""
+        if name in ('event_signals', 'event_dispatch', '__signalerinstances__'):
+            with SIGNAL_LOCK:
+                attrs = self.__dict__
+                if 'event_signals' not in attrs:
+                    signals = SignalTable()
+                    signals['change'] = ()
+                    attrs['event_dispatch'] = SignalTable()
+                    attrs['__signalerinstances__'] = []  # Views like .T are not blocked with the array
+                    attrs['event_signals'] = signals
+            return attrs[name]
+        raise AttributeError("{!r} object has no attribute {!r}".format(self.__class__.__name__, name))
+
+    # ========== Signals ==========
+    def changed(self, index=Ellipsis):
+        """Fire the 'change' signal with the index that was written or merge the index into the held region."""
+        if 'event_signals' not in self.__dict__:
+            return  # Nobody is listening
+
+        if self._held:
+            self._region = merge_regions(self._region, get_region(index, self.shape))
+            return
+
+        state = BATCH_STATE
+        if state.depth:
+            region = get_region(index, self.shape)
+            if self._batch == state.generation:
+                region = merge_regions(self._batch_region, region)
+            if region is None or defer_signal(self, 'change', (region_index(region),)):
+                self._batch_region = region
+                self._batch = state.generation
+                return
+
+        self.fire('change', index)
+
+    def flush(self):
+        """Fire the 'change' signal once with the bounding region of the held writes. Return the index or None."""
+        region = self._region
+        self._region = None
+        if region is None:
+            return None
+        index = region_index(region)
+        self.fire('change', index)
+        return index
+
+    @contextlib.contextmanager
+    def hold(self):
+        """Context manager that merges the writes into one 'change' signal when the outermost hold exits.
+
+        Call `flush()` to fire the signal for the writes so far while the writes are held.
+        """
+        self._held += 1
+        try:
+            yield self
+        finally:
+            self._held -= 1
+            if not self._held:
+                self.flush()
+
+    # ========== Writes ==========
+    def __setitem__(self, index, value):
+        super(ObservableArray, self).__setitem__(index, value)
+        self.changed(index)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """Run the ufunc on plain arrays and fire the 'change' signal of the ObservableArrays that were written."""
+        args = [arg.view(ndarray) if isinstance(arg, ObservableArray) else arg for arg in inputs]
+        outputs = kwargs.get('out', None)
+        if outputs:
+            kwargs['out'] = tuple(out.view(ndarray) if isinstance(out, ObservableArray) else out for out in outputs)
+
+        results = getattr(ufunc, method)(*args, **kwargs)
+
+        if method == 'at':
+            if isinstance(inputs[0], ObservableArray):
+                inputs[0].changed(inputs[1])
+            return results
+        if not outputs:
+            return results
+
+        # Return the output arrays (`a += 1` assigns the result to a)
+        for out in outputs:
+            if isinstance(out, ObservableArray):
+                out.changed()
+        if not isinstance(results, tuple):
+            return outputs[0] if outputs[0] is not None else results
+        return tuple(result if out is None else out for result, out in zip(results, outputs))
+
+    def __array_function__(self, func, types, args, kwargs):
+        """Fire the 'change' signal of the ObservableArray that an in-place function (like numpy.copyto) wrote."""
+        result = super(ObservableArray, self).__array_function__(func, types, args, kwargs)
+        if func in INPLACE_FUNCTIONS:
+            target = args[0] if args else kwargs.get(INPLACE_FUNCTIONS[func], None)
+            if isinstance(target, ObservableArray):
+                target.changed()
+        return result
+
+    def fill(self, value):
+        super(ObservableArray, self).fill(value)
+        self.changed()
+
+    def sort(self, *args, **kwargs):
+        super(ObservableArray, self).sort(*args, **kwargs)
+        self.changed()
+
+    def partition(self, *args, **kwargs):
+        super(ObservableArray, self).partition(*args, **kwargs)
+        self.changed()
+
+    def put(self, indices, values, mode='raise'):
+        super(ObservableArray, self).put(indices, values, mode)
+        self.changed()
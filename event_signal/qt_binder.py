@@ -255,5 +255,7 @@ def unbind_qt(obj1, property_name=None, obj2=None, obj2_name=None, qt_signal=Non
 
 def qt_override_block_signals(self, b):
     """Set this method as a QWidget's blockSignals method to block qt signals and event_signal signals."""
-    block_signals(self, block=b)
+    # Qt blocking is a flag and event_signal blocking is counted. Only change the block when the flag changes.
+    if bool(b) != bool(self.signalsBlocked()):
+        block_signals(self, block=b)
     return QtCore.QObject.blockSignals(self, b)
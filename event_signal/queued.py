@@ -0,0 +1,217 @@
+"""
+Queued connections like Qt's QueuedConnection without Qt.
+
+A callback function can be connected with a Dispatcher (or the thread that owns it). When the signal fires in the
+dispatcher's thread the callback function is called directly. When the signal fires in any other thread the call is
+queued and the dispatcher's thread calls it from `process_events()` or `Dispatcher.run()`.
+
+Example:
+
+    .. code-block:: python
+
+        # UI thread
+        model.value_changed.connect(label.set_text, dispatcher=True)  # Connect to the current thread's dispatcher
+        model.progress.connect(bar.set_value, dispatcher=True, coalesce=True)  # Only the latest value is queued
+
+        worker = threading.Thread(target=model.calculate)  # Emits value_changed and progress
+        worker.start()
+        while running:
+            process_events()  # Call the queued callback functions in the UI thread
+"""
+import threading
+import traceback
+import weakref
+from collections import deque
+
+from .interface import CallbackWrapper, callback_key, bind_instance
+
+
+__all__ = ['Dispatcher', 'get_dispatcher', 'process_events', 'QueuedCallback']
+
+
+class Dispatcher(object):
+    """Queue of callback function calls that are run in the dispatcher's thread.
+
+    A dispatcher becomes the dispatcher of its thread (see `get_dispatcher`) if the thread does not have one yet, so
+    connecting with the thread and `process_events()` use this dispatcher.
+    """
+
+    def __init__(self, thread=None):
+        """Initialize the dispatcher.
+
+        Args:
+            thread (threading.Thread)[None]: Thread that runs the queued calls. None uses the current thread.
+        """
+        if thread is None:
+            thread = threading.current_thread()
+        self._thread = None
+        self.thread = thread
+        self.condition = threading.Condition(threading.Lock())
+        self.events = deque()
+        self.latest = {}
+        self.stopped = False
+
+    @property
+    def thread(self):
+        """Return the dispatcher's thread or None if the thread was deleted."""
+        return self._thread()
+
+    @thread.setter
+    def thread(self, thread):
+        # DISPATCHERS is keyed by the thread, so the dispatcher only keeps a weak reference to the thread
+        with DISPATCHERS_LOCK:
+            old = self._thread() if self._thread is not None else None
+            if old is not None and DISPATCHERS.get(old, None) is self:
+                del DISPATCHERS[old]
+            self._thread = weakref.ref(thread)
+            DISPATCHERS.setdefault(thread, self)
+
+    def is_current(self):
+        """Return if the current thread is the dispatcher's thread."""
+        return threading.current_thread() is self.thread
+
+    def post(self, func, args=(), kwargs=None, key=None):
+        """Queue a call to the function. This can be called from any thread.
+
+        Args:
+            func (callable): Function to call in the dispatcher's thread.
+            args (tuple)[()]: Arguments to pass to the function.
+            kwargs (dict)[None]: Named arguments to pass to the function.
+            key (object)[None]: Coalesce key. A queued call with the same key is replaced with the latest arguments.
+        """
+        with self.condition:
+            if key is None:
+                self.events.append((None, func, args, kwargs))
+            else:
+                if key not in self.latest:
+                    self.events.append((key, None, None, None))
+                self.latest[key] = (func, args, kwargs)
+            self.condition.notify()
+
+    def pending(self):
+        """Return the number of queued calls."""
+        return len(self.events)
+
+    def process_events(self, max_events=None):
+        """Call the queued functions in the current thread. Return the number of functions that were called.
+
+        Calls that are queued while processing are left for the next `process_events`.
+
+        Args:
+            max_events (int)[None]: Maximum number of queued functions to call.
+        """
+        count = len(self.events)
+        if max_events is not None:
+            count = min(count, max_events)
+        for i in range(count):
+            with self.condition:
+                key, func, args, kwargs = self.events.popleft()
+                if key is not None:
+                    func, args, kwargs = self.latest.pop(key)
+            func(*args, **(kwargs or {}))
+        return count
+
+    def wait(self, timeout=None):
+        """Wait until a call is queued or the dispatcher is stopped. Return True if calls are queued."""
+        with self.condition:
+            if not self.events and not self.stopped:
+                self.condition.wait(timeout)
+            return len(self.events) > 0
+
+    def run(self):
+        """Run the queued functions in the current thread until `stop()` is called. Errors are printed."""
+        with self.condition:
+            self.stopped = False
+        while not self.stopped:
+            if self.wait():
+                try:
+                    self.process_events()
+                except Exception:
+                    traceback.print_exc()
+
+    def start(self, name=None):
+        """Start a daemon thread that runs the queued functions (see `run()`). Return the thread."""
+        thread = self.thread = threading.Thread(target=self.run, name=name)
+        thread.daemon = True
+        thread.start()
+        return thread
+
+    def stop(self):
+        """Stop `run()`. This can be called from any thread."""
+        with self.condition:
+            self.stopped = True
+            self.condition.notify_all()
+
+
+DISPATCHERS = weakref.WeakKeyDictionary()
+DISPATCHERS_LOCK = threading.RLock()
+
+
+def get_dispatcher(thread=None):
+    """Return the dispatcher of a thread. A dispatcher is created the first time it is needed.
+
+    Args:
+        thread (threading.Thread)[None]: Thread of the dispatcher. None uses the current thread.
+    """
+    if thread is None:
+        thread = threading.current_thread()
+    with DISPATCHERS_LOCK:
+        try:
+            return DISPATCHERS[thread]
+        except KeyError:
+            return Dispatcher(thread)  # Registers itself for the thread
+
+
+def process_events(max_events=None):
+    """Call the functions that were queued for the current thread's dispatcher."""
+    return get_dispatcher().process_events(max_events)
+
+
+class QueuedCallback(CallbackWrapper):
+    """Callback function that is called in the dispatcher's thread.
+
+    Calls from the dispatcher's thread call the callback function directly. Calls from other threads are queued. With
+    coalesce only the latest queued call of this connection is kept.
+    """
+    __slots__ = ('callback', 'key', 'dispatcher', 'coalesce', 'group')
+
+    def __init__(self, callback, dispatcher, coalesce=False, group=None):
+        """Initialize the queued callback.
+
+        Args:
+            callback (callable): Callback function to call in the dispatcher's thread.
+            dispatcher (Dispatcher/threading.Thread/bool): Dispatcher, thread of the dispatcher, or True for the
+                current thread's dispatcher.
+            coalesce (bool)[False]: Only keep the latest queued call.
+            group (int)[None]: Id of the connection that this callback was bound from (used to coalesce calls).
+        """
+        if not isinstance(dispatcher, Dispatcher):
+            dispatcher = get_dispatcher(None if dispatcher is True else dispatcher)
+        self.callback = callback
+        self.key = callback_key(callback)
+        self.dispatcher = dispatcher
+        self.coalesce = coalesce
+        self.group = id(self) if group is None else group
+
+    @property
+    def func(self):
+        """Return the wrapped callback function."""
+        if isinstance(self.callback, CallbackWrapper):
+            return self.callback.func
+        return self.callback
+
+    def __call__(self, *args, **kwargs):
+        dispatcher = self.dispatcher
+        if dispatcher.thread is threading.current_thread():
+            return self.callback(*args, **kwargs)
+        key = (self.group, self.key) if self.coalesce else None
+        dispatcher.post(self.callback, args, kwargs, key=key)
+
+    def __get__(self, instance, owner=None):
+        """Return a queued callback with the callback function bound to the instance."""
+        if instance is None:
+            return self
+        return self.__class__(bind_instance(self.callback, instance), self.dispatcher, self.coalesce, self.group)
+
+    def __repr__(self):
+        return '<{} {!r} {!r}>'.format(self.__class__.__name__, self.callback, self.dispatcher.thread)
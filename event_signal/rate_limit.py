@@ -0,0 +1,344 @@
+"""
+Throttle and debounce callback functions.
+
+A throttled callback function is called at most once every interval. A debounced callback function is called after
+the signal stopped firing for the wait time. Both always call the callback function with the last value.
+
+The delayed calls are run by a scheduler. The default ThreadScheduler runs the calls in a background thread. The
+AsyncioScheduler runs the calls in an asyncio event loop and the ManualScheduler runs the calls when the clock is
+advanced (for tests).
+
+Example:
+
+    .. code-block:: python
+
+        class Sensor(object):
+            value_changed = Signal(float, throttle=0.033)  # Every listener is called at most ~30 times a second
+
+        sensor = Sensor()
+        sensor.value_changed.connect(plot.update)
+        sensor.value_changed.connect(log.write, debounce=1)  # Called after the value did not change for 1 second
+
+        set_scheduler(AsyncioScheduler(loop))  # Run the delayed calls in the asyncio event loop
+"""
+import heapq
+import itertools
+import threading
+import time
+import traceback
+import weakref
+
+from .interface import CallbackWrapper, callback_key, bind_instance
+
+
+__all__ = ['Timer', 'ThreadScheduler', 'AsyncioScheduler', 'ManualScheduler', 'get_scheduler', 'set_scheduler',
+           'RateLimitedCallback', 'Throttle', 'Debounce', 'rate_limit']
+
+
+try:
+    monotonic = time.monotonic
+except AttributeError:  # Python 2
+    monotonic = time.time
+
+
+class Timer(object):
+    """Handle for a function that a scheduler calls later."""
+    __slots__ = ('when', 'func', 'cancelled')
+
+    def __init__(self, when, func):
+        self.when = when
+        self.func = func
+        self.cancelled = False
+
+    def cancel(self):
+        """Do not call the function."""
+        self.cancelled = True
+
+    def run(self):
+        """Call the function if the timer was not cancelled."""
+        if not self.cancelled:
+            self.func()
+
+
+class ManualScheduler(object):
+    """Scheduler with a manual clock. Timers run when the clock is advanced.
+
+    Example:
+
+        .. code-block:: python
+
+            scheduler = ManualScheduler()
+            sig.on("change", callback, throttle=1)
+            with scheduler:  # Use as the default scheduler
+                sig.fire("change", 1)  # Called
+                sig.fire("change", 2)  # Delayed
+                scheduler.advance(1)  # Calls the callback with 2
+    """
+    def __init__(self, now=0.0):
+        self.now = now
+        self.timers = []
+        self.counter = itertools.count()
+        self.previous = None
+
+    def clock(self):
+        """Return the current time of the manual clock."""
+        return self.now
+
+    def call_later(self, delay, func):
+        """Call the function when the clock advanced by delay seconds."""
+        timer = Timer(self.now + delay, func)
+        heapq.heappush(self.timers, (timer.when, next(self.counter), timer))
+        return timer
+
+    def advance(self, seconds=0):
+        """Advance the clock and run all of the timers that are due in order."""
+        end = self.now + seconds
+        while self.timers and self.timers[0][0] <= end:
+            when, _, timer = heapq.heappop(self.timers)
+            self.now = max(self.now, when)
+            timer.run()
+        self.now = end
+
+    def __enter__(self):
+        self.previous = set_scheduler(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        set_scheduler(self.previous)
+        return False
+
+
+class ThreadScheduler(object):
+    """Scheduler that runs the timers in a single background daemon thread."""
+    def __init__(self, clock=monotonic):
+        self.clock = clock
+        self.timers = []
+        self.counter = itertools.count()
+        self.condition = threading.Condition()
+        self.thread = None
+
+    def call_later(self, delay, func):
+        """Call the function in the background thread after delay seconds."""
+        timer = Timer(self.clock() + delay, func)
+        with self.condition:
+            heapq.heappush(self.timers, (timer.when, next(self.counter), timer))
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, name='event_signal scheduler')
+                self.thread.daemon = True
+                self.thread.start()
+            self.condition.notify()
+        return timer
+
+    def run(self):
+        """Run the timers when they are due until `stop()` is called."""
+        current = threading.current_thread()
+        while True:
+            with self.condition:
+                while self.thread is current and (not self.timers or self.timers[0][0] > self.clock()):
+                    timeout = self.timers[0][0] - self.clock() if self.timers else None
+                    self.condition.wait(timeout)
+                if self.thread is not current:
+                    return
+                timer = heapq.heappop(self.timers)[2]
+            try:
+                timer.run()
+            except Exception:
+                traceback.print_exc()
+
+    def stop(self):
+        """Stop the background thread. The timers that are not due are kept until `call_later` starts a new thread."""
+        with self.condition:
+            self.thread = None
+            self.condition.notify_all()
+
+
+class AsyncioScheduler(object):
+    """Scheduler that runs the timers in an asyncio event loop. Timers can be started from any thread."""
+    def __init__(self, loop=None):
+        if loop is None:
+            import asyncio
+            loop = asyncio.get_event_loop()
+        self.loop = loop
+
+    def clock(self):
+        """Return the time of the event loop."""
+        return self.loop.time()
+
+    def call_later(self, delay, func):
+        """Call the function in the event loop after delay seconds."""
+        timer = Timer(self.clock() + delay, func)
+        self.loop.call_soon_threadsafe(self.loop.call_at, timer.when, timer.run)
+        return timer
+
+
+SCHEDULER = None
+
+
+def get_scheduler():
+    """Return the default scheduler. A ThreadScheduler is created the first time it is needed."""
+    global SCHEDULER
+    if SCHEDULER is None:
+        SCHEDULER = ThreadScheduler()
+    return SCHEDULER
+
+
+def set_scheduler(scheduler):
+    """Set the default scheduler for rate limited callback functions. Return the previous scheduler."""
+    global SCHEDULER
+    previous, SCHEDULER = SCHEDULER, scheduler
+    return previous
+
+
+class RateLimitedCallback(CallbackWrapper):
+    """Base class for callback functions that delay calls and only call the callback function with the last value.
+
+    A rate limited callback that is connected to a class level signal is bound to each instance like a method. Every
+    instance gets its own rate limit. Objects that cannot be weak keys keep their rate limit in their own signaler
+    (see `interface.compile_per_instance_dispatch`).
+    """
+    per_instance = True
+
+    def __init__(self, callback, seconds, scheduler=None):
+        """Initialize the rate limited callback.
+
+        Args:
+            callback (callable): Callback function to call.
+            seconds (float): Rate limit time in seconds.
+            scheduler (object)[None]: Scheduler with `clock()` and `call_later(delay, func)` or None to use the
+                default scheduler (see `set_scheduler`).
+        """
+        self.callback = callback
+        self.key = callback_key(callback)
+        self.seconds = seconds
+        self.scheduler = scheduler
+        self.lock = threading.Lock()
+        self.pending = None
+        self.timer = None
+        self.bound = None
+
+    @property
+    def func(self):
+        """Return the wrapped callback function."""
+        if isinstance(self.callback, CallbackWrapper):
+            return self.callback.func
+        return self.callback
+
+    def get_scheduler(self):
+        """Return the scheduler that runs the delayed calls."""
+        return self.scheduler or get_scheduler()
+
+    def flush(self):
+        """Call the callback function with the pending arguments now."""
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            pending, self.pending = self.pending, None
+        if pending is not None:
+            self.callback(*pending[0], **pending[1])
+
+    def __get__(self, instance, owner=None):
+        """Return a rate limited callback for the instance with the callback function bound to the instance."""
+        if instance is None:
+            return self
+        try:
+            if self.bound is None:
+                self.bound = weakref.WeakKeyDictionary()
+            return self.bound[instance]
+        except KeyError:
+            bound = self.bound[instance] = self.__class__(bind_instance(self.callback, instance), self.seconds,
+                                                          self.scheduler)
+            return bound
+        except TypeError:  # Cannot keep track of the instance
+            return self.__class__(bind_instance(self.callback, instance), self.seconds, self.scheduler)
+
+    def __repr__(self):
+        return '<{} {!r} {}s>'.format(self.__class__.__name__, self.callback, self.seconds)
+
+
+class Throttle(RateLimitedCallback):
+    """Call the callback function at most once every interval.
+
+    The first call is made immediately. Calls during the interval are delayed to the end of the interval and only the
+    last arguments are used.
+    """
+    def __init__(self, callback, interval, scheduler=None):
+        super(Throttle, self).__init__(callback, interval, scheduler)
+        self.last = None
+
+    @property
+    def interval(self):
+        """Return the minimum time in seconds between calls."""
+        return self.seconds
+
+    def __call__(self, *args, **kwargs):
+        scheduler = self.get_scheduler()
+        with self.lock:
+            now = scheduler.clock()
+            if self.timer is None and (self.last is None or now - self.last >= self.seconds):
+                self.last = now
+            else:
+                self.pending = (args, kwargs)
+                if self.timer is None:
+                    self.timer = scheduler.call_later(self.last + self.seconds - now, self.run_pending)
+                return
+        self.callback(*args, **kwargs)
+
+    def run_pending(self):
+        """Call the callback function with the last arguments at the end of the interval."""
+        with self.lock:
+            self.timer = None
+            pending, self.pending = self.pending, None
+            if pending is not None:
+                self.last = self.get_scheduler().clock()
+        if pending is not None:
+            self.callback(*pending[0], **pending[1])
+
+
+class Debounce(RateLimitedCallback):
+    """Call the callback function with the last arguments after no calls were made for the wait time."""
+    def __init__(self, callback, wait, scheduler=None):
+        super(Debounce, self).__init__(callback, wait, scheduler)
+        self.deadline = None
+
+    @property
+    def wait(self):
+        """Return the time in seconds without calls before the callback function is called."""
+        return self.seconds
+
+    def __call__(self, *args, **kwargs):
+        scheduler = self.get_scheduler()
+        with self.lock:
+            self.pending = (args, kwargs)
+            self.deadline = scheduler.clock() + self.seconds
+            if self.timer is None:
+                self.timer = scheduler.call_later(self.seconds, self.run_pending)
+
+    def run_pending(self):
+        """Call the callback function with the last arguments if the wait time passed."""
+        scheduler = self.get_scheduler()
+        with self.lock:
+            remaining = self.deadline - scheduler.clock()
+            if remaining > 0:
+                # Called again while waiting
+                self.timer = scheduler.call_later(remaining, self.run_pending)
+                return
+            self.timer = None
+            pending, self.pending = self.pending, None
+        if pending is not None:
+            self.callback(*pending[0], **pending[1])
+
+
+def rate_limit(func, throttle=None, debounce=None, scheduler=None):
+    """Return the callback function wrapped in a Throttle or Debounce. The function is returned if both are None.
+
+    Raises:
+        ValueError: If both throttle and debounce are given.
+    """
+    if throttle is not None and debounce is not None:
+        raise ValueError("Give either throttle or debounce, not both.")
+    elif throttle is not None:
+        return Throttle(func, throttle, scheduler)
+    elif debounce is not None:
+        return Debounce(func, debounce, scheduler)
+    return func
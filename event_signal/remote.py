@@ -0,0 +1,325 @@
+"""
+Emit signals in other processes.
+
+A SignalBridge connects two processes through a `multiprocessing.Pipe` connection or a Unix domain socket. Emitting a
+RemoteSignal queues the message. The messages are pickled in batches and written as length prefixed frames when the
+batch is full or the flush interval passed. The other process re-emits every message through a local CallbackManager.
+
+Warning:
+    Messages are pickled. Only connect processes that trust each other.
+
+Example:
+
+    .. code-block:: python
+
+        def worker(conn):
+            bridge = SignalBridge(conn)
+            progress = bridge.remote("progress")
+            for i in range(100):
+                progress.emit(i)
+            bridge.close()
+
+        parent, child = multiprocessing.Pipe()
+        multiprocessing.Process(target=worker, args=(child,)).start()
+
+        bridge = SignalBridge(parent)
+        bridge.signal("progress").connect(print)
+        bridge.start()  # Receive and emit the signals in a background thread
+"""
+import pickle
+import struct
+import threading
+import traceback
+
+from .rate_limit import ThreadScheduler
+from .signal_qt import CallbackManager
+
+
+__all__ = ['encode_frame', 'FrameDecoder', 'ConnectionTransport', 'SocketTransport', 'make_transport',
+           'RemoteSignal', 'SignalBridge']
+
+
+HEADER = struct.Struct('!I')
+"""Frame header with the length of the payload."""
+
+
+def dumps(messages):
+    """Pickle a batch of messages with the highest protocol."""
+    return pickle.dumps(messages, pickle.HIGHEST_PROTOCOL)
+
+
+def encode_frame(messages, dumps=dumps):
+    """Return a length prefixed frame for a batch of (name, args, kwargs) messages."""
+    payload = dumps(messages)
+    return HEADER.pack(len(payload)) + payload
+
+
+class FrameDecoder(object):
+    """Split a stream of bytes into length prefixed frames."""
+
+    def __init__(self, loads=pickle.loads):
+        self.loads = loads
+        self.buffer = bytearray()
+
+    def feed(self, data):
+        """Add received bytes. Return the list of message batches for every complete frame.
+
+        Frames that cannot be decoded are printed and skipped, so they do not stop the frames after them.
+        """
+        buffer = self.buffer
+        buffer.extend(data)
+        batches = []
+        start = 0
+        size = HEADER.size
+        while len(buffer) - start >= size:
+            length = HEADER.unpack_from(buffer, start)[0]
+            end = start + size + length
+            if end > len(buffer):
+                break
+            payload = bytes(buffer[start + size:end])
+            start = end
+            try:
+                batches.append(self.loads(payload))
+            except Exception:
+                traceback.print_exc()
+        del buffer[:start]
+        return batches
+
+
+class ConnectionTransport(object):
+    """Send and receive bytes with a `multiprocessing.connection.Connection` (see `multiprocessing.Pipe`)."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def send(self, data):
+        self.conn.send_bytes(data)
+
+    def recv(self):
+        """Return the received bytes or b'' if the connection was closed."""
+        try:
+            return self.conn.recv_bytes()
+        except (EOFError, OSError):
+            return b''
+
+    def close(self):
+        self.conn.close()
+
+
+class SocketTransport(object):
+    """Send and receive bytes with a stream socket (like a Unix domain socket or `socket.socketpair()`)."""
+
+    def __init__(self, sock, bufsize=65536):
+        self.sock = sock
+        self.bufsize = bufsize
+
+    def send(self, data):
+        self.sock.sendall(data)
+
+    def recv(self):
+        """Return the received bytes or b'' if the connection was closed."""
+        try:
+            return self.sock.recv(self.bufsize)
+        except OSError:
+            return b''
+
+    def close(self):
+        self.sock.close()
+
+
+def make_transport(obj):
+    """Return a transport for a multiprocessing connection or a socket. Transports are returned as is."""
+    if hasattr(obj, 'send_bytes'):
+        return ConnectionTransport(obj)
+    elif hasattr(obj, 'sendall'):
+        return SocketTransport(obj)
+    return obj
+
+
+class RemoteSignal(object):
+    """Signal that is emitted in the process on the other side of a SignalBridge."""
+    __slots__ = ('name', 'bridge')
+
+    def __init__(self, name, bridge):
+        self.name = name
+        self.bridge = bridge
+
+    def emit(self, *args, **kwargs):
+        """Send the signal to the other process."""
+        self.bridge.send(self.name, args, kwargs)
+
+    __call__ = emit
+
+    def __repr__(self):
+        return '<{} {!r}>'.format(self.__class__.__name__, self.name)
+
+
+class SignalBridge(object):
+    """Send signals to and receive signals from another process.
+
+    Sent messages are batched. A batch is written when it has `batch_size` messages or `flush_interval` seconds after
+    the first message was queued. The flush timer runs in the bridge's own scheduler thread, so a write that blocks
+    does not stall the rate limited callbacks of the process. Received messages are emitted by the CallbackManager
+    for their name (see `signal`).
+    """
+
+    def __init__(self, conn, flush_interval=0.001, batch_size=256, dispatcher=None, dumps=dumps, loads=pickle.loads,
+                 scheduler=None):
+        """Initialize the bridge.
+
+        Args:
+            conn (object): multiprocessing connection, stream socket, or transport with `send(data)` and `recv()`.
+            flush_interval (float)[0.001]: Seconds to wait for more messages before writing a batch. 0 or None
+                writes every message immediately.
+            batch_size (int)[256]: Write the batch when it has this many messages.
+            dispatcher (Dispatcher)[None]: Emit the received signals in the dispatcher's thread (see `queued`).
+                None emits them in the thread that receives them.
+            dumps (callable)[dumps]: Serialize a list of messages.
+            loads (callable)[pickle.loads]: Deserialize a list of messages.
+            scheduler (object)[None]: Scheduler for the flush timer. None creates a ThreadScheduler for this bridge
+                when it is first needed. `close()` stops it.
+        """
+        self.transport = make_transport(conn)
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.dispatcher = dispatcher
+        self.dumps = dumps
+        self.decoder = FrameDecoder(loads)
+        self.scheduler = scheduler
+        self.owns_scheduler = False
+        self.signals = {}
+        self.lock = threading.Lock()  # Pending messages
+        self.write_condition = threading.Condition(threading.Lock())  # Writes the frames in ticket order
+        self.next_ticket = 0  # Ticket of the next batch that is taken from pending
+        self.written = 0  # Ticket of the next frame that is written
+        self.pending = []
+        self.timer = None
+        self.thread = None
+        self.closed = False
+
+    # ========== Send ==========
+    def remote(self, name):
+        """Return a RemoteSignal that emits the named signal in the other process."""
+        return RemoteSignal(name, self)
+
+    def forward(self, signal, name):
+        """Send every emit of a local signal (Signal or CallbackManager) to the other process.
+
+        Args:
+            signal (CallbackManager): Local signal to forward.
+            name (str): Name of the signal in the other process.
+        """
+        remote = self.remote(name)
+        signal.connect(remote.emit)
+        return remote
+
+    def send(self, name, args=(), kwargs=None):
+        """Queue a signal message. The batch is written when it is full or the flush interval passed."""
+        with self.lock:
+            self.pending.append((name, args, kwargs or None))
+            if len(self.pending) < self.batch_size and self.flush_interval:
+                if self.timer is None:
+                    self.timer = self.get_scheduler().call_later(self.flush_interval, self.flush)
+                return
+        self.flush()
+
+    def get_scheduler(self):
+        """Return the scheduler of the flush timer. Called by `send()` with the lock."""
+        if self.scheduler is None:
+            self.scheduler = ThreadScheduler()
+            self.owns_scheduler = True
+        return self.scheduler
+
+    def flush(self):
+        """Write the queued messages as one frame.
+
+        Every batch gets a ticket when it is taken from the pending messages, so the frames are written in order. The
+        write does not hold the lock, so `send()` can queue new messages while a frame is written.
+        """
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            if not self.pending:
+                return
+            messages, self.pending = self.pending, []
+            ticket = self.next_ticket
+            self.next_ticket += 1
+
+        with self.write_condition:
+            while self.written != ticket:
+                self.write_condition.wait()
+            try:
+                self.transport.send(encode_frame(messages, self.dumps))
+            finally:
+                self.written += 1
+                self.write_condition.notify_all()
+
+    # ========== Receive ==========
+    def signal(self, name):
+        """Return the local CallbackManager that emits the named signal when a message is received."""
+        try:
+            return self.signals[name]
+        except KeyError:
+            return self.signals.setdefault(name, CallbackManager())
+
+    def receive(self):
+        """Receive available messages and emit their signals. Return the number of messages or None when closed.
+
+        Errors of the callback functions are printed, so the other received messages are still emitted.
+        """
+        data = self.transport.recv()
+        if not data:
+            return None
+        count = 0
+        signals = self.signals
+        dispatcher = self.dispatcher
+        for messages in self.decoder.feed(data):
+            count += len(messages)
+            for name, args, kwargs in messages:
+                sig = signals.get(name, None)
+                if sig is None:
+                    continue  # Nobody is listening
+                try:
+                    if dispatcher is not None:
+                        dispatcher.post(sig.emit, args, kwargs)
+                    elif kwargs:
+                        sig.emit(*args, **kwargs)
+                    else:
+                        sig.emit(*args)
+                except Exception:
+                    traceback.print_exc()
+        return count
+
+    def run(self):
+        """Receive messages and emit their signals until the connection is closed. Errors are printed."""
+        while not self.closed:
+            try:
+                if self.receive() is None:
+                    break
+            except Exception:
+                traceback.print_exc()
+
+    def start(self):
+        """Start a daemon thread that receives the messages (see `run()`). Return the thread."""
+        self.thread = threading.Thread(target=self.run, name='event_signal bridge')
+        self.thread.daemon = True
+        self.thread.start()
+        return self.thread
+
+    def close(self):
+        """Write the queued messages and close the connection."""
+        try:
+            self.flush()
+        finally:
+            self.closed = True
+            self.transport.close()
+            if self.owns_scheduler:
+                self.scheduler.stop()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
@@ -0,0 +1,394 @@
+"""
+Share numeric signaler_property values between processes.
+
+The values of shared_property fields are stored in a `multiprocessing.shared_memory` block instead of the object. Every
+field has a sequence counter that the writer increments before and after writing the value (a sequence lock), so a
+reader never sees a partially written value. A watcher thread polls the field counters and fires the 'change' signal
+for the fields that were written by another process. Values are never pickled.
+
+The block also has a global sequence counter that is incremented for every write. Incrementing it is not atomic, so
+two processes that write at the same time can lose an increment. It is only used to skip the field counters when every
+process writes with the same lock.
+
+Warning:
+    Only one process should write a field at a time. Give the same `multiprocessing.Lock` to every process if multiple
+    processes write the same field. The lock also lets a poll read the single global counter when nothing changed.
+
+Example:
+
+    .. code-block:: python
+
+        class Model(object):
+            x = shared_property('d')
+            count = shared_property('q', default=0)
+
+        # Process 1
+        model = Model()
+        state = share_state(model, 'model_state')
+        model.x = 1.5
+
+        # Process 2
+        model = Model()
+        state = share_state(model, 'model_state')
+        Model.x.on(model, 'change', print)
+        state.start()  # Poll every 0.005 seconds and fire 'change' for the values that were set in other processes
+"""
+import struct
+import threading
+import time
+import traceback
+import weakref
+from future.utils import raise_from
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python < 3.8
+    shared_memory = None
+
+from .signaler_prop import signaler_property
+
+
+__all__ = ['shared_property', 'SharedState', 'share_state', 'get_shared_state', 'shared_fields']
+
+
+SEQUENCE = struct.Struct('Q')
+"""Sequence counter at the start of the block and in front of every value."""
+
+
+def align(size, alignment=8):
+    """Return the size rounded up to the alignment."""
+    return (size + alignment - 1) // alignment * alignment
+
+
+class shared_property(signaler_property):
+    """signaler_property that stores a single numeric value in the shared memory of the object's SharedState.
+
+    Example:
+
+        .. code-block:: python
+
+            class Model(object):
+                x = shared_property('d')
+                enabled = shared_property('?', default=True)
+
+                @x.on('change')
+                def x_changed(self, value):
+                    print('x changed', value)
+
+            model = Model()
+            share_state(model, 'model_state')
+    """
+    def __init__(self, fmt='d', default=0, doc=None, check_change=True, throttle=None, debounce=None):
+        """Initialize the shared property.
+
+        Args:
+            fmt (str)['d']: struct format of the single value (like 'd', 'f', 'q', 'i', 'B', or '?').
+            default (object)[0]: Value of the field when the shared memory is created.
+            doc (str)[None]: Documentation for the property
+            check_change (bool/str/callable)[True]: Only set the value and fire the signals if the value is different
+                (see `get_change_check`).
+            throttle (float)[None]: Fire the 'change' signal at most once every throttle seconds with the last value.
+            debounce (float)[None]: Fire the 'change' signal with the last value after the value did not change for
+                debounce seconds.
+
+        Raises:
+            ValueError: If the format does not pack exactly one value.
+        """
+        self.struct = struct.Struct(fmt)
+        if len(self.struct.unpack(bytes(self.struct.size))) != 1:
+            raise ValueError('The shared_property format must pack a single value, not {!r}'.format(fmt))
+        self.default = default
+        self.field_name = None
+        # The value read back could differ from the value written (like a float packed as 'f'), so it is not verbatim
+        super(shared_property, self).__init__(self.read, self.write, None, doc=doc, check_change=check_change,
+                                              throttle=throttle, debounce=debounce)
+
+    def __set_name__(self, owner, name):
+        """Store the field name of the shared value."""
+        super(shared_property, self).__set_name__(owner, name)
+        self.field_name = self.__name__ = name
+
+    def read(self, instance):
+        """Return the value from the instance's shared memory."""
+        return get_shared_state(instance).read(self)
+
+    def write(self, instance, value):
+        """Write the value to the instance's shared memory."""
+        get_shared_state(instance).write(self, value)
+
+    def getter(self, fget):
+        raise TypeError('A shared_property stores its own value. It cannot have a getter.')
+
+    def setter(self, fset):
+        raise TypeError('A shared_property stores its own value. It cannot have a setter.')
+
+    def deleter(self, fdel):
+        raise TypeError('A shared_property value cannot be deleted.')
+
+
+SHARED_FIELDS = weakref.WeakKeyDictionary()
+
+
+def shared_fields(cls):
+    """Return a list of (name, shared_property) for the class in the order that they were defined."""
+    try:
+        return SHARED_FIELDS[cls]
+    except KeyError:
+        pass
+    fields = {}
+    for klass in reversed(cls.__mro__):
+        for name, value in vars(klass).items():
+            if isinstance(value, shared_property):
+                fields[name] = value
+            else:
+                fields.pop(name, None)  # Overridden by a regular attribute
+    fields = SHARED_FIELDS[cls] = list(fields.items())
+    return fields
+
+
+class SharedState(object):
+    """Shared memory block that stores the shared_property values of an object.
+
+    Layout: The global sequence counter followed by a sequence counter and the value of every field. Every counter and
+    value is 8 byte aligned.
+    """
+
+    def __init__(self, obj, name=None, create=None, lock=None, read_timeout=1.0):
+        """Create or attach to the shared memory block.
+
+        Args:
+            obj (object): Object with shared_property fields (or its class).
+            name (str)[None]: Name of the shared memory block. None creates a block with a unique name.
+            create (bool)[None]: Create a new block. None attaches to an existing block or creates it if it does not
+                exist.
+            lock (multiprocessing.Lock)[None]: Lock that all processes take to write a value.
+            read_timeout (float)[1.0]: Seconds that a read waits for a field that is being written.
+        """
+        if shared_memory is None:
+            raise RuntimeError('multiprocessing.shared_memory requires Python 3.8+')
+
+        self.obj = None  # weakref to the object that fires the signals (see share_state)
+        self.fields = shared_fields(obj if isinstance(obj, type) else obj.__class__)
+        self.offsets = {}
+        size = SEQUENCE.size
+        for _, prop in self.fields:
+            self.offsets[prop] = size
+            size += SEQUENCE.size + align(prop.struct.size)
+
+        self.created = False
+        if name is None or create:
+            self.memory = shared_memory.SharedMemory(name, True, size)
+            self.created = True
+        elif create is False:
+            self.memory = self.attach(name)
+        else:
+            try:
+                self.memory = self.attach(name)
+            except FileNotFoundError:
+                try:
+                    self.memory = shared_memory.SharedMemory(name, True, size)
+                    self.created = True
+                except FileExistsError:  # Another process created it first
+                    self.memory = self.attach(name)
+        if self.memory.size < size:
+            self.memory.close()
+            raise ValueError('The shared memory {!r} is too small for the fields'.format(self.memory.name))
+
+        self.buf = self.memory.buf
+        self.lock = lock
+        self.read_timeout = read_timeout
+        self.local_lock = threading.Lock()
+        self.sequence = 0
+        self.seen = {}
+        self.thread = None
+        self.stopped = threading.Event()
+        self.dispatcher = None
+        if self.created:
+            for _, prop in self.fields:
+                prop.struct.pack_into(self.buf, self.offsets[prop] + SEQUENCE.size, prop.default)
+        self.sequence = SEQUENCE.unpack_from(self.buf, 0)[0]
+        for _, prop in self.fields:
+            self.seen[prop] = SEQUENCE.unpack_from(self.buf, self.offsets[prop])[0]
+
+    @staticmethod
+    def attach(name):
+        """Attach to an existing shared memory block.
+
+        Python 3.13+ does not track the attached block, so only the process that created the block unlinks it.
+
+        Warning:
+            Before Python 3.13 the resource tracker of the attaching process also registers the block. A process that
+            was not started by the creating process (with its own resource tracker) unlinks the block when it exits.
+            Processes started with multiprocessing share the creator's resource tracker and do not unlink it.
+        """
+        try:
+            return shared_memory.SharedMemory(name, track=False)  # Python 3.13+
+        except TypeError:
+            return shared_memory.SharedMemory(name)
+
+    @property
+    def name(self):
+        """Return the name of the shared memory block that other processes attach to."""
+        return self.memory.name
+
+    def read(self, prop):
+        """Return the value of the field.
+
+        Raises:
+            TimeoutError: If the field is being written for more than `read_timeout` seconds. A writer process may
+                have died while it was writing the field.
+        """
+        buf = self.buf
+        offset = self.offsets[prop]
+        unpack_sequence = SEQUENCE.unpack_from
+        deadline = None
+        while True:
+            sequence = unpack_sequence(buf, offset)[0]
+            if sequence & 1:
+                # Writing
+                if deadline is None:
+                    deadline = time.monotonic() + self.read_timeout
+                elif time.monotonic() > deadline:
+                    raise TimeoutError('The shared field {!r} is still being written after {} seconds. A writer '
+                                       'process may have stopped while writing.'.format(prop.field_name,
+                                                                                        self.read_timeout))
+                time.sleep(0)
+                continue
+            value = prop.struct.unpack_from(buf, offset + SEQUENCE.size)[0]
+            if unpack_sequence(buf, offset)[0] == sequence:
+                return value
+
+    def write(self, prop, value):
+        """Write the value of the field and increment the sequence counters."""
+        buf = self.buf
+        offset = self.offsets[prop]
+        lock = self.lock
+        if lock is not None:
+            lock.acquire()
+        try:
+            with self.local_lock:
+                sequence = SEQUENCE.unpack_from(buf, offset)[0] | 1
+                SEQUENCE.pack_into(buf, offset, sequence)
+                prop.struct.pack_into(buf, offset + SEQUENCE.size, value)
+                SEQUENCE.pack_into(buf, offset, sequence + 1)
+                SEQUENCE.pack_into(buf, 0, SEQUENCE.unpack_from(buf, 0)[0] + 1)
+                self.seen[prop] = sequence + 1  # This process already fired the signals
+        finally:
+            if lock is not None:
+                lock.release()
+
+    # ========== Watch the other processes ==========
+    def changes(self):
+        """Return a list of (shared_property, value) for the fields that other processes wrote since the last call.
+
+        Without a lock two writers can lose an increment of the global counter, so every field counter is checked.
+        """
+        buf = self.buf
+        sequence = SEQUENCE.unpack_from(buf, 0)[0]
+        if sequence == self.sequence and self.lock is not None:
+            return []  # Nothing changed
+
+        changed = []
+        with self.local_lock:
+            self.sequence = sequence
+            seen = self.seen
+            for _, prop in self.fields:
+                field_sequence = SEQUENCE.unpack_from(buf, self.offsets[prop])[0]
+                if field_sequence != seen[prop] and not field_sequence & 1:
+                    seen[prop] = field_sequence
+                    changed.append(prop)
+                elif field_sequence & 1:
+                    self.sequence = None  # Check this field again on the next poll
+        return [(prop, self.read(prop)) for prop in changed]
+
+    def poll(self):
+        """Fire the 'change' signal for the fields that other processes wrote. Return the number of changed fields."""
+        obj = self.obj() if self.obj is not None else None
+        changed = self.changes()
+        if obj is None:
+            return len(changed)
+        for prop, value in changed:
+            sig = prop.get_signaler_instance(obj)
+            fire = sig.fire_change if sig.limiter is None else sig.limiter
+            if self.dispatcher is not None:
+                self.dispatcher.post(fire, (value,))
+            else:
+                fire(value)
+        return len(changed)
+
+    def run(self, interval=0.005):
+        """Poll for changes until `stop()` is called. Errors are printed."""
+        while not self.stopped.wait(interval):
+            try:
+                self.poll()
+            except Exception:
+                traceback.print_exc()
+
+    def start(self, interval=0.005, dispatcher=None):
+        """Start a daemon thread that polls for changes from other processes (see `run()`). Return the thread.
+
+        Args:
+            interval (float)[0.005]: Seconds between polls. With a lock a poll reads a single counter when nothing
+                changed.
+            dispatcher (Dispatcher)[None]: Fire the 'change' signals in the dispatcher's thread (see `queued`).
+        """
+        self.dispatcher = dispatcher
+        self.stopped.clear()
+        self.thread = threading.Thread(target=self.run, args=(interval,), name='event_signal shared state')
+        self.thread.daemon = True
+        self.thread.start()
+        return self.thread
+
+    def stop(self):
+        """Stop the polling thread."""
+        self.stopped.set()
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join()
+        self.thread = None
+
+    def close(self):
+        """Stop polling and close this process' access to the shared memory."""
+        self.stop()
+        self.buf = None
+        self.memory.close()
+
+    def unlink(self):
+        """Remove the shared memory block. Call this once after every process closed it."""
+        self.memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+def share_state(obj, name=None, create=None, lock=None, read_timeout=1.0):
+    """Store the object's shared_property values in shared memory. Return the SharedState.
+
+    Args:
+        obj (object): Object with shared_property fields.
+        name (str)[None]: Name of the shared memory block. None creates a block with a unique name.
+        create (bool)[None]: Create a new block. None attaches to an existing block or creates it if it does not exist.
+        lock (multiprocessing.Lock)[None]: Lock that all processes take to write a value.
+        read_timeout (float)[1.0]: Seconds that a read waits for a field that is being written.
+    """
+    state = SharedState(obj, name=name, create=create, lock=lock, read_timeout=read_timeout)
+    state.obj = weakref.ref(obj)  # The polling thread does not keep the object alive
+    obj.__shared_state__ = state
+    return state
+
+
+def get_shared_state(obj):
+    """Return the object's SharedState.
+
+    Raises:
+        AttributeError: If `share_state` was not called for the object.
+    """
+    try:
+        return obj.__shared_state__
+    except AttributeError as error:
+        err = AttributeError('{!r} object has no shared state. Call share_state(obj) first'.format(
+            obj.__class__.__name__))
+        raise_from(err, error)
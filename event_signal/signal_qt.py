@@ -5,7 +5,8 @@ multiple functions called from one function call. This class was made for that s
 The main difference between Qt's Signal and this class is that this class does not call the 
 connected callback functions in the main thread. It calls all of the functions in the thread that
 called the function (or used CallbackManager().emit()). If you are using this signal in a separate thread to update
-a gui item it will fail with a pixmap error.
+a gui item it will fail with a pixmap error. Connect with `connect(func, dispatcher=True)` to queue the calls from
+other threads until the connecting thread calls `process_events()` (like Qt's QueuedConnection).
 
 Example:
 
@@ -62,7 +63,9 @@ How it works:
     The above like of code first gets a CallbackManager with `my_class.something_happened`. The
     `.connect(function)` is calling the CallbackManager's 'connect' method.  
 """
-from .interface import SignalerInstance, SignalerDescriptorInstance
+from .interface import SignalerInstance, SignalerDescriptorInstance, update_dispatch, CHANGE, SIGNALER_SLOTS
+from .rate_limit import rate_limit
+from .executor import submit_callbacks
 
 
 __all__ = ["Signal"]
@@ -72,18 +75,62 @@ class CallbackManager(SignalerInstance):
     """The CallbackManager class holds a collection of callback functions. The callback functions are
     called when an emit is called. This class does not need to be used directly, use Signal instead.
     """
+    __slots__ = SIGNALER_SLOTS + ('args', 'kwargs', 'limiter', 'executor')
 
     def __init__(self, *args, **kwargs):
         super(CallbackManager, self).__init__()
 
-        self.event_signals["change"] = []
+        self.event_signals["change"] = ()
         self.args = args
         self.kwargs = kwargs
+        self.limiter = None
+        self.executor = None
     # enc Constructor
 
-    def connect(self, func):
-        """Add a callback function to be called when an event happens."""
-        return self.on("change", func)
+    def set_rate_limit(self, throttle=None, debounce=None):
+        """Rate limit emitting the signal. The callback functions are always called with the last emitted values.
+
+        Args:
+            throttle (float)[None]: Call the callback functions at most once every throttle seconds.
+            debounce (float)[None]: Call the callback functions after the signal was not emitted for debounce seconds.
+        """
+        fire_change = self.fire_change
+        limiter = rate_limit(fire_change, throttle=throttle, debounce=debounce)
+        self.limiter = None if limiter is fire_change else limiter
+
+    def fire_change(self, *args, **kwargs):
+        """Call all of the callback functions without the rate limit.
+
+        Returns:
+            futures (list)[None]: Futures of the callback functions if the signal or a connection uses an executor.
+        """
+        if self.executor is not None:
+            return submit_callbacks(self.executor, self.get_callers("change"), args, kwargs)
+        dispatch = self.event_dispatch.builtin[CHANGE]
+        if dispatch is None:
+            dispatch = update_dispatch(self, "change")
+        if getattr(dispatch, 'returns_future', False):
+            return dispatch(*args, **kwargs)  # Futures of the connections with an executor
+        dispatch(*args, **kwargs)
+
+    def connect(self, func, weak=False, throttle=None, debounce=None, executor=None, dispatcher=None, coalesce=False):
+        """Add a callback function to be called when an event happens.
+
+        Args:
+            func (callable): Callback function.
+            weak (bool)[False]: Only keep a weak reference to the callback function. The callback is removed when the
+                function (or the instance of a bound method) is deleted.
+            throttle (float)[None]: Call the callback function at most once every throttle seconds.
+            debounce (float)[None]: Call the callback function after the signal was not emitted for debounce seconds.
+            executor (concurrent.futures.Executor)[None]: Submit the callback function to this executor instead of
+                calling it in the thread that emits the signal.
+            dispatcher (Dispatcher/threading.Thread/bool)[None]: Call the callback function in the dispatcher's
+                thread like Qt's QueuedConnection. Emits from other threads are queued until the dispatcher's thread
+                calls `process_events()`. True uses the current thread's dispatcher.
+            coalesce (bool)[False]: Only keep the latest queued call of a dispatcher connection.
+        """
+        return self.on("change", func, weak=weak, throttle=throttle, debounce=debounce, executor=executor,
+                       dispatcher=dispatcher, coalesce=coalesce)
     # end connect
 
     def disconnect(self, func=None):
@@ -139,13 +186,31 @@ class CallbackManager(SignalerInstance):
     # end check_arguments
         
     def emit(self, *args, **kwargs):
-        """Trigger the event (Call all of the CallbackManager's functions)."""
-        return self.fire("change", *args, **kwargs)
+        """Trigger the event (Call all of the CallbackManager's functions).
+
+        Returns:
+            futures (list)[None]: Futures of the callback functions if the signal or a connection uses an executor.
+        """
+        limiter = self.limiter
+        if limiter is not None:
+            return limiter(*args, **kwargs)
+        return self.fire_change(*args, **kwargs)
     # end emit
 
-    def __call__(self, *args, **kwargs):
-        """Trigger the event (Call all of the CallbackManager's functions)."""
-        return self.fire("change", *args, **kwargs)
+    __call__ = emit
+
+    def emit_async(self, *args, concurrent=True, limit=None, **kwargs):
+        """Return a coroutine that calls all of the callback functions and awaits the coroutine callback functions.
+
+        The rate limit of the signal (throttle or debounce) is not used.
+
+        Args:
+            *args: Arguments to pass to the callback functions
+            concurrent (bool)[True]: If False await each coroutine callback before the next callback is called.
+            limit (int)[None]: Maximum number of coroutine callbacks that run at the same time.
+            **kwargs: Named arguments to pass to the callback functions
+        """
+        return self.fire_async("change", *args, concurrent=concurrent, limit=limit, **kwargs)
 # end class CallbackManager
 
 
@@ -178,16 +243,40 @@ class Signal(SignalerDescriptorInstance):
     
             something_happened("This also happened!")
             something_happened.emit("This happened!") # alias for __call__ to emulate Qt Signal
+
+            # ========== Rate limited Signal ==========
+            class Sensor:
+                value_changed = Signal(float, throttle=0.033)  # Call the callbacks at most ~30 times a second
+                recorded = Signal(float, executor=ThreadPoolExecutor(4))  # Call the callbacks in a thread pool
     """
 
-    def __init__(self, *args):
+    def __init__(self, *args, **kwargs):
+        """Initialize the Signal.
+
+        Args:
+            *args: Argument types of the signal.
+            throttle (float)[None]: Call the callback functions at most once every throttle seconds.
+            debounce (float)[None]: Call the callback functions after the signal was not emitted for debounce seconds.
+            executor (concurrent.futures.Executor)[None]: Submit the callback functions to this executor. Emitting
+                the signal returns a list of futures and never waits for the callback functions.
+        """
         super(Signal, self).__init__()
         self.args = args
+        self.throttle = kwargs.pop('throttle', None)
+        self.debounce = kwargs.pop('debounce', None)
+        self.executor = kwargs.pop('executor', None)
+        if kwargs:
+            raise TypeError("Signal() got an unexpected keyword argument {!r}".format(next(iter(kwargs))))
+        if self.throttle is not None and self.debounce is not None:
+            raise ValueError("Give either throttle or debounce, not both.")
     # end Constructor
 
     def create_signaler_instance(self, instance=None):
         """Create and return a signaler instance."""
         sig = CallbackManager(*self.args)
+        sig.executor = self.executor
+        if self.throttle is not None or self.debounce is not None:
+            sig.set_rate_limit(throttle=self.throttle, debounce=self.debounce)
         # sig.name = self.name
         return sig
 
@@ -225,15 +314,20 @@ class Signal(SignalerDescriptorInstance):
                 m.something_happened # returns the instance's CallbackManager allowing
                 # `m.something_happened()` and `m.something_happened.connect(function)` 
         """
+        if self.storage_name is not None and not self.storage_empty:
+            sig = getattr(instance, self.storage_name, None)  # Stored instance signaler (see __set_name__)
+            if sig is not None:
+                return sig
         return self.get_signaler_instance(instance)
     # end __get__
     # ========== END Using Signal as a class decorator (Recommended) ==========
 
     # ========== Using Signal as a function ==========
-    def connect(self, func):
+    def connect(self, func, weak=False, throttle=None, debounce=None, executor=None, dispatcher=None, coalesce=False):
         """Connect a function to this Signal instance."""
         cmngr = self.get_signaler_instance(self)
-        return cmngr.connect(func)
+        return cmngr.connect(func, weak=weak, throttle=throttle, debounce=debounce, executor=executor,
+                             dispatcher=dispatcher, coalesce=coalesce)
     # end connect
     
     def disconnect(self, func):
@@ -252,6 +346,12 @@ class Signal(SignalerDescriptorInstance):
         return self.__call__(*args, **kwargs)
     # end emit
     
+    def emit_async(self, *args, concurrent=True, limit=None, **kwargs):
+        """Return a coroutine that calls this Signal instance event handler functions and awaits the coroutines."""
+        cmngr = self.get_signaler_instance(self)
+        return cmngr.emit_async(*args, concurrent=concurrent, limit=limit, **kwargs)
+    # end emit_async
+
     def __call__(self, *args, **kwargs):
         """Emit and call this Signal instance event handler functions."""
         cmngr = self.get_signaler_instance(self)
@@ -1,28 +1,43 @@
-from .interface import SignalerInstance, SignalerDescriptorInstance, copy_signals_as_bound
+import inspect
+import types
+
+from .interface import SignalerInstance, SignalerDescriptorInstance, BoundSignalerInstance, \
+    update_dispatch, get_bound_dispatch, get_bound_dispatch_table, instance_caller, bind_instance, fire_nothing, \
+    BEFORE_CHANGE, CHANGE, defer_signal, BATCH_STATE, SIGNAL_LOCK, SIGNALER_SLOTS, BOUND_SIGNALER_SLOTS
 from .signaler_prop import signaler_property
 
 
-__all__ = ["signaler", "SignalerDecoratorInstance"]
+__all__ = ["signaler", "SignalerDecoratorBase", "SignalerDecoratorInstance", "BoundSignalerDecoratorInstance",
+           "bound_signaler_class"]
+
+
+FUNC_METADATA = ('__name__', '__qualname__', '__annotations__', '__wrapped__')
 
 
-class SignalerDecoratorInstance(SignalerDescriptorInstance):
-    def __init__(self, func=None, getter=None, fire_results=False):
+class SignalerDecoratorBase(SignalerDescriptorInstance):
+    """Function methods that fire the before_change and change signals. This class does not have any storage."""
+    __slots__ = ()
+
+    def __init__(self, func=None, getter=None, fire_results=False, executor=None):
         """Decorate a function to emit signals.
 
         Args:
             func (callable)[None]: Callable function that you want to decorate.
             getter (callable)[None]: Takes no arguments and returns a single argument that is used when firing
                 the change signal.
+            executor (concurrent.futures.Executor)[None]: Submit the 'change' callback functions to this executor, so
+                calling the function does not wait for them. Use as `@signaler(executor=pool)`.
         """
         self._func = None
 
-        super(SignalerDecoratorInstance, self).__init__()
+        super(SignalerDecoratorBase, self).__init__()
 
         self.func = func
         self.getter = getter
         self.fire_results = fire_results
-        self.event_signals["before_change"] = []
-        self.event_signals["change"] = []
+        self.executor = executor
+        self.event_signals["before_change"] = ()
+        self.event_signals["change"] = ()
 
     @property
     def func(self):
@@ -32,45 +47,47 @@ class SignalerDecoratorInstance(SignalerDescriptorInstance):
     def func(self, func):
         self._func = func
 
-    def _update_func(self):
-        try:
-            self.__module__ = self._func.__module__
-        except AttributeError:
-            pass
-        try:
-            self.__name__ = self._func.__name__
-        except AttributeError:
-            pass
-        try:
-            self.__qualname__ = self._func.__qualname__
-        except AttributeError:
-            pass
-        try:
-            self.__doc__ = self._func.__doc__
-        except AttributeError:
-            pass
-        try:
-            self.__annotations__ = self._func.__annotations__
-        except AttributeError:
-            pass
+    def on(self, signal_type, func=None, weak=False, throttle=None, debounce=None, executor=None, dispatcher=None,
+           coalesce=False):
+        """Connect a callback function to a signal. If a function is not given then a decorator function is returned.
+
+        The 'change' callback functions are submitted to the signaler's executor if it has one.
+        """
+        if executor is None and signal_type == "change":
+            executor = self.executor
+        return super(SignalerDecoratorBase, self).on(signal_type, func, weak=weak, throttle=throttle,
+                                                     debounce=debounce, executor=executor, dispatcher=dispatcher,
+                                                     coalesce=coalesce)
 
     def __call__(self, *args, **kwargs):
-        if self.func is None and callable(args[0]):
+        func = self._func
+        if func is None and callable(args[0]):
             # Decorating a function
             self.func = args[0]
             return self
         else:
             # Calling this class
-            self.fire("before_change", *args, **kwargs)
-            ret = self.func(*args, **kwargs)
-
-            if self.getter is None:
-                if self.fire_results:
-                    self.fire("change", ret)
-                else:
-                    self.fire("change", *args, **kwargs)
-            else:
-                self.fire("change", self.getter())
+            dispatch = self.event_dispatch.builtin
+            before_change = dispatch[BEFORE_CHANGE]
+            if before_change is None:
+                before_change = update_dispatch(self, "before_change")
+            change = dispatch[CHANGE]
+            if change is None:
+                change = update_dispatch(self, "change")
+
+            # Nobody is listening. Do not build the signal arguments or call the getter
+            if before_change is fire_nothing and change is fire_nothing:
+                return func(*args, **kwargs)
+
+            before_change(*args, **kwargs)
+            ret = func(*args, **kwargs)
+
+            if self.getter is not None:
+                args, kwargs = (self.getter(),), {}
+            elif self.fire_results:
+                args, kwargs = (ret,), {}
+            if not (BATCH_STATE.depth and defer_signal(self, "change", args, kwargs)):
+                change(*args, **kwargs)
             return ret
 
     def create_signaler_instance(self, instance=None):
@@ -78,28 +95,287 @@ class SignalerDecoratorInstance(SignalerDescriptorInstance):
         pass
 
 
+class SignalerDecoratorInstance(SignalerDecoratorBase):
+    """Function that fires the before_change and change signals when it is called."""
+    __slots__ = SIGNALER_SLOTS + ('_func', 'getter', 'fire_results', 'executor')
+
+    def __getattr__(self, name):
+        """Return the decorated function's metadata (__name__, __qualname__, ...) without copying it."""
+        if name in FUNC_METADATA:
+            if name == '__wrapped__':
+                return self.func
+            try:
+                return getattr(self.func, name)
+            except AttributeError:
+                pass
+        raise AttributeError("{!r} object has no attribute {!r}".format(self.__class__.__name__, name))
+
+
+class BoundSignalerDecoratorInstance(BoundSignalerInstance, SignalerDecoratorBase):
+    """Signaler for one object that was created from a class level signaler.
+
+    The function, getter, and class level callback functions are called with the object when the signaler is called,
+    so creating this signaler does not bind or copy anything.
+    """
+    __slots__ = BOUND_SIGNALER_SLOTS + ('_func',)
+
+    def __init__(self, descriptor, instance):
+        """Initialize the signaler for the instance.
+
+        Args:
+            descriptor (signaler): Class level signaler that has the function and class level callback functions.
+            instance (object): Object that the function and callback functions are called with.
+        """
+        # The signaler is created for every access while it shares the class level callbacks, so the attributes of
+        # BoundSignalerInstance.__init__ are set here without extra calls
+        self.descriptor = descriptor
+        self.instance = instance
+        self._event_signals = self._event_dispatch = None
+        self._bound_dispatch = descriptor.event_bound_dispatch
+        if self._bound_dispatch is None:
+            self._bound_dispatch = get_bound_dispatch_table(descriptor)
+        func = descriptor._func
+        self._func = func if func is None or type(func) is types.FunctionType else instance_caller(func)
+
+    @property
+    def _getter(self):
+        """Return the getter that is called with the instance. Only used when a signal fires."""
+        getter = self.descriptor.getter
+        return getter if getter is None or type(getter) is types.FunctionType else instance_caller(getter)
+
+    @property
+    def fire_results(self):
+        """Return if the 'change' signal is fired with the result of the function."""
+        return self.descriptor.fire_results
+
+    @property
+    def func(self):
+        """Return the function bound to the instance."""
+        if self.descriptor.func is not None:
+            return bind_instance(self.descriptor.func, self.instance)
+
+    @property
+    def getter(self):
+        """Return the getter bound to the instance."""
+        if self.descriptor.getter is not None:
+            return bind_instance(self.descriptor.getter, self.instance)
+
+    @property
+    def executor(self):
+        """Return the executor of the class level signaler that calls the 'change' callback functions."""
+        return self.descriptor.executor
+
+    @property
+    def __wrapped__(self):
+        """Return the function bound to the instance."""
+        return self.func
+
+    @property
+    def __annotations__(self):
+        """Return the annotations of the decorated function."""
+        return self.descriptor.func.__annotations__
+
+    def __call__(self, *args, **kwargs):
+        instance = self.instance
+        func = self._func
+        if self._event_signals is None:
+            # Call the shared class level callback functions with the instance
+            dispatch = self._bound_dispatch.builtin
+            before_change = dispatch[BEFORE_CHANGE]
+            if before_change is None:
+                before_change = get_bound_dispatch(self.descriptor, "before_change")
+            change = dispatch[CHANGE]
+            if change is None:
+                change = get_bound_dispatch(self.descriptor, "change")
+
+            # Nobody is listening. Do not build the signal arguments or call the getter
+            if before_change is fire_nothing and change is fire_nothing:
+                return func(instance, *args, **kwargs)
+
+            before_change(instance, *args, **kwargs)
+            change_args = (instance,)
+        else:
+            # This instance has its own callback functions which are already bound
+            dispatch = self._event_dispatch.builtin
+            before_change = dispatch[BEFORE_CHANGE]
+            if before_change is None:
+                before_change = update_dispatch(self, "before_change")
+            change = dispatch[CHANGE]
+            if change is None:
+                change = update_dispatch(self, "change")
+
+            if before_change is fire_nothing and change is fire_nothing:
+                return func(instance, *args, **kwargs)
+
+            before_change(*args, **kwargs)
+            change_args = ()
+
+        ret = func(instance, *args, **kwargs)
+
+        if self._getter is not None:
+            args, kwargs = (self._getter(instance),), {}
+        elif self.fire_results:
+            args, kwargs = (ret,), {}
+        if not (BATCH_STATE.depth and defer_signal(self, "change", args, kwargs)):
+            change(*(change_args + args), **kwargs)
+        return ret
+
+
+BOUND_CALL_TEMPLATE = """
+def __call__(_es_self{params}):
+    _es_instance = _es_self.instance
+    _es_func = _es_self._func
+    if _es_self._event_signals is None:
+        # Call the shared class level callback functions with the instance
+        _es_dispatch = _es_self._bound_dispatch.builtin
+        _es_before_change = _es_dispatch[_es_BEFORE_CHANGE]
+        if _es_before_change is None:
+            _es_before_change = _es_get_bound_dispatch(_es_self.descriptor, "before_change")
+        _es_change = _es_dispatch[_es_CHANGE]
+        if _es_change is None:
+            _es_change = _es_get_bound_dispatch(_es_self.descriptor, "change")
+        _es_first = (_es_instance,)
+    else:
+        # This instance has its own callback functions which are already bound
+        _es_dispatch = _es_self._event_dispatch.builtin
+        _es_before_change = _es_dispatch[_es_BEFORE_CHANGE]
+        if _es_before_change is None:
+            _es_before_change = _es_update_dispatch(_es_self, "before_change")
+        _es_change = _es_dispatch[_es_CHANGE]
+        if _es_change is None:
+            _es_change = _es_update_dispatch(_es_self, "change")
+        _es_first = ()
+
+    # Nobody is listening. Do not build the signal arguments or call the getter
+    if _es_before_change is _es_fire_nothing and _es_change is _es_fire_nothing:
+        return _es_func(_es_instance{args})
+
+    if _es_first:
+        _es_before_change(_es_instance{args})
+        _es_ret = _es_func(_es_instance{args})
+    else:
+        _es_before_change({bare_args})
+        _es_ret = _es_func(_es_instance{args})
+
+    if _es_self._getter is not None:
+        _es_args = (_es_self._getter(_es_instance),)
+    elif _es_self.fire_results:
+        _es_args = (_es_ret,)
+    else:
+        if not (_es_BATCH_STATE.depth and _es_defer_signal(_es_self, "change", {tuple_args})):
+            if _es_first:
+                _es_change(_es_instance{args})
+            else:
+                _es_change({bare_args})
+        return _es_ret
+    if not (_es_BATCH_STATE.depth and _es_defer_signal(_es_self, "change", _es_args)):
+        _es_change(*(_es_first + _es_args))
+    return _es_ret
+"""
+
+BOUND_CLASSES = {}
+
+
+def init_shared_signaler(self, descriptor, instance):
+    """Initialize a signaler of `signaler.get_bound_class`. The class has the descriptor's attributes."""
+    self.instance = instance
+    self._event_signals = self._event_dispatch = None
+
+
+def bound_signaler_class(func):
+    """Return the BoundSignalerDecoratorInstance class for a method.
+
+    The class has a `__call__` method that is generated with the method's parameters, so calling the signaler passes
+    the arguments to the callback functions and the method without packing and unpacking `*args, **kwargs`. Methods
+    with default values, `*args`, `**kwargs`, or keyword only parameters use BoundSignalerDecoratorInstance.
+    """
+    code = getattr(func, '__code__', None)
+    if (not isinstance(func, types.FunctionType) or code.co_argcount == 0 or func.__defaults__ or
+            code.co_kwonlyargcount or code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS)):
+        return BoundSignalerDecoratorInstance
+
+    names = code.co_varnames[1:code.co_argcount]  # Without self
+    posonly = max(code.co_posonlyargcount - 1, 0)
+    key = (names, posonly)
+    try:
+        return BOUND_CLASSES[key]
+    except KeyError:
+        pass
+    if any(name.startswith('_es_') for name in names):
+        return BoundSignalerDecoratorInstance
+
+    params = list(names)
+    if posonly:
+        params.insert(posonly, '/')
+    source = BOUND_CALL_TEMPLATE.format(
+        params=''.join(', ' + name for name in params),
+        args=''.join(', ' + name for name in names),
+        bare_args=', '.join(names),
+        tuple_args='({},)'.format(', '.join(names)) if names else '()')
+    # Every global name starts with _es_, so the parameters cannot shadow them
+    namespace = {'_es_BEFORE_CHANGE': BEFORE_CHANGE, '_es_CHANGE': CHANGE, '_es_get_bound_dispatch': get_bound_dispatch,
+                 '_es_update_dispatch': update_dispatch, '_es_fire_nothing': fire_nothing,
+                 '_es_BATCH_STATE': BATCH_STATE, '_es_defer_signal': defer_signal}
+    signature = ', '.join(params)
+    exec(compile(source, '<signaler {}({})>'.format(func.__name__, signature), 'exec'), namespace)
+    cls = type(BoundSignalerDecoratorInstance.__name__, (BoundSignalerDecoratorInstance,),
+               {'__slots__': (), '__module__': __name__, '__call__': namespace['__call__'],
+                '__qualname__': '{}({})'.format(BoundSignalerDecoratorInstance.__name__, signature)})
+    return BOUND_CLASSES.setdefault(key, cls)
+
+
 class signaler(SignalerDecoratorInstance):
     """Signaler used with binded methods and instances. Does not allow using as a decorator."""
 
     property = signaler_property
 
-    def create_signaler_instance(self, instance=None):
-        """Create and return a signaler instance."""
-        func = None
-        getter = None
-        if self.func:
-            func = self.func.__get__(instance, instance.__class__)
-        if self.getter:
-            getter = self.getter.__get__(instance, instance.__class__)
+    bound_class = None  # (func, class) cache of get_bound_class
+
+    def get_bound_class(self):
+        """Return the class of the signalers that are created for the objects.
 
-        # Create the new signaler for the instance with bound methods.
-        sig = SignalerDecoratorInstance(func, getter=getter, fire_results=self.fire_results)
+        The class is a subclass of `bound_signaler_class(func)` that has this signaler, the function, and the bound
+        dispatch table as class attributes, so creating a signaler for every access only sets the object.
+        """
+        func = self._func
+        bound_class = self.bound_class
+        if bound_class is not None and bound_class[0] is func:
+            return bound_class[1]
 
-        # Map all of the connected callbacks as bound methods to the instance
-        copy_signals_as_bound(self, sig, instance)
+        base = bound_signaler_class(func)
+        cls = type(base.__name__, (base,), {
+            '__slots__': (), '__module__': base.__module__, '__qualname__': base.__qualname__,
+            '__init__': init_shared_signaler,
+            'descriptor': staticmethod(self),  # staticmethod returns the objects without binding them
+            '_bound_dispatch': get_bound_dispatch_table(self),
+            '_func': staticmethod(func if func is None or type(func) is types.FunctionType else instance_caller(func)),
+            })
+        self.bound_class = (func, cls)
+        return cls
 
-        return sig  # return an event handler object for the instance
+    def create_signaler_instance(self, instance=None):
+        """Create and return a signaler instance that shares this signaler's callback functions."""
+        return self.get_bound_class()(self, instance)  # return an event handler object for the instance
 
     def __get__(self, instance, owner):
-        """Return the signaler with a binded method callback."""
+        """Return the signaler with a binded method callback.
+
+        Like a bound method a new signaler is returned for every access until the object changes its signals.
+        """
+        shared_class = self.shared_class
+        if shared_class is not None and instance is not None and shared_class[0] is self._func:
+            return shared_class[1](self, instance)  # No object stored its signaler yet
+
+        if instance is not None and self.storage_name is not None and not self.signalers_dict:
+            if self.storage_empty:
+                cls = self.get_bound_class()
+                with SIGNAL_LOCK:  # own_signals stores the signalers with the lock
+                    if self.storage_empty:
+                        self.shared_class = self.bound_class
+                return cls(self, instance)
+
+            sig = getattr(instance, self.storage_name, None)  # Stored instance signaler (see __set_name__)
+            if sig is not None:
+                return sig
+            return self.create_signaler_instance(instance)  # Not stored until it has its own signals
         return self.get_signaler_instance(instance)
@@ -80,15 +80,117 @@ Example:
         Point.x.off(p, "change")  # Remove all callbacks from change
 
 """
+import sys
+
 from .interface import get_signal, on_signal, off_signal, fire_signal, block_signals, \
-    copy_signals, copy_signals_as_bound, SignalerInstance, SignalerDescriptorInstance
+    copy_signals, update_dispatch, get_bound_dispatch, get_bound_dispatch_table, bind_instance, fire_nothing, \
+    defer_signal, get_deferred, BATCH_STATE, SignalerInstance, SignalerDescriptorInstance, BoundSignalerInstance, \
+    BEFORE_CHANGE, CHANGE, SIGNALER_SLOTS, BOUND_SIGNALER_SLOTS
+from .rate_limit import rate_limit
 
 
-__all__ = ["signaler_property", "SignalerPropertyInstance"]
+__all__ = ["signaler_property", "SignalerPropertyBase", "SignalerPropertyInstance", "BoundSignalerPropertyInstance",
+           "update", "same_identity", "same_value", "same_array", "same_hash", "same_key", "get_change_check",
+           "CHANGE_CHECKS"]
 
 
-class SignalerPropertyInstance(SignalerDescriptorInstance):
-    """Replaces a property with this class that uses callback functions for before and after a value changes.
+def same_identity(old, new):
+    """Return if the new value is the same object as the old value."""
+    return old is new
+
+
+def same_value(old, new):
+    """Return if the values are equal. Arrays whose `==` is elementwise are compared with `same_array`."""
+    try:
+        return bool(old == new)
+    except ValueError:  # The truth value of an array is ambiguous
+        return same_array(old, new)
+
+
+def same_array(old, new):
+    """Return if two arrays have the same shape and elements (`numpy.array_equal`).
+
+    numpy is not imported for this. numpy arrays only exist after a module imported numpy.
+    """
+    if old is new:
+        return True
+    numpy = sys.modules.get('numpy', None)
+    if numpy is not None:
+        return bool(numpy.array_equal(old, new))
+    try:
+        return len(old) == len(new) and all(same_value(a, b) for a, b in zip(old, new))
+    except TypeError:
+        return same_value(old, new)
+
+
+def same_hash(old, new):
+    """Return if the values are the same. Values with different hashes changed, values with the same hash (or
+    unhashable values like lists, dicts, and arrays) are compared with `same_value`, since hashes can collide.
+    """
+    try:
+        if hash(old) != hash(new):
+            return False
+    except TypeError:  # unhashable type
+        pass
+    return same_value(old, new)
+
+
+def same_key(key):
+    """Return a change check that compares the key of the values like a hash or a version number.
+
+    Example:
+
+        .. code-block:: python
+
+            class Document(object):
+                text = signaler_property(get_text, set_text, check_change=same_key(len))
+                lines = signaler_property(get_lines, set_lines, check_change=same_key(operator.attrgetter('version')))
+    """
+    def same(old, new):
+        return key(old) == key(new)
+    same.__name__ = 'same_{}'.format(getattr(key, '__name__', 'key'))
+    return same
+
+
+CHANGE_CHECKS = {
+    'identity': same_identity,
+    'equality': same_value,
+    'array': same_array,
+    'hash': same_hash,
+    }
+"""Names of the check_change strategies."""
+
+
+def get_change_check(check_change):
+    """Return the function that checks if a new property value is the same as the old value or None to not check.
+
+    Args:
+        check_change (bool/str/callable): True for 'equality', False or None to always set the value, a name in
+            CHANGE_CHECKS ('identity', 'equality', 'array', 'hash'), or a function `same(old, new)` that returns True
+            if the value did not change.
+
+    Raises:
+        ValueError: If the name is not in CHANGE_CHECKS.
+        TypeError: If check_change is not a bool, str, or callable.
+    """
+    if check_change is True:
+        return same_value
+    elif check_change is False or check_change is None:
+        return None
+    elif isinstance(check_change, str):
+        try:
+            return CHANGE_CHECKS[check_change]
+        except KeyError:
+            raise ValueError('Invalid check_change {!r}. Use one of {}'.format(check_change, sorted(CHANGE_CHECKS)))
+    elif callable(check_change):
+        return check_change
+    raise TypeError('check_change must be a bool, str, or callable, not {!r}'.format(check_change))
+
+
+class SignalerPropertyBase(SignalerDescriptorInstance):
+    """Property methods that use callback functions for before and after a value changes.
+
+    This class does not have any storage, so it can be combined with the builtin property (see signaler_property).
 
     Signals (Callbacks):
 
@@ -97,7 +199,12 @@ class SignalerPropertyInstance(SignalerDescriptorInstance):
         * 'before_change' - function should take a single value argument
         * 'change' - function should take a single value argument
     """
-    def __init__(self, fget=None, fset=None, fdel=None, doc=None, check_change=True):
+    __slots__ = ()
+
+    throttle = None
+    debounce = None
+
+    def __init__(self, fget=None, fset=None, fdel=None, doc=None, check_change=True, verbatim=False):
         """Initialize like a property
 
         Args:
@@ -105,12 +212,16 @@ class SignalerPropertyInstance(SignalerDescriptorInstance):
             fset (function/method)[None]: Setter method for the property
             fdel (function/method)[None]: Deleter method for the property
             doc (str)[None]: Documentation for the property
-            check_change (bool)[True]: If True before the setter is called check if the value is different (uses getter)
+            check_change (bool/str/callable)[True]: Before the setter is called check if the value is different (uses
+                getter). See `get_change_check` for the strategies.
+            verbatim (bool)[False]: The setter stores the value as is, so the 'change' signal is fired with the given
+                value without calling the getter again.
         """
-        super(SignalerPropertyInstance, self).__init__()
+        super(SignalerPropertyBase, self).__init__()
 
         # Variables
         self.check_change = check_change
+        self.verbatim = verbatim
         try:
             self.fget = fget
         except (AttributeError, TypeError):  # property fget is a readonly attribute
@@ -125,17 +236,29 @@ class SignalerPropertyInstance(SignalerDescriptorInstance):
             pass
         if doc is None and fget is not None:
             doc = fget.__doc__
-        self.__doc__ = doc
+        try:
+            self.__doc__ = doc
+        except AttributeError:  # __slots__ class
+            pass
 
         try:
             self.__name__ = self.fget.__name__
         except AttributeError:
             pass
 
-        self.event_signals["before_delete"] = []
-        self.event_signals["delete"] = []
-        self.event_signals["before_change"] = []
-        self.event_signals["change"] = []
+        self.event_signals["before_delete"] = ()
+        self.event_signals["delete"] = ()
+        self.event_signals["before_change"] = ()
+        self.event_signals["change"] = ()
+
+    @property
+    def check_change(self):
+        """Return the function that checks if a new value is the same as the current value or None."""
+        return self._check_change
+
+    @check_change.setter
+    def check_change(self, check_change):
+        self._check_change = get_change_check(check_change)
 
     # ===== Property methods =====
     def get_value(self):
@@ -150,23 +273,41 @@ class SignalerPropertyInstance(SignalerDescriptorInstance):
             raise AttributeError("can't set attribute")
 
         # Check if the new value is different from the current value
-        if self.check_change and self.fget:
-            val = self.get_value()
-            if val == value:
+        same = self._check_change
+        if same is not None and self.fget:
+            if same(self.get_value(), value):
                 return
 
         # Set the value
-        self.fire("before_change", value)
+        dispatch = self.event_dispatch.builtin
+        before_change = dispatch[BEFORE_CHANGE]
+        if before_change is None:
+            before_change = update_dispatch(self, "before_change")
+        before_change(value)
         ret = self.fset(value)
 
+        # Nobody is listening. Do not get the new value
+        change = dispatch[CHANGE]
+        if change is None:
+            change = update_dispatch(self, "change")
+        if change is fire_nothing:
+            return ret
+
         # Get the new value from the getter if possible
         new_val = value
-        if self.fget:
+        if self.fget and not self.verbatim:
             new_val = self.get_value()
-        self.fire("change", new_val)
+        if not (BATCH_STATE.depth and defer_signal(self, "change", (new_val,))):
+            change(new_val)
 
         return ret  # None usually
 
+    def write_value(self, value):
+        """Set the property value with the setter function without firing any signals."""
+        if self.fset is None:
+            raise AttributeError("can't set attribute")
+        return self.fset(value)
+
     def del_value(self):
         """Delete the property value with the deleter function."""
         if self.fdel is None:
@@ -188,7 +329,153 @@ class SignalerPropertyInstance(SignalerDescriptorInstance):
         pass
 
 
-class signaler_property(property, SignalerPropertyInstance):  # , property
+class SignalerPropertyInstance(SignalerPropertyBase):
+    """Replaces a property with this class that uses callback functions for before and after a value changes.
+
+    A SignalerPropertyInstance is created for every object that uses a signaler_property, so it uses __slots__.
+
+    Signals (Callbacks):
+
+        * 'before_delete' - function should take no arguments
+        * 'delete' - function should take no arguments
+        * 'before_change' - function should take a single value argument
+        * 'change' - function should take a single value argument
+    """
+    __slots__ = SIGNALER_SLOTS + ('fget', 'fset', 'fdel', '_check_change', 'verbatim')
+
+    @property
+    def __name__(self):
+        """Return the name of the getter function."""
+        try:
+            return self.fget.__name__
+        except AttributeError:
+            raise AttributeError("'SignalerPropertyInstance' object has no attribute '__name__'")
+
+
+class BoundSignalerPropertyInstance(BoundSignalerInstance, SignalerPropertyBase):
+    """Observable property value of one object that was created from a class level signaler_property.
+
+    The getter, setter, deleter, and class level callback functions are called with the object like a property, so
+    creating this object does not bind or copy anything.
+
+    Signals (Callbacks):
+
+        * 'before_delete' - function should take no arguments
+        * 'delete' - function should take no arguments
+        * 'before_change' - function should take a single value argument
+        * 'change' - function should take a single value argument
+    """
+    __slots__ = BOUND_SIGNALER_SLOTS + ('_check_change', 'verbatim', 'limiter')
+
+    def __init__(self, descriptor, instance):
+        """Initialize the observable property value for the instance.
+
+        Args:
+            descriptor (signaler_property): Class level property with the getter, setter, deleter, and callbacks.
+            instance (object): Object that the property methods and callback functions are called with.
+        """
+        super(BoundSignalerPropertyInstance, self).__init__(descriptor, instance)
+        self._check_change = descriptor.check_change
+        self.verbatim = descriptor.verbatim
+        self.limiter = None
+        if descriptor.throttle is not None or descriptor.debounce is not None:
+            self.limiter = rate_limit(self.fire_change, throttle=descriptor.throttle, debounce=descriptor.debounce)
+
+    def needs_storage(self):
+        """Return if the object has its own signals or a rate limiter, so the signaler is stored on the object."""
+        return self._event_signals is not None or self.limiter is not None
+
+    def fire_change(self, value):
+        """Call the 'change' callback functions without the rate limit."""
+        self.fire("change", value)
+
+    @property
+    def fget(self):
+        """Return the getter method bound to the instance."""
+        if self.descriptor.fget is not None:
+            return bind_instance(self.descriptor.fget, self.instance)
+
+    @property
+    def fset(self):
+        """Return the setter method bound to the instance."""
+        if self.descriptor.fset is not None:
+            return bind_instance(self.descriptor.fset, self.instance)
+
+    @property
+    def fdel(self):
+        """Return the deleter method bound to the instance."""
+        if self.descriptor.fdel is not None:
+            return bind_instance(self.descriptor.fdel, self.instance)
+
+    def get_value(self):
+        """Return the property value with the getter function."""
+        fget = self.descriptor.fget
+        if fget is None:
+            raise AttributeError("unreadable attribute")
+        return fget(self.instance)
+
+    def set_value(self, value):
+        """Set the property value with the setter function."""
+        if self._event_signals is None:
+            # Call the shared class level callback functions with the instance
+            return self.descriptor.set_shared_value(self.instance, value, self)
+
+        descriptor = self.descriptor
+        instance = self.instance
+        fget = descriptor.fget
+        fset = descriptor.fset
+        if fset is None:
+            raise AttributeError("can't set attribute")
+
+        # Check if the new value is different from the current value
+        same = self._check_change
+        if same is not None and fget is not None:
+            if same(fget(instance), value):
+                return
+        if self.verbatim:
+            fget = None  # The setter stores the value, so the 'change' signal does not need to call the getter
+
+        # This instance has its own callback functions which are already bound
+        dispatch = self._event_dispatch.builtin
+        before_change = dispatch[BEFORE_CHANGE]
+        if before_change is None:
+            before_change = update_dispatch(self, "before_change")
+        before_change(value)
+        ret = fset(instance, value)
+
+        # Nobody is listening. Do not get the new value
+        change = dispatch[CHANGE]
+        if change is None:
+            change = update_dispatch(self, "change")
+        if change is not fire_nothing:
+            new_val = fget(instance) if fget is not None else value
+            if not (BATCH_STATE.depth and defer_signal(self, "change", (new_val,))):
+                limiter = self.limiter
+                if limiter is None:
+                    change(new_val)
+                else:
+                    limiter(new_val)
+        return ret  # None usually
+
+    def write_value(self, value):
+        """Set the property value with the setter function without firing any signals."""
+        fset = self.descriptor.fset
+        if fset is None:
+            raise AttributeError("can't set attribute")
+        return fset(self.instance, value)
+
+    def del_value(self):
+        """Delete the property value with the deleter function."""
+        fdel = self.descriptor.fdel
+        if fdel is None:
+            raise AttributeError("can't delete attribute")
+        self.fire("before_delete")
+        ret = fdel(self.instance)
+        self.fire("delete")
+        return ret  # None usually
+
+
+class signaler_property(property, SignalerPropertyBase):  # , property
     """Property that is observable through callback functions.
 
     Add a callback to function to be called when a before a property changes or after a property changes. Callbacks
@@ -243,8 +530,13 @@ class signaler_property(property, SignalerPropertyInstance):  # , property
             MyClass.x.on("change", print_value)
             m.x = 2
             print(m.x)
+
+            # Rate limit the 'change' signal. The callbacks are called at most every 0.1 seconds with the last value
+            class Slider:
+                value = signaler_property(get_value, set_value, throttle=0.1)
     """
-    def __init__(self, fget=None, fset=None, fdel=None, doc=None, check_change=True):
+    def __init__(self, fget=None, fset=None, fdel=None, doc=None, check_change=True, throttle=None, debounce=None,
+                 verbatim=False):
         """Initialize like a property
 
         Args:
@@ -252,53 +544,111 @@ class signaler_property(property, SignalerPropertyInstance):  # , property
             fset (function/method)[None]: Setter method for the property
             fdel (function/method)[None]: Deleter method for the property
             doc (str)[None]: Documentation for the property
-            check_change (bool)[True]: If True before the setter is called check if the value is different (uses getter)
+            check_change (bool/str/callable)[True]: Before the setter is called check if the value is different (uses
+                getter). True or 'equality' uses `==` (numpy arrays are compared with numpy.array_equal), 'identity'
+                uses `is`, 'array' uses numpy.array_equal, 'hash' compares the hash values first and uses
+                'equality' when they are equal or unhashable, and a function `same(old, new)` returns True if the value
+                did not change. False never checks.
+            throttle (float)[None]: Fire the 'change' signal at most once every throttle seconds with the last value.
+            debounce (float)[None]: Fire the 'change' signal with the last value after the value did not change for
+                debounce seconds.
+            verbatim (bool)[False]: The setter stores the value as is, so the 'change' signal is fired with the given
+                value without calling the getter again.
         """
-        SignalerPropertyInstance.__init__(self, fget=fget, fset=fset, fdel=fdel, doc=doc, check_change=check_change)
+        if throttle is not None and debounce is not None:
+            raise ValueError("Give either throttle or debounce, not both.")
+        SignalerPropertyBase.__init__(self, fget=fget, fset=fset, fdel=fdel, doc=doc, check_change=check_change,
+                                      verbatim=verbatim)
         super(signaler_property, self).__init__(fget=fget, fset=fset, fdel=fdel, doc=doc)
         # self.event_signals = {"before_delete": [], "delete": [], "before_change": [], "change": []}
         self.check_change = check_change
+        self.verbatim = verbatim
+        self.throttle = throttle
+        self.debounce = debounce
     # end Constructor
 
-    def create_signaler_instance(self, instance=None):
-        """Create and return a signaler instance."""
-        fget = None
-        fset = None
-        fdel = None
-        doc = self.__doc__
+    def __set_name__(self, owner, name):
+        """Store the instance signalers in the instance attribute for the class attribute name."""
+        SignalerPropertyBase.__set_name__(self, owner, name)
+        try:
+            super(signaler_property, self).__set_name__(owner, name)  # property.__set_name__ (Python 3.10+)
+        except AttributeError:
+            pass
 
-        # Bind the get, set, and del methods with the given instance before creating the observable property
-        if self.fget:
-            fget = self.fget.__get__(instance, instance.__class__)
-        if self.fset:
-            fset = self.fset.__get__(instance, instance.__class__)
-        if self.fdel:
-            fdel = self.fdel.__get__(instance, instance.__class__)
+    def create_signaler_instance(self, instance=None):
+        """Create and return a signaler instance that shares this property's callback functions."""
+        return BoundSignalerPropertyInstance(self, instance)  # return an event handler object for the instance
 
-        # Create the new signaler for the instance with bound methods.
-        sig = SignalerPropertyInstance(fget=fget, fset=fset, fdel=fdel, doc=doc, check_change=self.check_change)
+    def set_shared_value(self, instance, value, sig=None):
+        """Set the value of an object that shares this property's class level callback functions.
 
-        # Map all of the connected callbacks as bound methods to the instance
-        copy_signals_as_bound(self, sig, instance)
+        Args:
+            instance (object): Object to set the value for.
+            value (object): New value.
+            sig (BoundSignalerPropertyInstance)[None]: Signaler of the object. Without it a signaler is only created
+                when the 'change' signal is deferred by a batch.
+        """
+        fget = self.fget
+        fset = self.fset
+        if fset is None:
+            raise AttributeError("can't set attribute")
 
-        return sig  # return an event handler object for the instance
+        # Check if the new value is different from the current value
+        options = self if sig is None else sig
+        same = options._check_change
+        if same is not None and fget is not None:
+            if same(fget(instance), value):
+                return
+        if options.verbatim:
+            fget = None  # The setter stores the value, so the 'change' signal does not need to call the getter
+
+        dispatch = self.event_bound_dispatch
+        if dispatch is None:
+            dispatch = get_bound_dispatch_table(self)
+        dispatch = dispatch.builtin
+        before_change = dispatch[BEFORE_CHANGE]
+        if before_change is None:
+            before_change = get_bound_dispatch(self, "before_change")
+        change = dispatch[CHANGE]
+        if change is None:
+            change = get_bound_dispatch(self, "change")
+
+        before_change(instance, value)
+        ret = fset(instance, value)
+        if change is not fire_nothing:
+            new_val = fget(instance) if fget is not None else value
+            if BATCH_STATE.depth:
+                if sig is None:
+                    sig = self.create_signaler_instance(instance)
+                if defer_signal(sig, "change", (new_val,)):
+                    return ret
+            limiter = None if sig is None else sig.limiter
+            if limiter is None:
+                change(instance, new_val)
+            else:
+                limiter(new_val)
+        return ret
 
     # ========== class decorator ==========
     def __set__(self, instance, obj):
         """Class decorator that is called for `obj.x = 1`."""
         if instance is None:
             return self
-        sig = self.get_signaler_instance(instance)
+        sig = None
+        if self.storage_name is not None and not self.signalers_dict:
+            if not self.storage_empty:
+                sig = getattr(instance, self.storage_name, None)  # Stored instance signaler (see __set_name__)
+        else:
+            sig = self.find_signaler_instance(instance)
+        if sig is None:
+            if self.throttle is None and self.debounce is None:
+                return self.set_shared_value(instance, obj)  # Like a bound method, do not create a signaler
+            sig = self.get_signaler_instance(instance)
         return sig.set_value(obj)
     # end __set__
 
-    def __get__(self, instance=None, owner=None):
-        """Class decorator that is called for `print(obj.x)`."""
-        if instance is None:
-            return self
-        sig = self.get_signaler_instance(instance)
-        return sig.get_value()
-    # end __get__
+    # `print(obj.x)` uses the builtin property.__get__ which calls fget directly. Reading a value does not fire any
+    # signals, so it does not need a signaler instance.
 
     def __delete__(self, instance):
         """Class decorator that is called for `del obj.x`."""
@@ -312,6 +662,9 @@ class signaler_property(property, SignalerPropertyInstance):  # , property
         """Decorator to add a getter method. Works just like @property.getter."""
         obj = super(signaler_property, self).getter(fget)
         obj.check_change = self.check_change
+        obj.verbatim = self.verbatim
+        obj.throttle = self.throttle
+        obj.debounce = self.debounce
         copy_signals(self, obj)
         try:
             obj.__name__ = obj.fget.__name__
@@ -323,6 +676,9 @@ class signaler_property(property, SignalerPropertyInstance):  # , property
         """Decorator to add a setter method. Works just like @property.setter."""
         obj = super(signaler_property, self).setter(fset)
         obj.check_change = self.check_change
+        obj.verbatim = self.verbatim
+        obj.throttle = self.throttle
+        obj.debounce = self.debounce
         copy_signals(self, obj)
         return obj
 
@@ -330,6 +686,9 @@ class signaler_property(property, SignalerPropertyInstance):  # , property
         """Decorator to add a deleter method. Works just like @property.deleter."""
         obj = super(signaler_property, self).deleter(fdel)
         obj.check_change = self.check_change
+        obj.verbatim = self.verbatim
+        obj.throttle = self.throttle
+        obj.debounce = self.debounce
         copy_signals(self, obj)
         return obj
 
@@ -392,12 +751,13 @@ class signaler_property(property, SignalerPropertyInstance):  # , property
         if not isinstance(signal_type, str):
             raise TypeError("Invalid 'signal type' given.")
 
-        if instance is None:
-            instance = self
-
-        return get_signal(instance, signal_type)
+        sig = self.get_signaler_instance(instance)
+        if sig is self:
+            return get_signal(self, signal_type)
+        return sig.get_signal(signal_type)
 
-    def on(self, instance, signal_type=None, func=None):
+    def on(self, instance, signal_type=None, func=None, weak=False, throttle=None, debounce=None, executor=None,
+           dispatcher=None, coalesce=False):
         """Connect callback methods.
 
         Options:
@@ -439,10 +799,22 @@ class signaler_property(property, SignalerPropertyInstance):  # , property
             instance (object): Object to connec the signal with.
             signal_type (str): Signal name to direct which signal to use
             func (callable): Callback function
+            weak (bool)[False]: Only keep a weak reference to the callback function.
+            throttle (float)[None]: Call the callback function at most once every throttle seconds.
+            debounce (float)[None]: Call the callback function after the signal did not fire for debounce seconds.
+            executor (concurrent.futures.Executor)[None]: Submit the callback function to this executor.
+            dispatcher (Dispatcher/threading.Thread/bool)[None]: Call the callback function in the dispatcher's thread.
+            coalesce (bool)[False]: Only keep the latest queued call of a dispatcher connection.
 
         Args Alternative:
             signal_type (str): Signal name to direct which signal to use
             func (callable): Callback function
+            weak (bool)[False]: Only keep a weak reference to the callback function.
+            throttle (float)[None]: Call the callback function at most once every throttle seconds.
+            debounce (float)[None]: Call the callback function after the signal did not fire for debounce seconds.
+            executor (concurrent.futures.Executor)[None]: Submit the callback function to this executor.
+            dispatcher (Dispatcher/threading.Thread/bool)[None]: Call the callback function in the dispatcher's thread.
+            coalesce (bool)[False]: Only keep the latest queued call of a dispatcher connection.
 
         Returns:
             func (callable): The callable function that was given or a decorator to decorate a function.
@@ -451,16 +823,18 @@ class signaler_property(property, SignalerPropertyInstance):  # , property
             # Class property called as a decorator
             instance, signal_type, func = None, instance, signal_type
 
+        options = dict(weak=weak, throttle=throttle, debounce=debounce, executor=executor, dispatcher=dispatcher,
+                       coalesce=coalesce)
         sig = self.get_signaler_instance(instance)
         if func is None:
             def decorator(func):
-                sig.on(signal_type, func)
+                sig.on(signal_type, func, **options)
                 return func
             return decorator
         elif sig is self:
-            return super(signaler_property, self).on(signal_type, func)
+            return super(signaler_property, self).on(signal_type, func, **options)
         else:
-            return sig.on(signal_type, func)
+            return sig.on(signal_type, func, **options)
 
     def off(self, instance, signal_type=None, func=None):
         """Disconnect from a signal.
@@ -580,3 +954,78 @@ class signaler_property(property, SignalerPropertyInstance):  # , property
             return super(signaler_property, self).block(signal_type, block)
         else:
             return sig.block(signal_type, block)
+
+
+def update(obj, **values):
+    """Set multiple signaler_property values of an object as a single change.
+
+    The values are checked with `check_change` once per field and fields that do not change are skipped. Every
+    changed field fires its "before_change" signal before any setter runs. After all of the setters ran every changed
+    field fires its "change" signal and the object fires its "changed_fields" signal once with a dictionary of the
+    new values.
+
+    Example:
+
+        .. code-block:: python
+
+            on_signal(rect, "changed_fields", lambda fields: print("changed", sorted(fields)))
+            update(rect, x=1, y=2, width=10, height=20)
+            # changed ['height', 'width', 'x', 'y']
+
+    Args:
+        obj (object): Object that has signaler_property attributes.
+        **values: Property names and the values to set.
+
+    Raises:
+        AttributeError: If a name is not a signaler_property or a property does not have a setter.
+
+    Returns:
+        changed (dict): Property names and the new values of the fields that changed.
+    """
+    cls = obj.__class__
+    changes = []
+    for name, value in values.items():
+        prop = getattr(cls, name, None)
+        if not isinstance(prop, SignalerPropertyBase):
+            raise AttributeError("{!r} object has no signaler_property {!r}".format(cls.__name__, name))
+        sig = prop.get_signaler_instance(obj)
+        if sig.fset is None:
+            raise AttributeError("can't set attribute {!r}".format(name))
+
+        # Check if the new value is different from the current value
+        same = sig.check_change
+        if same is not None and sig.fget is not None and same(sig.get_value(), value):
+            continue
+        changes.append((name, sig, value))
+
+    for name, sig, value in changes:
+        sig.fire("before_change", value)
+    for name, sig, value in changes:
+        sig.write_value(value)
+
+    changed = {}
+    for name, sig, value in changes:
+        new_val = changed[name] = sig.get_value() if sig.fget is not None and not sig.verbatim else value
+        if not (BATCH_STATE.depth and defer_signal(sig, "change", (new_val,))):
+            limiter = getattr(sig, 'limiter', None)
+            if limiter is None:
+                sig.fire("change", new_val)
+            else:
+                limiter(new_val)
+
+    try:
+        has_signal = "changed_fields" in obj.event_signals
+    except (AttributeError, TypeError):
+        has_signal = False  # Nobody is listening to the object
+    if changed and has_signal:
+        fields = changed
+        if BATCH_STATE.depth:
+            # Fire once for the batch with the fields of every update
+            deferred = get_deferred(obj, "changed_fields")
+            if deferred is not None:
+                fields = dict(deferred[0][0])
+                fields.update(changed)
+            if defer_signal(obj, "changed_fields", (fields,)):
+                return changed
+        fire_signal(obj, "changed_fields", fields)
+    return changed
@@ -78,9 +78,9 @@ if __name__ == "__main__":
           install_requires=[
               'future>=0.17.1',
               ],
-          # extras_require={
-          #     '': [''],
-          #     },
+          extras_require={
+              'numpy': ['numpy'],
+              },
 
           # entry_points={
           #     'console_scripts': [
@@ -0,0 +1,80 @@
+import tracemalloc
+
+from event_signal import signaler, signaler_property, SignalerInstance
+from event_signal.interface import SignalerDescriptorInstance, SIGNALER_SLOTS
+from event_signal.signaler import SignalerDecoratorInstance
+from event_signal.signaler_prop import SignalerPropertyInstance
+from event_signal.signal_qt import CallbackManager
+
+
+class SlotsSignalerInstance(SignalerInstance):
+    """SignalerInstance with the documented __slots__. The base class does not have any storage."""
+    __slots__ = SIGNALER_SLOTS
+
+
+class SlotsSignalerDescriptorInstance(SignalerDescriptorInstance):
+    """SignalerDescriptorInstance with the documented __slots__. The base class does not have any storage."""
+    __slots__ = SIGNALER_SLOTS
+
+
+COUNT = 2000
+
+
+def bytes_per_instance(create, count=COUNT):
+    """Return the number of bytes allocated for every object that the create function returns."""
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        items = [create() for _ in range(count)]
+        size = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+    assert len(items) == count
+    return size / count
+
+
+def test_memory_per_instance():
+    class XTest(object):
+        def __init__(self, x=0):
+            self._x = x
+
+        @signaler
+        def set_x(self, value):
+            self._x = value
+
+        @signaler_property
+        def x(self):
+            return self._x
+
+        @x.setter
+        def x(self, value):
+            self._x = value
+
+    t = XTest()
+
+    # The instance signalers are created for every object and observed attribute
+    for obj in (t.set_x, XTest.x.get_signaler_instance(t), CallbackManager(), SignalerPropertyInstance(),
+                SignalerDecoratorInstance()):
+        assert not hasattr(obj, "__dict__"), "{} should use __slots__".format(obj.__class__.__name__)
+
+    # The class level signaler and signaler_property descriptors are not measured. They are created once for every
+    # class attribute, not for every object
+    sizes = {
+        "SignalerInstance": bytes_per_instance(SlotsSignalerInstance),
+        "SignalerDescriptorInstance": bytes_per_instance(SlotsSignalerDescriptorInstance),
+        "SignalerDecoratorInstance": bytes_per_instance(SignalerDecoratorInstance),
+        "SignalerPropertyInstance": bytes_per_instance(SignalerPropertyInstance),
+        "BoundSignalerDecoratorInstance": bytes_per_instance(lambda: XTest.set_x.create_signaler_instance(t)),
+        "BoundSignalerPropertyInstance": bytes_per_instance(lambda: XTest.x.create_signaler_instance(t)),
+        "CallbackManager": bytes_per_instance(CallbackManager),
+        }
+    for name, size in sizes.items():
+        print("{}: {:.0f} bytes per instance".format(name, size))
+        assert size < 512, "{} uses too much memory ({:.0f} bytes)".format(name, size)
+
+    print("test_memory_per_instance passed!")
+
+
+if __name__ == '__main__':
+    test_memory_per_instance()
+    print("All tests passed!")
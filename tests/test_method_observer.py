@@ -1,4 +1,7 @@
-from event_signal import MethodObserver
+import abc
+
+from event_signal import MethodObserver, MethodObserverMeta, observable, signaler, bind
+from event_signal.method_observer_metaclass import observable_method, LazyMethod
 
 
 def test_method_observer():
@@ -389,7 +392,230 @@ def test_inheritance():
     print("test_inheritance passed!")
 
 
+def test_lazy_methods():
+    class Point(MethodObserver):
+        def __init__(self, x=0, y=0):
+            self._x = x
+            self._y = y
+
+        def get_x(self):
+            return self._x
+
+        def set_x(self, x):
+            self._x = x
+
+        def set_y(self, y):
+            self._y = y
+
+    class Vector(Point):
+        def set_z(self, z):
+            self._z = z
+
+    assert Point.__name__ == "Point"
+
+    # Methods stay plain functions until a callback function is connected
+    p = Point()
+    assert isinstance(Point.__dict__["set_x"], observable_method)
+    assert isinstance(p.set_x, LazyMethod)
+    assert p.set_x.__name__ == "set_x"
+    assert p.set_x.__self__ is p
+    p.set_x(1)
+    Point.set_x(p, 2)
+    assert p.get_x() == 2
+    assert not p.set_x.off("change")
+    assert isinstance(Point.__dict__["set_x"], observable_method)
+
+    # Instance callback
+    values = []
+    stale = p.set_x
+    p.set_x.on("change", values.append)
+    assert stale.off("change", values.append)
+    stale.on("change", values.append)
+    assert isinstance(Point.__dict__["set_x"], signaler)
+    p.set_x(3)
+    Point().set_x(4)
+    assert values == [3]
+
+    # Class level callback through a subclass instance
+    class_values = []
+
+    @Point.set_y.on("change")
+    def y_changed(self, value):
+        class_values.append((self, value))
+
+    v = Vector()
+    v.set_y(5)
+    v.set_z(6)
+    assert class_values == [(v, 5)]
+    assert isinstance(Vector.__dict__["set_z"], observable_method)
+
+    # A method that is not observed yet can be connected as a callback function and disconnected
+    source = Point()
+    target = Vector()
+    assert isinstance(target.set_z, LazyMethod)
+    source.set_x.on("change", target.set_z)
+    source.set_x.on("change", target.set_z)
+    assert len(source.set_x.get_signal("change")) == 1
+    source.set_x(8)
+    assert target._z == 8
+    assert source.set_x.off("change", target.set_z)
+    assert source.set_x.get_signal("change") == []
+
+    # The key is the same after the method became a signaler
+    source.set_x.on("change", target.set_z)
+    target.set_z.on("change", class_values.append)
+    assert not isinstance(target.set_z, LazyMethod)
+    assert source.set_x.off("change", target.set_z)
+    assert source.set_x.get_signal("change") == []
+
+    # The binder observes the method
+    p2 = Point()
+    bind(p, "x", p2)
+    p.set_x(7)
+    assert p2.get_x() == 7
+
+    print("test_lazy_methods passed!")
+
+
+def test_lazy_method_alias():
+    class Point(MethodObserver):
+        def set_x(self, x):
+            self._x = x
+
+        alias = set_x
+
+    p = Point()
+    alias_values = []
+    x_values = []
+    p.alias.on("change", alias_values.append)
+    assert isinstance(Point.__dict__["alias"], signaler)
+    assert isinstance(Point.__dict__["set_x"], observable_method)
+
+    p.alias(1)
+    p.set_x(2)
+    assert alias_values == [1]
+    assert p._x == 2
+
+    p.set_x.on("change", x_values.append)
+    p.set_x(3)
+    p.alias(4)
+    assert x_values == [3]
+    assert alias_values == [1, 4]
+
+    print("test_lazy_method_alias passed!")
+
+
+def observed_names(cls):
+    return sorted(name for name, value in vars(cls).items() if isinstance(value, observable_method))
+
+
+def test_observe_policy():
+    class Model(MethodObserver, observe='public', exclude=('get_*',)):
+        def set_x(self, x):
+            self._x = x
+
+        def get_x(self):
+            return self._x
+
+        def _update(self):
+            pass
+
+        @observable
+        def _reset(self):
+            pass
+
+    assert observed_names(Model) == ['_reset', 'set_x']
+    assert Model.__observe__ == 'public'
+
+    # Subclasses inherit the policy
+    class SubModel(Model):
+        def set_y(self, y):
+            pass
+
+        def get_y(self):
+            pass
+
+        def _helper(self):
+            pass
+
+    assert observed_names(SubModel) == ['set_y']
+
+    class Marked(MethodObserver):
+        __observe__ = 'marked'
+
+        def helper(self):
+            pass
+
+        @observable
+        def set_value(self, value):
+            self.value = value
+
+    assert observed_names(Marked) == ['set_value']
+    values = []
+    m = Marked()
+    m.set_value.on("change", values.append)
+    m.set_value(1)
+    assert values == [1]
+
+    class Included(MethodObserver, include=('set_*', 'move')):
+        def set_x(self, x):
+            pass
+
+        def move(self):
+            pass
+
+        def helper(self):
+            pass
+
+    assert observed_names(Included) == ['move', 'set_x']
+
+    try:
+        class Invalid(MethodObserver, observe='some'):
+            pass
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Invalid observe mode was accepted")
+
+    # Combine with other metaclasses
+    class Abstract(MethodObserver, metaclass=abc.ABCMeta):
+        @abc.abstractmethod
+        def run(self):
+            pass
+
+        def set_x(self, x):
+            self.x = x
+
+    class Concrete(Abstract):
+        def run(self):
+            return 1
+
+    assert observed_names(Abstract) == ['run', 'set_x']
+    assert Concrete().run() == 1
+    try:
+        Abstract()
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("The abstract class was created")
+
+    # The metaclass uses the same policy
+    class Meta(metaclass=MethodObserverMeta, observe='public'):
+        def set_x(self, x):
+            pass
+
+        def _helper(self):
+            pass
+
+    assert observed_names(Meta) == ['set_x']
+    assert Meta.__observe__ == 'public'
+
+    print("test_observe_policy passed!")
+
+
 if __name__ == '__main__':
     test_method_observer()
     test_inheritance()
+    test_lazy_methods()
+    test_observe_policy()
     print("All tests passed!")
@@ -0,0 +1,125 @@
+from __future__ import print_function
+
+import pickle
+import weakref
+
+import pytest
+
+from event_signal import batch
+from event_signal.interface import BATCH_STATE
+from event_signal.observable_array import ObservableArray, get_region
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+requires_numpy = pytest.mark.skipif(numpy is None, reason="numpy is not installed")
+
+
+@requires_numpy
+def test_region():
+    shape = (10, 20)
+    assert get_region(3, shape) == ((3, 4), (0, 20))
+    assert get_region(-1, shape) == ((9, 10), (0, 20))
+    assert get_region((slice(2, 5), slice(None, None, -3)), shape) == ((2, 5), (1, 20))
+    assert get_region((Ellipsis, 4), shape) == ((0, 10), (4, 5))
+    assert get_region((None, 1, [3, -2]), shape) == ((1, 2), (3, 19))
+    mask = numpy.zeros(shape, dtype=bool)
+    mask[2, 5] = mask[4, 1] = True
+    assert get_region(mask, shape) == ((2, 5), (1, 6))
+    assert get_region(slice(5, 5), shape) is None
+    assert get_region(numpy.zeros(shape, dtype=bool), shape) is None
+    assert get_region('field', shape) == ((0, 10), (0, 20))
+
+    print("test_region passed!")
+
+
+@requires_numpy
+def test_observable_array():
+    arr = ObservableArray(numpy.zeros(10))
+    changes = []
+    arr.on('change', changes.append)
+
+    arr[2:4] = 1
+    arr[5] = 2
+    assert changes == [slice(2, 4), 5]
+    assert list(arr[:6]) == [0, 0, 1, 1, 0, 2]
+
+    # In-place ufuncs and methods fire with Ellipsis (the whole array)
+    del changes[:]
+    ref = arr
+    arr += 1
+    assert arr is ref and arr[5] == 3
+    numpy.multiply(arr, 2, out=arr)
+    arr.fill(1)
+    numpy.copyto(arr, numpy.arange(10))
+    assert changes == [Ellipsis] * 4
+    assert list(arr) == list(range(10))
+
+    del changes[:]
+    numpy.add.at(arr, [1, 3], 10)
+    assert changes == [[1, 3]] and arr[3] == 13
+
+    # Results and views do not fire
+    del changes[:]
+    result = arr + 1
+    result[0] = 5
+    arr[2:4].sum()
+    assert changes == []
+    assert not isinstance(result, ObservableArray)
+
+    arr.block('change')
+    arr[0] = 1
+    arr.block('change', False)
+    assert changes == []
+
+    # Pickle the values without the callback functions
+    copy = pickle.loads(pickle.dumps(arr))
+    assert isinstance(copy, ObservableArray) and list(copy) == list(arr)
+    copy[0] = 3
+    assert changes == []
+
+    print("test_observable_array passed!")
+
+
+@requires_numpy
+def test_observable_array_hold():
+    arr = ObservableArray(numpy.zeros((100, 100)))
+    changes = []
+    arr.on('change', changes.append)
+
+    with arr.hold():
+        arr[5, 10] = 1
+        arr[20, 3:6] = 2
+        arr[1:3, 50] = 3
+        assert changes == []
+        assert arr.flush() == (slice(1, 21), slice(3, 51))
+        arr[99, 99] = 4
+    assert changes == [(slice(1, 21), slice(3, 51)), (slice(99, 100), slice(99, 100))]
+
+    # event_signal.batch merges the writes of each array until the outermost batch exits
+    del changes[:]
+    with batch(arr):
+        arr[0, 0] = 1
+        with batch():
+            arr[10, 20] = 1
+        assert changes == []
+    assert changes == [(slice(0, 11), slice(0, 21))]
+
+    del changes[:]
+    with batch():
+        arr[50, 50] = 1
+        pending = weakref.ref(BATCH_STATE.pending)
+    assert changes == [(slice(50, 51), slice(50, 51))]
+    assert pending() is None  # The array does not keep the deferred signals of the finished batch
+
+    print("test_observable_array_hold passed!")
+
+
+if __name__ == '__main__':
+    test_region()
+    test_observable_array()
+    test_observable_array_hold()
+    print("All tests passed!")
@@ -0,0 +1,185 @@
+from __future__ import print_function
+
+import gc
+import threading
+
+from event_signal import Signal, signaler_property, Dispatcher, get_dispatcher, process_events
+from event_signal.queued import DISPATCHERS
+
+
+def run_in_thread(func, *args):
+    thread = threading.Thread(target=func, args=args)
+    thread.start()
+    thread.join()
+
+
+def test_queued_connection():
+    class Worker(object):
+        progress = Signal(int)
+
+    worker = Worker()
+    values = []
+    threads = []
+
+    def on_progress(value):
+        values.append(value)
+        threads.append(threading.current_thread())
+
+    worker.progress.connect(on_progress, dispatcher=True)
+
+    # Emit from the dispatcher's thread calls directly
+    worker.progress.emit(0)
+    assert values == [0]
+
+    # Emit from another thread is queued
+    run_in_thread(lambda: [worker.progress.emit(i) for i in range(1, 4)])
+    assert values == [0]
+    assert get_dispatcher().pending() == 3
+    assert process_events(max_events=1) == 1
+    assert values == [0, 1]
+    assert process_events() == 2
+    assert values == [0, 1, 2, 3]
+    assert all(thread is threading.current_thread() for thread in threads)
+    assert process_events() == 0
+
+    # Disconnect the original function
+    worker.progress.disconnect(on_progress)
+    assert worker.progress.get_signal("change") == []
+
+    print("test_queued_connection passed!")
+
+
+def test_queued_coalesce():
+    class Worker(object):
+        progress = Signal(int)
+
+    worker = Worker()
+    latest = []
+    every = []
+    worker.progress.connect(latest.append, dispatcher=True, coalesce=True)
+    worker.progress.connect(every.append, dispatcher=True)
+
+    run_in_thread(lambda: [worker.progress.emit(i) for i in range(100)])
+    process_events()
+    assert latest == [99]
+    assert every == list(range(100))
+
+    # Class level callbacks coalesce for each instance
+    class Model(object):
+        def __init__(self, name):
+            self.name = name
+            self._x = 0
+
+        @signaler_property
+        def x(self):
+            return self._x
+
+        @x.setter
+        def x(self, value):
+            self._x = value
+
+        @x.on("change", dispatcher=True, coalesce=True)
+        def x_changed(self, value):
+            latest.append((self.name, value))
+
+    del latest[:]
+    m1, m2 = Model("m1"), Model("m2")
+
+    def update():
+        for i in range(1, 10):
+            m1.x = i
+            m2.x = i * 10
+    run_in_thread(update)
+    assert latest == []
+    process_events()
+    assert latest == [("m1", 9), ("m2", 90)]
+
+    print("test_queued_coalesce passed!")
+
+
+def test_dispatcher_thread():
+    dispatcher = Dispatcher()
+    thread = dispatcher.start()
+
+    class Producer(object):
+        changed = Signal(int)
+
+    producer = Producer()
+    done = threading.Event()
+    threads = []
+
+    def on_changed(value):
+        threads.append(threading.current_thread())
+        if value == 2:
+            done.set()
+
+    producer.changed.connect(on_changed, dispatcher=dispatcher)
+    for i in range(3):
+        producer.changed.emit(i)
+    assert done.wait(2)
+    dispatcher.stop()
+    thread.join(2)
+    assert not thread.is_alive()
+    assert threads == [thread] * 3
+
+    print("test_dispatcher_thread passed!")
+
+
+def test_dispatcher_registered():
+    # Connecting with the thread of a started dispatcher uses that dispatcher
+    dispatcher = Dispatcher()
+    thread = dispatcher.start()
+    assert get_dispatcher(thread) is dispatcher
+    assert DISPATCHERS.get(threading.current_thread(), None) is not dispatcher
+
+    class Producer(object):
+        changed = Signal(int)
+
+    producer = Producer()
+    done = threading.Event()
+    values = []
+
+    def on_changed(value):
+        values.append((threading.current_thread(), value))
+        done.set()
+
+    producer.changed.connect(on_changed, dispatcher=thread)
+    producer.changed.emit(1)
+    assert done.wait(2)
+    dispatcher.stop()
+    thread.join(2)
+    assert values == [(thread, 1)]
+
+    # A dispatcher that is created for a thread is used by the thread's process_events()
+    processed = []
+
+    def run():
+        own = Dispatcher()
+        own.post(processed.append, (own,))
+        process_events()
+    run_in_thread(run)
+    assert len(processed) == 1
+
+    print("test_dispatcher_registered passed!")
+
+
+def test_dispatcher_thread_exit():
+    # The dispatcher of a thread that finished is removed
+    gc.collect()
+    count = len(DISPATCHERS)
+    dispatchers = []
+    run_in_thread(lambda: dispatchers.append(get_dispatcher()))
+    gc.collect()
+    assert len(DISPATCHERS) == count
+    assert dispatchers[0].thread is None
+
+    print("test_dispatcher_thread_exit passed!")
+
+
+if __name__ == '__main__':
+    test_queued_connection()
+    test_queued_coalesce()
+    test_dispatcher_thread()
+    test_dispatcher_registered()
+    test_dispatcher_thread_exit()
+    print("All tests passed!")
@@ -0,0 +1,330 @@
+from __future__ import print_function
+
+import threading
+
+from event_signal import Signal, signaler, signaler_property, ManualScheduler, ThreadScheduler, Throttle, \
+    Debounce, rate_limit, on_signal, off_signal, get_signal, update, signaler_slots
+
+
+def test_throttle():
+    scheduler = ManualScheduler()
+    values = []
+    throttled = Throttle(values.append, 1, scheduler)
+
+    throttled(1)  # Leading call
+    assert values == [1]
+    throttled(2)
+    throttled(3)
+    assert values == [1]
+    scheduler.advance(0.5)
+    assert values == [1]
+    scheduler.advance(0.5)
+    assert values == [1, 3], values  # Last value is always delivered
+
+    # Trailing call started a new interval
+    throttled(4)
+    assert values == [1, 3]
+    scheduler.advance(1)
+    assert values == [1, 3, 4]
+
+    # Idle longer than the interval calls immediately
+    scheduler.advance(5)
+    throttled(5)
+    assert values == [1, 3, 4, 5]
+
+    # Flush the pending value now
+    throttled(6)
+    throttled.flush()
+    assert values == [1, 3, 4, 5, 6]
+    scheduler.advance(1)
+    assert values == [1, 3, 4, 5, 6]
+
+    print("test_throttle passed!")
+
+
+def test_debounce():
+    scheduler = ManualScheduler()
+    values = []
+    debounced = Debounce(values.append, 1, scheduler)
+
+    debounced(1)
+    scheduler.advance(0.5)
+    debounced(2)
+    scheduler.advance(0.5)
+    debounced(3)
+    scheduler.advance(0.9)
+    assert values == []
+    scheduler.advance(0.1)
+    assert values == [3]
+    scheduler.advance(10)
+    assert values == [3]
+
+    try:
+        rate_limit(values.append, throttle=1, debounce=1)
+        raise AssertionError("Throttle and debounce cannot be combined")
+    except ValueError:
+        pass
+    assert rate_limit(values.append) == values.append
+
+    print("test_debounce passed!")
+
+
+def test_signal_rate_limit():
+    class Sensor(object):
+        value_changed = Signal(float, throttle=1)
+        settled = Signal(float, debounce=1)
+        raw = Signal(float)
+
+    with ManualScheduler() as scheduler:
+        sensor = Sensor()
+        values = []
+        settled = []
+        sensor.value_changed.connect(values.append)
+        sensor.value_changed.connect(lambda value: values.append(-value))
+        sensor.settled.connect(settled.append)
+
+        for i in range(10):
+            sensor.value_changed.emit(i)
+            sensor.settled(i)
+            scheduler.advance(0.25)
+        assert values == [0, -0, 3, -3, 7, -7], values
+        assert settled == []
+        scheduler.advance(2)
+        assert values == [0, -0, 3, -3, 7, -7, 9, -9], values
+        assert settled == [9]
+
+        # Per connection rate limit
+        raw = []
+        slow = []
+        sensor.raw.connect(raw.append)
+        sensor.raw.connect(slow.append, throttle=1)
+        for i in range(4):
+            sensor.raw.emit(i)
+            scheduler.advance(0.25)
+        scheduler.advance(1)
+        assert raw == [0, 1, 2, 3]
+        assert slow == [0, 3]
+
+        # Disconnect the original function
+        sensor.raw.disconnect(slow.append)
+        assert sensor.raw.get_signal("change") == [raw.append]
+
+        # Other instances have their own rate limit
+        other = Sensor()
+        other_values = []
+        other.value_changed.connect(other_values.append)
+        other.value_changed.emit(1)
+        assert other_values == [1]
+
+    try:
+        Signal(int, speed=1)
+        raise AssertionError("Unknown keyword arguments should raise a TypeError")
+    except TypeError:
+        pass
+
+    print("test_signal_rate_limit passed!")
+
+
+def test_property_rate_limit():
+    class Slider(object):
+        def __init__(self):
+            self._value = 0
+            self.changes = []
+            self.slow_changes = []
+
+        def get_value(self):
+            return self._value
+
+        def set_value(self, value):
+            self._value = value
+
+        value = signaler_property(get_value, set_value, throttle=1)
+
+        @signaler_property
+        def position(self):
+            return self._value
+
+        @position.setter
+        def position(self, value):
+            self._value = value
+
+        @value.on("change")
+        def value_changed(self, value):
+            self.changes.append(value)
+
+        @position.on("change", debounce=1)
+        def position_changed(self, value):
+            self.slow_changes.append(value)
+
+    with ManualScheduler() as scheduler:
+        s1 = Slider()
+        s2 = Slider()
+        for i in range(1, 6):
+            s1.value = i
+            s2.position = i
+            s2.position = i * 10
+            scheduler.advance(0.3)
+        assert s1.changes == [1, 4], s1.changes
+        assert s2.slow_changes == []
+        scheduler.advance(1)
+        assert s1.changes == [1, 4, 5], s1.changes
+        assert s2.slow_changes == [50]
+        assert s1.slow_changes == []
+
+        # Instance callbacks after the instance has its own signals
+        values = []
+        Slider.value.on(s1, "change", values.append)
+        s1.value = 6
+        s1.value = 7
+        scheduler.advance(1)
+        assert values == [7], values  # 6 was set during the interval
+        assert s1.changes == [1, 4, 5, 7], s1.changes
+
+        # update() uses the rate limit of the property
+        s3 = Slider()
+        update(s3, value=1)
+        update(s3, value=2)
+        assert s3.changes == [1], s3.changes
+        scheduler.advance(1)
+        assert s3.changes == [1, 2], s3.changes
+
+    # on_signal works for any signaler
+    class Model(object):
+        @signaler
+        def set_x(self, value):
+            self.x = value
+
+    with ManualScheduler() as scheduler:
+        m = Model()
+        values = []
+        on_signal(m.set_x, "change", values.append, debounce=0.5)
+        m.set_x(1)
+        m.set_x(2)
+        scheduler.advance(0.5)
+        assert values == [2]
+        off_signal(m.set_x, "change", values.append)
+        assert get_signal(m.set_x, "change") == []
+
+    print("test_property_rate_limit passed!")
+
+
+def test_untracked_instance_rate_limit():
+    class Unhashable(object):
+        __hash__ = None
+
+        def __init__(self):
+            self.changes = []
+
+        @signaler
+        def set_x(self, value):
+            self._x = value
+
+        @set_x.on("change", throttle=1)
+        def x_changed(self, value):
+            self.changes.append(value)
+
+    class Slotted(object):
+        __slots__ = ('_x', 'changes') + signaler_slots('x', 'set_y')
+
+        def __init__(self):
+            self._x = None
+            self.changes = []
+
+        @signaler_property
+        def x(self):
+            return self._x
+
+        @x.setter
+        def x(self, value):
+            self._x = value
+
+        @x.on("change", throttle=1)
+        def x_changed(self, value):
+            self.changes.append(value)
+
+        @signaler
+        def set_y(self, value):
+            self._x = value
+
+        @set_y.on("change", debounce=1)
+        def y_changed(self, value):
+            self.changes.append(value)
+
+    with ManualScheduler() as scheduler:
+        u = Unhashable()
+        s = Slotted()
+        for i in range(5):
+            u.set_x(i)
+            s.x = i
+        scheduler.advance(1)
+        assert u.changes == [0, 4], u.changes
+        assert s.changes == [0, 4], s.changes
+
+        # Every object has its own rate limit
+        s2 = Slotted()
+        s2.x = 10
+        assert s2.changes == [10]
+
+        for i in range(5):
+            s.set_y(i)
+        assert s.changes == [0, 4]
+        scheduler.advance(1)
+        assert s.changes == [0, 4, 4], s.changes
+
+    print("test_untracked_instance_rate_limit passed!")
+
+
+def test_thread_scheduler():
+    scheduler = ThreadScheduler()
+    values = []
+    done = threading.Event()
+
+    def append(value):
+        values.append(value)
+        if value == 9:
+            done.set()
+
+    throttled = Throttle(append, 0.05, scheduler)
+    for i in range(10):
+        throttled(i)
+    assert done.wait(2)
+    assert values == [0, 9]
+
+    print("test_thread_scheduler passed!")
+
+
+def test_asyncio_scheduler():
+    try:
+        import asyncio
+        from event_signal import AsyncioScheduler
+    except ImportError:  # Python 2
+        return
+
+    loop = asyncio.new_event_loop()
+    try:
+        scheduler = AsyncioScheduler(loop)
+        values = []
+        debounced = Debounce(values.append, 0.01, scheduler)
+        for i in range(5):
+            debounced(i)
+
+        # Fire from another thread
+        thread = threading.Thread(target=debounced, args=(5,))
+        thread.start()
+        thread.join()
+        loop.run_until_complete(asyncio.sleep(0.1))
+        assert values == [5]
+    finally:
+        loop.close()
+
+    print("test_asyncio_scheduler passed!")
+
+
+if __name__ == '__main__':
+    test_throttle()
+    test_debounce()
+    test_signal_rate_limit()
+    test_property_rate_limit()
+    test_thread_scheduler()
+    test_asyncio_scheduler()
+    print("All tests passed!")
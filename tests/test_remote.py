@@ -0,0 +1,207 @@
+from __future__ import print_function
+
+import multiprocessing
+import socket
+import struct
+import threading
+import time
+
+from event_signal import Signal, SignalBridge, ManualScheduler, get_scheduler
+from event_signal.remote import encode_frame, FrameDecoder
+
+
+def test_frames():
+    messages = [("a", (1,), None), ("b", (), {"x": 2})]
+    data = encode_frame(messages) + encode_frame([("c", ("text",), None)])
+
+    # Frames can be split at any byte
+    decoder = FrameDecoder()
+    batches = []
+    for i in range(0, len(data), 3):
+        batches.extend(decoder.feed(data[i:i + 3]))
+    assert batches == [messages, [("c", ("text",), None)]]
+    assert len(decoder.buffer) == 0
+
+    # A corrupt frame is skipped without losing the other frames
+    corrupt = struct.pack("!I", 12) + b"not a pickle"
+    data = encode_frame(messages) + corrupt + encode_frame([("c", (), None)])
+    assert decoder.feed(data) == [messages, [("c", (), None)]]
+    assert len(decoder.buffer) == 0
+    assert decoder.feed(encode_frame(messages)) == [messages]
+
+    print("test_frames passed!")
+
+
+def check_bridge(conn1, conn2):
+    with ManualScheduler() as scheduler:
+        sender = SignalBridge(conn1, flush_interval=0.01, batch_size=3, scheduler=scheduler)
+        receiver = SignalBridge(conn2)
+        values = []
+        receiver.signal("value").connect(lambda *args, **kwargs: values.append((args, kwargs)))
+        remote = sender.remote("value")
+
+        # Full batches are written immediately
+        remote.emit(1)
+        remote.emit(2)
+        remote.emit(3, key="x")
+        assert receiver.receive() == 3
+        assert values == [((1,), {}), ((2,), {}), ((3,), {"key": "x"})]
+
+        # Partial batches are written after the flush interval
+        del values[:]
+        remote.emit(4)
+        sender.remote("nobody listens").emit(5)
+        scheduler.advance(0.01)
+        assert receiver.receive() == 2
+        assert values == [((4,), {})]
+
+        # A callback function error does not lose the rest of the batch
+        def fail(value):
+            if value == 5:
+                raise ValueError(value)
+        receiver.signal("value").connect(fail)
+        for i in range(5, 8):
+            remote.emit(i)
+        assert receiver.receive() == 3
+        assert values == [((4,), {}), ((5,), {}), ((6,), {}), ((7,), {})]
+        receiver.signal("value").disconnect(fail)
+        del values[1:]
+
+        # Forward a local signal and receive in a thread
+        class Model(object):
+            changed = Signal(int)
+
+        model = Model()
+        sender.forward(model.changed, "value")
+        thread = receiver.start()
+        for i in range(10):
+            model.changed.emit(i)
+        sender.close()
+        thread.join(2)
+        assert not thread.is_alive()
+        assert values == [((4,), {})] + [((i,), {}) for i in range(10)]
+        receiver.close()
+
+
+def test_bridge_pipe():
+    conn1, conn2 = multiprocessing.Pipe()
+    check_bridge(conn1, conn2)
+    print("test_bridge_pipe passed!")
+
+
+def test_bridge_socket():
+    sock1, sock2 = socket.socketpair()
+    check_bridge(sock1, sock2)
+    print("test_bridge_socket passed!")
+
+
+def test_bridge_scheduler():
+    conn1, conn2 = multiprocessing.Pipe()
+    sender = SignalBridge(conn1, flush_interval=0.01)
+    receiver = SignalBridge(conn2)
+    values = []
+    receiver.signal("value").connect(values.append)
+
+    # The flush timer runs in the bridge's own thread, not in the shared scheduler
+    sender.remote("value").emit(1)
+    assert sender.scheduler is not None
+    assert sender.scheduler is not get_scheduler()
+    assert receiver.receive() == 1
+    assert values == [1]
+
+    # Closing the bridge stops the scheduler thread that it created
+    thread = sender.scheduler.thread
+    sender.close()
+    thread.join(2)
+    assert not thread.is_alive()
+    receiver.close()
+
+    print("test_bridge_scheduler passed!")
+
+
+class SlowTransport(object):
+    """Transport that blocks in send() until it is released."""
+    def __init__(self):
+        self.frames = []
+        self.writing = threading.Event()
+        self.release = threading.Event()
+
+    def send(self, data):
+        self.writing.set()
+        assert self.release.wait(2)
+        self.frames.append(data)
+
+    def recv(self):
+        return b''
+
+    def close(self):
+        pass
+
+
+def test_bridge_slow_write():
+    transport = SlowTransport()
+    with ManualScheduler() as scheduler:
+        bridge = SignalBridge(transport, flush_interval=0.01, batch_size=2, scheduler=scheduler)
+        remote = bridge.remote("value")
+
+        # A full batch is written in another thread and blocks in the transport
+        writer = threading.Thread(target=lambda: (remote.emit(1), remote.emit(2)))
+        writer.start()
+        assert transport.writing.wait(2)
+
+        # The next frame waits for the first one without blocking send()
+        remote.emit(3)
+        flusher = threading.Thread(target=bridge.flush)
+        flusher.start()
+        time.sleep(0.05)
+        remote.emit(4)
+        assert bridge.pending == [("value", (4,), None)]
+        transport.release.set()
+        writer.join(2)
+        flusher.join(2)
+        bridge.flush()
+
+    decoder = FrameDecoder()
+    assert decoder.feed(b"".join(transport.frames)) == [[("value", (1,), None), ("value", (2,), None)],
+                                                       [("value", (3,), None)], [("value", (4,), None)]]
+
+    print("test_bridge_slow_write passed!")
+
+
+def send_values(conn, count):
+    bridge = SignalBridge(conn, batch_size=100)
+    value = bridge.remote("value")
+    for i in range(count):
+        value.emit(i)
+    bridge.close()
+
+
+def test_bridge_process():
+    try:
+        ctx = multiprocessing.get_context("fork")
+    except ValueError:  # Windows
+        return
+
+    parent, child = ctx.Pipe()
+    process = ctx.Process(target=send_values, args=(child, 1000))
+    process.start()
+    child.close()
+
+    bridge = SignalBridge(parent)
+    values = []
+    bridge.signal("value").connect(values.append)
+    bridge.start().join(5)
+    process.join(5)
+    assert values == list(range(1000))
+
+    print("test_bridge_process passed!")
+
+
+if __name__ == '__main__':
+    test_frames()
+    test_bridge_pipe()
+    test_bridge_socket()
+    test_bridge_scheduler()
+    test_bridge_slow_write()
+    test_bridge_process()
+    print("All tests passed!")
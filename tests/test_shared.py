@@ -0,0 +1,137 @@
+from __future__ import print_function
+
+import multiprocessing
+import time
+
+from event_signal import shared_property, share_state, get_shared_state, batch
+from event_signal.shared import SEQUENCE
+
+
+class Model(object):
+    x = shared_property('d')
+    count = shared_property('q', default=5)
+    enabled = shared_property('?', default=True)
+
+
+def test_shared_property():
+    model = Model()
+    try:
+        model.x
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("The shared state was not created")
+
+    with share_state(model) as state:
+        try:
+            assert get_shared_state(model) is state
+            assert (model.x, model.count, model.enabled) == (0, 5, True)
+
+            values = []
+            Model.x.on(model, "change", values.append)
+            model.x = 1.5
+            model.x = 1.5  # No change
+            assert model.x == 1.5
+            assert values == [1.5]
+
+            # Other objects see the values and fire the signals when they poll
+            other = Model()
+            with share_state(other, state.name) as other_state:
+                assert not other_state.created
+                assert (other.x, other.count) == (1.5, 5)
+                other_values = []
+                Model.count.on(other, "change", other_values.append)
+                assert other_state.poll() == 0
+
+                model.count = 10
+                model.count = 11
+                assert other_state.poll() == 1
+                assert other_values == [11]
+                assert state.poll() == 0  # Values that this object wrote already fired
+
+                other.count = 12
+                assert state.poll() == 1
+                assert model.count == 12
+                assert other_values == [11, 12]
+
+                with batch():
+                    model.count = 13
+                    assert other_values == [11, 12]
+                assert other_values == [11, 12]  # Batches are local
+                other_state.poll()
+                assert other_values == [11, 12, 13]
+
+                # Without a lock a write can lose the increment of the global counter, but the field counter changed
+                state.poll()
+                sequence = SEQUENCE.unpack_from(state.buf, 0)[0]
+                other.count = 14
+                SEQUENCE.pack_into(state.buf, 0, sequence)
+                assert state.poll() == 1
+                assert model.count == 14
+
+                # A writer that stopped in the middle of a write does not hang the readers
+                offset = state.offsets[Model.x]
+                sequence = SEQUENCE.unpack_from(state.buf, offset)[0]
+                SEQUENCE.pack_into(state.buf, offset, sequence | 1)
+                state.read_timeout = 0.01
+                try:
+                    model.x
+                except TimeoutError:
+                    pass
+                else:
+                    raise AssertionError("Reading a field that is being written should time out")
+                SEQUENCE.pack_into(state.buf, offset, sequence)
+
+            # The field name does not replace the signaler name
+            assert Model.x.field_name == "x"
+            assert Model.x.name == str(id(Model.x))
+        finally:
+            state.unlink()
+
+    try:
+        Model.x.setter(lambda self, value: None)
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("shared_property allowed a setter")
+
+    print("test_shared_property passed!")
+
+
+def write_values(name, count):
+    model = Model()
+    with share_state(model, name, create=False):
+        for i in range(1, count + 1):
+            model.count = i
+
+
+def test_shared_process():
+    ctx = multiprocessing.get_context()
+    model = Model()
+    with share_state(model) as state:
+        try:
+            values = []
+            Model.count.on(model, "change", values.append)
+            state.start(interval=0.001)
+
+            process = ctx.Process(target=write_values, args=(state.name, 1000))
+            process.start()
+            process.join(10)
+            assert process.exitcode == 0
+            assert model.count == 1000
+
+            start = time.time()
+            while (not values or values[-1] != 1000) and time.time() - start < 5:
+                time.sleep(0.001)
+            assert values[-1] == 1000
+            assert values == sorted(values)  # Values may be skipped, but never go back
+        finally:
+            state.unlink()
+
+    print("test_shared_process passed!")
+
+
+if __name__ == '__main__':
+    test_shared_property()
+    test_shared_process()
+    print("All tests passed!")
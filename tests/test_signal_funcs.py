@@ -1,6 +1,8 @@
 from __future__ import print_function
 
-from event_signal import SignalError, get_signal, on_signal, off_signal, fire_signal, block_signals, add_signal
+from event_signal import SignalError, get_signal, on_signal, off_signal, fire_signal, block_signals, blocked, \
+    is_blocked, add_signal, batch, signaler, signaler_property, fire_signal_async, SignalerInstance, ManualScheduler
+from event_signal.interface import fire_nothing, get_dispatch, CallbackSet, SignalTable, SIGNAL_SLOTS, CHANGE
 
 
 def test_add_signal_to_class():
@@ -157,6 +159,34 @@ def test_on_signal():
     # Test disconnect
     t.event_signals["testing"].remove(testing)
     assert t.event_signals["testing"] == []
+    fire_signal(t, "testing", "def", "456")
+    assert test == [("abc", "123")]
+
+    # The connected callback functions of a signaler can be changed like a list
+    sig = signaler(lambda value: None)
+    sig.on("change", print)
+    sig.event_signals["change"].remove(print)
+    sig.fire("change", 1, 2)
+    sig.event_signals["change"].append(testing)
+    sig.fire("change", 3, 4)
+    sig.event_signals["change"].remove(testing)
+    sig.fire("change", 5, 6)
+    assert test == [("abc", "123"), (3, 4)]
+    try:
+        sig.event_signals["change"].remove(testing)
+        raise AssertionError("Removing a missing callback function should raise a ValueError")
+    except ValueError:
+        pass
+    del test[1:]
+
+    # Replacing the callback functions of a SignalTable removes the precompiled dispatch function
+    sig = signaler(lambda value: None)
+    sig.on("change", testing)
+    sig.fire("change", 1, 2)
+    sig.event_signals["change"] = ()
+    sig.fire("change", 3, 4)
+    fire_signal(sig, "change", 5, 6)
+    assert test == [("abc", "123"), (1, 2)]
 
     print("test_on_signal passed!")
 
@@ -271,6 +301,441 @@ def test_block_signal():
     print("test_block_signal passed!")
 
 
+def test_nested_block_signal():
+    class SignalTest(object):
+        def __init__(self):
+            super(SignalTest, self).__init__()
+            self.event_signals = {"testing": (), "test2": ()}
+
+    t = SignalTest()
+    test = []
+
+    def testing(value):
+        test.append(value)
+
+    on_signal(t, "testing", testing)
+
+    # Blocking is counted
+    block_signals(t, "testing")
+    block_signals(t)
+    assert is_blocked(t, "testing")
+    assert is_blocked(t, "test2")
+    block_signals(t, "testing", False)
+    fire_signal(t, "testing", 1)
+    assert test == []
+    assert get_signal(t, "testing") == [testing]
+
+    block_signals(t, block=False)
+    assert not is_blocked(t, "testing")
+    assert not is_blocked(t, "test2")
+    fire_signal(t, "testing", 2)
+    assert test == [2]
+
+    # Extra unblocks do not count
+    block_signals(t, "testing", False)
+    block_signals(t, "testing")
+    fire_signal(t, "testing", 3)
+    assert test == [2]
+    block_signals(t, "testing", False)
+
+    # Context manager
+    with blocked(t):
+        with blocked(t, "testing"):
+            fire_signal(t, "testing", 4)
+        fire_signal(t, "testing", 5)
+
+        # Connecting while blocked does not unblock
+        off_signal(t, "testing", testing)
+        on_signal(t, "testing", testing)
+        fire_signal(t, "testing", 6)
+    fire_signal(t, "testing", 7)
+    assert test == [2, 7]
+
+    print("test_nested_block_signal passed!")
+
+
+def test_callback_set():
+    class Listener(object):
+        def notify(self, value):
+            pass
+
+        def __eq__(self, other):
+            return True  # Identity is used, not equality
+
+    listeners = [Listener() for _ in range(5)]
+    sig = CallbackSet()
+    for listener in listeners:
+        assert sig.add(listener.notify)
+        assert not sig.add(listener.notify)
+
+    # Bound methods are new objects every access
+    assert len(sig) == 5
+    assert all(listener.notify in sig for listener in listeners)
+    assert list(sig) == [listener.notify for listener in listeners]
+
+    # Order is kept when removing items
+    assert sig.discard(listeners[1].notify)
+    assert not sig.discard(listeners[1].notify)
+    assert listeners[1].notify not in sig
+    assert sig == [listeners[i].notify for i in (0, 2, 3, 4)]
+    sig.add(listeners[1].notify)
+    assert sig == tuple(listeners[i].notify for i in (0, 2, 3, 4, 1))
+
+    # Iterating uses a snapshot
+    for func in sig:
+        sig.discard(func)
+    assert len(sig) == 0
+    assert sig == ()
+
+    print("test_callback_set passed!")
+
+
+def test_signal_table():
+    table = SignalTable()
+    assert len(table) == 0
+    assert "change" not in table
+
+    # Registered signals are stored in the builtin list by slot
+    table["change"] = ()
+    assert SIGNAL_SLOTS["change"] == CHANGE
+    assert table.builtin[CHANGE] == ()
+    assert table.custom is None
+    assert "change" in table
+    assert table["change"] == ()
+
+    # Custom signals are stored in a dict
+    table["custom signal"] = (print,)
+    assert table.custom == {"custom signal": (print,)}
+    assert table == {"change": (), "custom signal": (print,)}
+    assert table.keys() == ["change", "custom signal"]
+    assert table.get("delete") is None
+
+    try:
+        table["delete"]
+        raise AssertionError("SignalTable should raise a KeyError for a missing signal.")
+    except KeyError:
+        pass
+
+    assert table.pop("change") == ()
+    assert table.builtin[CHANGE] is None
+    del table["custom signal"]
+    assert len(table) == 0
+
+    print("test_signal_table passed!")
+
+
+def test_weak_callbacks():
+    import gc
+
+    class SignalTest(object):
+        def __init__(self):
+            super(SignalTest, self).__init__()
+            self.event_signals = {"testing": ()}
+
+    class Listener(object):
+        def __init__(self):
+            self.values = []
+
+        def notify(self, value):
+            self.values.append(value)
+
+    t = SignalTest()
+    listener = Listener()
+    strong_listener = Listener()
+    on_signal(t, "testing", listener.notify, weak=True)
+    on_signal(t, "testing", strong_listener.notify)
+    assert get_signal(t, "testing") == [listener.notify, strong_listener.notify]
+    assert listener.notify in t.event_signals["testing"]
+
+    fire_signal(t, "testing", 1)
+    assert listener.values == [1]
+    assert strong_listener.values == [1]
+
+    # Deleting the listener removes the callback without the garbage collector
+    gc.disable()
+    try:
+        values = listener.values
+        del listener
+        assert get_signal(t, "testing") == [strong_listener.notify]
+        fire_signal(t, "testing", 2)
+        assert values == [1]
+        assert strong_listener.values == [1, 2]
+    finally:
+        gc.enable()
+
+    # Weak callbacks can be disconnected like normal callbacks
+    listener = Listener()
+    on_signal(t, "testing", listener.notify, weak=True)
+    assert off_signal(t, "testing", listener.notify)
+    assert get_signal(t, "testing") == [strong_listener.notify]
+
+    print("test_weak_callbacks passed!")
+
+
+def test_dispatch():
+    class SignalTest(object):
+        def __init__(self):
+            super(SignalTest, self).__init__()
+            self.event_signals = {"testing": []}
+
+    t = SignalTest()
+    assert get_dispatch(t, "testing") is fire_nothing
+
+    test = []
+
+    def testing(value):
+        test.append(("testing", value))
+
+    def testing2(value):
+        test.append(("testing2", value))
+
+    # Single callback is called directly
+    on_signal(t, "testing", testing)
+    assert get_dispatch(t, "testing") is testing
+    fire_signal(t, "testing", 1)
+    assert test == [("testing", 1)]
+
+    # Multiple callbacks are called in order
+    on_signal(t, "testing", testing2)
+    fire_signal(t, "testing", 2)
+    assert test == [("testing", 1), ("testing", 2), ("testing2", 2)]
+
+    # Blocking replaces the dispatch
+    block_signals(t, "testing")
+    assert get_dispatch(t, "testing") is fire_nothing
+    fire_signal(t, "testing", 3)
+    assert test == [("testing", 1), ("testing", 2), ("testing2", 2)]
+    block_signals(t, "testing", False)
+
+    off_signal(t, "testing", testing)
+    assert get_dispatch(t, "testing") is testing2
+    off_signal(t, "testing", None)
+    assert get_dispatch(t, "testing") is fire_nothing
+
+    try:
+        fire_signal(t, 'signal that does not exist')
+        raise AssertionError("fire_signal should raise an error if the signal does not exist.")
+    except SignalError:
+        pass
+
+    # SignalerInstance subclasses can use their own dict of signals
+    class DictSignaler(SignalerInstance):
+        def __init__(self):
+            self.event_signals = {"testing": []}
+
+    sig = DictSignaler()
+    sig.on("testing", testing)
+    sig.fire("testing", 4)
+    assert test[-1] == ("testing", 4)
+
+    print("test_dispatch passed!")
+
+
+def test_modify_while_firing():
+    class SignalTest(object):
+        def __init__(self):
+            super(SignalTest, self).__init__()
+            self.event_signals = {"testing": ()}
+
+    t = SignalTest()
+    test = []
+
+    def first(value):
+        test.append(("first", value))
+        off_signal(t, "testing", second)
+        on_signal(t, "testing", third)
+
+    def second(value):
+        test.append(("second", value))
+
+    def third(value):
+        test.append(("third", value))
+
+    on_signal(t, "testing", first)
+    on_signal(t, "testing", second)
+
+    # The fire that is running keeps calling the callbacks that were connected when it started
+    fire_signal(t, "testing", 1)
+    assert test == [("first", 1), ("second", 1)]
+    assert t.event_signals["testing"] == (first, third)
+
+    # Later fires use the new callbacks
+    test = []
+    fire_signal(t, "testing", 2)
+    assert test == [("first", 2), ("third", 2)]
+
+    print("test_modify_while_firing passed!")
+
+
+def test_batch():
+    class Point(object):
+        def __init__(self):
+            self._x = 0
+            self._y = 0
+
+        @signaler_property
+        def x(self):
+            return self._x
+
+        @x.setter
+        def x(self, value):
+            self._x = value
+
+        @signaler
+        def set_y(self, value):
+            self._y = value
+
+    p1 = Point()
+    p2 = Point()
+    changes = []
+    Point.x.on("change", lambda self, value: changes.append((self, "x", value)))
+    Point.set_y.on("change", lambda self, value: changes.append((self, "y", value)))
+    p2_changes = []
+    Point.x.on(p2, "change", p2_changes.append)
+
+    with batch():
+        for i in range(1, 11):
+            p1.x = i
+            p1.set_y(i * 10)
+            p2.x = -i
+        assert changes == [], "The change signals should be deferred"
+        with batch():
+            p1.x = 11
+        assert changes == [], "Nested batches should only fire when the outermost batch exits"
+    assert changes == [(p1, "x", 11), (p1, "y", 100), (p2, "x", -10)]
+    assert p2_changes == [-10]
+
+    # Only defer the signals of one object
+    del changes[:]
+    with batch(p1):
+        p1.x = 1
+        p1.x = 2
+        p2.x = 1
+        assert changes == [(p2, "x", 1)]
+    assert changes == [(p2, "x", 1), (p1, "x", 2)]
+
+    # Deferred signals still fire when an error occurs
+    del changes[:]
+    try:
+        with batch():
+            p1.x = 3
+            raise ValueError
+    except ValueError:
+        pass
+    assert changes == [(p1, "x", 3)]
+
+    # Callbacks that an object connects in the batch are called with the deferred value
+    del changes[:]
+    p3 = Point()
+    p3_changes = []
+    with batch():
+        p3.x = 1
+        p3.set_y(2)
+        Point.x.on(p3, "change", p3_changes.append)
+        p3.set_y.on("change", p3_changes.append)
+    assert changes == [(p3, "x", 1), (p3, "y", 2)]
+    assert p3_changes == [1, 2]
+
+    # Deferred changes use the rate limit of the property
+    class Slider(object):
+        def __init__(self):
+            self._value = 0
+
+        def get_value(self):
+            return self._value
+
+        def set_value(self, value):
+            self._value = value
+
+        value = signaler_property(get_value, set_value, throttle=1)
+
+    values = []
+    Slider.value.on("change", lambda self, value: values.append(value))
+    with ManualScheduler() as scheduler:
+        s = Slider()
+        s.value = 1
+        with batch():
+            s.value = 2
+        assert values == [1], "The deferred change is in the throttle interval"
+        scheduler.advance(1)
+        assert values == [1, 2]
+
+    print("test_batch passed!")
+
+
+def test_fire_async():
+    import asyncio
+
+    running = []
+    max_running = []
+
+    async def write(value):
+        running.append(value)
+        max_running.append(len(running))
+        await asyncio.sleep(0.01)
+        running.remove(value)
+
+    class Model(object):
+        def __init__(self):
+            self.saved = []
+
+        @signaler
+        def set_x(self, value):
+            self.x = value
+
+        @set_x.on("change")
+        async def save_x(self, value):
+            await asyncio.sleep(0)
+            self.saved.append(value)
+
+    # Class level coroutine callbacks are called with the instance
+    m = Model()
+    asyncio.run(m.set_x.fire_async("change", 1))
+    assert m.saved == [1]
+    assert m.set_x.shares_signals
+
+    # Concurrency limit
+    add_signal(m, "save")
+    for i in range(6):
+        m.on("save", lambda value, i=i: write((i, value)))
+    asyncio.run(fire_signal_async(m, "save", 1))
+    assert max(max_running) == 6
+    del max_running[:]
+    asyncio.run(fire_signal_async(m, "save", 2, limit=2))
+    assert max(max_running) == 2
+    del max_running[:]
+    asyncio.run(fire_signal_async(m, "save", 3, concurrent=False))
+    assert max(max_running) == 1
+
+    # A limit less than 1 would never run the coroutines
+    del max_running[:]
+    for limit in (0, -1):
+        try:
+            asyncio.run(fire_signal_async(m, "save", 5, limit=limit))
+            raise AssertionError("A limit less than 1 should raise a ValueError")
+        except ValueError:
+            pass
+    assert max_running == []
+
+    # Errors do not leave coroutines that were never awaited
+    def fail(value):
+        raise ValueError(value)
+    m.on("save", fail)
+    try:
+        asyncio.run(fire_signal_async(m, "save", 4))
+        raise AssertionError("The callback error should be raised")
+    except ValueError:
+        pass
+
+    try:
+        fire_signal_async(m, "missing")
+        raise AssertionError("Missing signals should raise a SignalError")
+    except SignalError:
+        pass
+
+    print("test_fire_async passed!")
+
+
 if __name__ == '__main__':
     test_add_signal_to_class()
     test_add_signal_to_obj()
@@ -279,4 +744,12 @@ if __name__ == '__main__':
     test_off_signal()
     test_fire_signal()
     test_block_signal()
+    test_nested_block_signal()
+    test_callback_set()
+    test_signal_table()
+    test_weak_callbacks()
+    test_dispatch()
+    test_modify_while_firing()
+    test_batch()
+    test_fire_async()
     print("All tests passed!")
@@ -147,7 +147,144 @@ def test_signal_block():
     print("test_signal_block passed!")
 
 
+def test_signal_connect_weak():
+    class MyClass(object):
+        something = Signal(str)
+
+    class Listener(object):
+        def __init__(self):
+            self.values = []
+
+        def notify(self, value):
+            self.values.append(value)
+
+    t = MyClass()
+    listener = Listener()
+    t.something.connect(listener.notify, weak=True)
+    t.something.emit("a")
+    assert listener.values == ["a"]
+
+    values = listener.values
+    del listener
+    assert t.something.get_signal("change") == []
+    t.something.emit("b")
+    assert values == ["a"]
+
+    print("test_signal_connect_weak passed!")
+
+
+def test_signal_emit_async():
+    import asyncio
+
+    class MyClass(object):
+        something = Signal(str)
+
+    events = []
+
+    async def slow(value):
+        events.append(("slow start", value))
+        await asyncio.sleep(0.02)
+        events.append(("slow end", value))
+
+    async def fast(value):
+        events.append(("fast start", value))
+        await asyncio.sleep(0)
+        events.append(("fast end", value))
+
+    t = MyClass()
+    t.something.connect(slow)
+    t.something.connect(lambda value: events.append(("sync", value)))
+    t.something.connect(fast)
+
+    # Sync callbacks run inline and the coroutines run concurrently
+    asyncio.run(t.something.emit_async("a"))
+    assert events == [("sync", "a"), ("slow start", "a"), ("fast start", "a"), ("fast end", "a"), ("slow end", "a")]
+
+    # Sequential
+    del events[:]
+    asyncio.run(t.something.emit_async("b", concurrent=False))
+    assert events == [("slow start", "b"), ("slow end", "b"), ("sync", "b"), ("fast start", "b"), ("fast end", "b")]
+
+    # Blocked
+    del events[:]
+    t.something.block()
+    asyncio.run(t.something.emit_async("c"))
+    assert events == []
+
+    print("test_signal_emit_async passed!")
+
+
+def test_signal_executor():
+    import threading
+    from concurrent.futures import ThreadPoolExecutor, wait
+
+    release = threading.Event()
+    threads = []
+
+    def slow(value):
+        release.wait(2)
+        threads.append(threading.current_thread())
+        return value * 2
+
+    class MyClass(object):
+        something = Signal(int, executor=ThreadPoolExecutor(2))
+        inline = Signal(int)
+
+    t = MyClass()
+    t.something.connect(slow)
+    t.something.connect(lambda value: value + 1)
+
+    # The producer does not wait for the callbacks
+    futures = t.something.emit(1)
+    assert len(futures) == 2
+    assert not futures[0].done()
+    release.set()
+    wait(futures, 2)
+    assert [future.result() for future in futures] == [2, 2]
+    assert threading.current_thread() not in threads
+
+    # Per connection executor
+    pool = ThreadPoolExecutor(1)
+    values = []
+    t.inline.connect(values.append)
+    t.inline.connect(slow, executor=pool)
+    futures = t.inline.emit(3)
+    assert len(futures) == 1
+    assert futures[0].result(2) == 6
+    assert values == [3]
+    pool.shutdown(wait=True)
+    assert len(threads) == 2 and threads[-1] is not threading.current_thread()
+
+    # A rate limited connection with an executor is submitted once
+    from event_signal import ManualScheduler
+    calls = []
+    lock = threading.Lock()
+
+    def record(value):
+        with lock:
+            calls.append(value)
+
+    pool = ThreadPoolExecutor(1)
+    with ManualScheduler() as scheduler:
+        t.something.connect(record, executor=pool, throttle=1)
+        futures = t.something.emit(4)
+        assert len(futures) == 2, "The throttle should not be submitted to the signal's executor"
+        t.something.emit(5)
+        scheduler.advance(1)
+    pool.shutdown(wait=True)
+    assert calls == [4, 5], calls
+
+    # Disconnect the original function
+    t.inline.disconnect(slow)
+    assert t.inline.get_signal("change") == [values.append]
+
+    print("test_signal_executor passed!")
+
+
 if __name__ == '__main__':
     test_signal()
     test_signal_block()
+    test_signal_connect_weak()
+    test_signal_emit_async()
+    test_signal_executor()
     print("All tests passed!")
@@ -1,4 +1,8 @@
-from event_signal import signaler
+import gc
+import weakref
+
+from event_signal import signaler, signaler_slots, batch
+from event_signal.signaler import BoundSignalerDecoratorInstance, bound_signaler_class
 
 
 def test_simple_before_change_change():
@@ -354,6 +358,369 @@ def test_chaining():
     print("test_chaining passed!")
 
 
+def test_signaler_no_receivers():
+    class XTest(object):
+        def __init__(self, x=0):
+            self._x = x
+            self.getter_calls = 0
+
+        def get_x(self):
+            self.getter_calls += 1
+            return self._x
+
+        @signaler(getter=get_x)
+        def set_x(self, x):
+            self._x = x
+            return x
+
+    t = XTest()
+    assert t.set_x(1) == 1
+    assert t._x == 1
+    assert t.getter_calls == 0, "The getter should not be called when nobody is listening"
+
+    values = []
+    t.set_x.on("change", values.append)
+    assert t.set_x(2) == 2
+    assert t.getter_calls == 1
+    assert values == [2]
+
+    t.set_x.block()
+    t.set_x(3)
+    assert t.getter_calls == 1, "The getter should not be called when the signals are blocked"
+    assert values == [2]
+    t.set_x.block(block=False)
+
+    t.set_x.off("change", values.append)
+    t.set_x(4)
+    assert t._x == 4
+    assert t.getter_calls == 1
+
+    print("test_signaler_no_receivers passed!")
+
+
+def test_signaler_shared_callbacks():
+    class XTest(object):
+        def __init__(self, x=0):
+            self._x = x
+            self.changes = []
+
+        @signaler
+        def set_x(self, x):
+            self._x = x
+
+        @set_x.on("change")
+        def x_changed(self, x):
+            self.changes.append(x)
+
+    t1 = XTest()
+    t2 = XTest()
+    assert t1.set_x.shares_signals
+    t1.set_x(1)
+    t2.set_x(2)
+    assert t1.changes == [1]
+    assert t2.changes == [2]
+    assert t1.set_x.shares_signals, "Calling the signaler should not copy the class level callbacks"
+    assert t1.set_x is not t1.set_x
+    assert t1.set_x == t1.set_x, "Like bound methods the signalers of an object are equal"
+    assert hash(t1.set_x) == hash(t1.set_x)
+    assert t1.set_x != t2.set_x
+    assert len({t1.set_x, t1.set_x, t2.set_x}) == 2
+    assert {t1.set_x: 1}[t1.set_x] == 1
+    assert type(t1.set_x) is XTest.set_x.shared_class[1], "The class is cached until an object stores its signaler"
+    assert t1.set_x.get_signal("change") == [t1.x_changed]
+    assert t1.set_x.func == t1.set_x.func
+
+    # Class level callbacks are used by instances that share the class level callbacks
+    values = []
+
+    def record(self, x):
+        values.append((self, x))
+
+    XTest.set_x.on("change", record)
+    t1.set_x(3)
+    assert values == [(t1, 3)]
+
+    # Instance specific callbacks give the instance its own callbacks
+    t1_values = []
+    t1.set_x.on("change", t1_values.append)
+    assert XTest.set_x.shared_class is None
+    assert t1.set_x is t1.set_x
+    assert t1.set_x != t2.set_x
+    assert not t1.set_x.shares_signals
+    assert t2.set_x.shares_signals
+    t1.set_x(4)
+    t2.set_x(5)
+    assert t1.changes == [1, 3, 4]
+    assert t2.changes == [2, 5]
+    assert t1_values == [4]
+    assert values == [(t1, 3), (t1, 4), (t2, 5)]
+
+    # Removing a class level callback for an instance does not change the other instances
+    XTest.set_x.off("change", record)
+    t2.set_x.off("change", t2.x_changed)
+    t2.set_x(6)
+    XTest().set_x(7)
+    assert t2.changes == [2, 5]
+    assert values == [(t1, 3), (t1, 4), (t2, 5)]
+
+    # Blocking the class level signal blocks the instances that share the class level callbacks
+    t3 = XTest()
+    t3.set_x(8)
+    XTest.set_x.block("change")
+    t3.set_x(9)
+    t3.set_x.fire("change", 10)
+    assert t3.changes == [8]
+    XTest.set_x.block("change", False)
+    t3.set_x(11)
+    assert t3.changes == [8, 11]
+
+    print("test_signaler_shared_callbacks passed!")
+
+
+def test_signaler_no_reference_cycle():
+    class XTest(object):
+        def __init__(self, x=0):
+            self._x = x
+            self.changes = []
+
+        @signaler
+        def set_x(self, x):
+            self._x = x
+
+        @set_x.on("change")
+        def x_changed(self, x):
+            self.changes.append(x)
+
+    # An object that shares the class level callbacks is freed without the garbage collector
+    gc.disable()
+    try:
+        t = XTest()
+        t.set_x(1)
+        assert t.set_x.get_signal("change") == [t.x_changed]
+        assert t.changes == [1]
+        ref = weakref.ref(t)
+        del t
+        assert ref() is None, "The signaler should not create a reference cycle with the object"
+    finally:
+        gc.enable()
+
+    # Reading the signals does not stop the object from using new class level callbacks
+    t = XTest()
+    assert "change" in t.set_x.event_signals
+    values = []
+    XTest.set_x.on("change", lambda self, x: values.append(x))
+    t.set_x(2)
+    assert values == [2]
+    assert t.set_x.shares_signals
+
+    # Signalers that were created before the signals changed use the same callbacks
+    first = t.set_x
+    second = t.set_x
+    first.on("change", values.append)
+    second.off("change", t.x_changed)
+    assert first.get_signal("change") == second.get_signal("change") == t.set_x.get_signal("change")
+    second(3)
+    assert values == [2, 3, 3]
+    assert t.changes == [2]
+
+    # A batch fires once for the object even though every access creates a new signaler
+    t2 = XTest()
+    with batch():
+        t2.set_x(4)
+        t2.set_x(5)
+    assert t2.changes == [5]
+
+    # A signaler that is created for every access can be used as a callback function and disconnected
+    source = XTest()
+    target = XTest()
+    callbacks = source.set_x.get_signal("change")
+    source.set_x.on("change", target.set_x)
+    source.set_x.on("change", target.set_x)
+    assert len(source.set_x.get_signal("change")) == len(callbacks) + 1
+    source.set_x(6)
+    assert target._x == 6
+    assert source.set_x.off("change", target.set_x)
+    assert source.set_x.get_signal("change") == callbacks
+
+    # A weak callback keeps a weak reference to the object of the signaler
+    source.set_x.on("change", target.set_x, weak=True)
+    source.set_x(7)
+    assert target._x == 7
+    del target
+    assert source.set_x.get_signal("change") == callbacks
+
+    print("test_signaler_no_reference_cycle passed!")
+
+
+def test_signaler_slots():
+    class XTest(object):
+        __slots__ = ('_x',) + signaler_slots('set_x')
+
+        def __init__(self, x=0):
+            self._x = x
+
+        @signaler
+        def set_x(self, x):
+            self._x = x
+
+    class YTest(XTest):
+        __slots__ = ('_y',) + signaler_slots('set_x')
+
+        @signaler
+        def set_x(self, x):
+            self._y = x
+            super(YTest, self).set_x(x)
+
+    t = YTest()
+    values = []
+    y_values = []
+    XTest.set_x.get_signaler_instance(t).on("change", values.append)
+    t.set_x.on("change", y_values.append)
+    t.set_x(1)
+    assert t._x == 1
+    assert t._y == 1
+    assert values == [1]
+    assert y_values == [1]
+    assert t._XTest__set_x_signaler is not t._YTest__set_x_signaler
+
+    print("test_signaler_slots passed!")
+
+
+
+def test_signaler_executor():
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    pool = ThreadPoolExecutor(2)
+    calls = []
+
+    class XTest(object):
+        def __init__(self):
+            self.x = 0
+
+        @signaler(executor=pool)
+        def set_x(self, value):
+            self.x = value
+
+        @set_x.on("before_change")
+        def before_x(self, value):
+            calls.append(("before_change", value, threading.current_thread()))
+
+        @set_x.on("change")
+        def x_changed(self, value):
+            calls.append(("change", value, threading.current_thread()))
+
+    t = XTest()
+    t.set_x(1)
+    assert t.x == 1
+    t.set_x.on("change", lambda value: calls.append(("instance", value, threading.current_thread())))
+    t.set_x(2)
+    pool.shutdown(wait=True)
+
+    main = threading.current_thread()
+    assert ("before_change", 1, main) in calls
+    assert ("before_change", 2, main) in calls
+    changes = [call for call in calls if call[0] != "before_change"]
+    assert sorted(call[:2] for call in changes) == [("change", 1), ("change", 2), ("instance", 2)]
+    assert all(call[2] is not main for call in changes)
+
+    print("test_signaler_executor passed!")
+
+
+def test_signaler_generated_call():
+    class Point(object):
+        def __init__(self):
+            self.x = self.y = 0
+
+        def get_x(self):
+            return self.x
+
+        @signaler
+        def reset(self):
+            self.x = self.y = 0
+
+        @signaler
+        def move(self, x, y):
+            self.x, self.y = x, y
+            return x + y
+
+        @signaler(getter=get_x)
+        def set_x(self, x):
+            self.x = x
+
+        @signaler
+        def move_default(self, x, y=0):
+            self.x, self.y = x, y
+
+        @signaler
+        def move_args(self, *args):
+            self.x, self.y = args
+
+    p = Point()
+    # The signalers of each object are created from a subclass of the generated class for the signaler
+    assert type(p.move) is type(p.move) is Point.move.get_bound_class()
+    assert type(p.move).__bases__ == (bound_signaler_class(Point.move.func),)
+    assert type(p.move).__bases__ != (BoundSignalerDecoratorInstance,)
+    assert type(p.reset).__bases__ != (BoundSignalerDecoratorInstance,)
+    assert type(p.move_default).__bases__ == (BoundSignalerDecoratorInstance,)
+    assert type(p.move_args).__bases__ == (BoundSignalerDecoratorInstance,)
+    assert p.move.descriptor is Point.move
+    assert p.move.func.__self__ is p
+
+    # Class level callbacks
+    values = []
+
+    @Point.move.on("before_change")
+    def before_move(self, x, y):
+        values.append(("before", self, x, y))
+
+    @Point.move.on("change")
+    def after_move(self, x, y):
+        values.append(("change", self, x, y))
+
+    assert p.move(1, 2) == 3
+    assert p.move(y=4, x=3) == 7
+    assert values == [("before", p, 1, 2), ("change", p, 1, 2), ("before", p, 3, 4), ("change", p, 3, 4)]
+
+    # Instance callbacks
+    del values[:]
+    p.move.on("change", lambda x, y: values.append(("instance", x, y)))
+    p.move(5, 6)
+    assert values == [("before", p, 5, 6), ("change", p, 5, 6), ("instance", 5, 6)]
+
+    # Getter and batch
+    del values[:]
+    p.set_x.on("change", values.append)
+    with batch():
+        p.set_x(1)
+        p.set_x(2)
+        p.move(7, 8)
+        p.move(9, 10)
+    assert values == [("before", p, 7, 8), ("before", p, 9, 10), 2, ("change", p, 9, 10), ("instance", 9, 10)]
+
+    # Reset has no arguments
+    p.reset.on("change", lambda: values.append("reset"))
+    p.reset()
+    assert values[-1] == "reset"
+    assert (p.x, p.y) == (0, 0)
+
+    # Parameters with the names of the module globals do not change the generated call
+    class Counter(object):
+        @signaler
+        def add(self, CHANGE, fire_nothing, BATCH_STATE):
+            return CHANGE
+
+    c = Counter()
+    c.add.on("change", lambda *args: values.append(args))
+    assert c.add(0, 1, 2) == 0
+    assert c.add(50, None, None) == 50
+    assert values[-2:] == [(0, 1, 2), (50, None, None)]
+    assert type(c.add).__qualname__ == 'BoundSignalerDecoratorInstance(CHANGE, fire_nothing, BATCH_STATE)'
+    assert type(c.add).__qualname__ != type(p.move).__qualname__
+
+    print("test_signaler_generated_call passed!")
+
+
 if __name__ == '__main__':
     test_simple_before_change_change()
     test_signaler_getter_simple()
@@ -361,4 +728,10 @@ if __name__ == '__main__':
     test_signaler_instances()
     test_signaler_block()
     test_chaining()
+    test_signaler_no_receivers()
+    test_signaler_shared_callbacks()
+    test_signaler_no_reference_cycle()
+    test_signaler_slots()
+    test_signaler_executor()
+    test_signaler_generated_call()
     print("All tests passed!")
@@ -1,4 +1,7 @@
-from event_signal import signaler_property, signaler
+import gc
+import weakref
+
+from event_signal import signaler_property, signaler, signaler_slots, update, on_signal, batch
 
 
 def test_property():
@@ -337,6 +340,370 @@ def test_signal_dot_property():
     print("test_signal_dot_property passed!")
 
 
+def test_property_no_receivers():
+    class XTest(object):
+        def __init__(self, x=0):
+            self._x = x
+            self.getter_calls = 0
+
+        @signaler_property
+        def x(self):
+            self.getter_calls += 1
+            return self._x
+
+        @x.setter
+        def x(self, value):
+            self._x = value
+
+    t = XTest()
+    t.x = 1
+    assert t._x == 1
+    assert t.getter_calls == 1, "Only check_change should call the getter when nobody is listening"
+
+    values = []
+    XTest.x.on(t, "change", values.append)
+    t.x = 2
+    assert t.getter_calls == 3
+    assert values == [2]
+
+    print("test_property_no_receivers passed!")
+
+
+def test_property_shared_callbacks():
+    class XTest(object):
+        def __init__(self, x=0):
+            self._x = x
+            self.changes = []
+
+        @signaler_property
+        def x(self):
+            return self._x
+
+        @x.setter
+        def x(self, value):
+            self._x = value
+
+        @x.deleter
+        def x(self):
+            self._x = None
+
+        @x.on("change")
+        def x_changed(self, value):
+            self.changes.append(value)
+
+    t1 = XTest()
+    t2 = XTest()
+    t1.x = 1
+    t2.x = 2
+    del t2.x
+    assert t1.changes == [1]
+    assert t2.changes == [2]
+    assert t2._x is None
+    assert XTest.x.get_signaler_instance(t1).shares_signals
+    assert XTest.x.get_signal(t1, "change") == [t1.x_changed]
+
+    XTest.x.on(t1, "change", lambda value: t1.changes.append(-value))
+    assert not XTest.x.get_signaler_instance(t1).shares_signals
+    assert XTest.x.get_signaler_instance(t2).shares_signals
+    t1.x = 3
+    t2.x = 4
+    assert t1.changes == [1, 3, -3]
+    assert t2.changes == [2, 4]
+
+    # An object that shares the class level callbacks is freed without the garbage collector
+    gc.disable()
+    try:
+        t3 = XTest()
+        t3.x = 5
+        del t3.x
+        assert t3.changes == [5]
+        ref = weakref.ref(t3)
+        del t3
+        assert ref() is None, "The signaler should not create a reference cycle with the object"
+    finally:
+        gc.enable()
+
+    print("test_property_shared_callbacks passed!")
+
+
+def test_property_read():
+    class XTest(object):
+        def __init__(self, x=0):
+            self._x = x
+
+        @signaler_property
+        def x(self):
+            return self._x
+
+        @x.setter
+        def x(self, value):
+            self._x = value
+
+    t = XTest(1)
+    assert t.x == 1
+    assert XTest.x.__get__(t, XTest) == 1
+    assert XTest.__dict__["x"].__get__(None, XTest) is XTest.x
+    assert not hasattr(t, "__signalers__"), "Reading a value should not create a signaler instance"
+
+    t.x = 2
+    assert t.x == 2
+
+    class NoGetter(object):
+        x = signaler_property(fset=lambda self, value: None)
+
+    try:
+        NoGetter().x
+        raise AssertionError("A property without a getter should not be readable")
+    except AttributeError:
+        pass
+
+    print("test_property_read passed!")
+
+
+def test_property_slots():
+    class XTest(object):
+        __slots__ = ('_x', 'changes') + signaler_slots('x')
+
+        def __init__(self, x=0):
+            self._x = x
+            self.changes = []
+
+        @signaler_property
+        def x(self):
+            return self._x
+
+        @x.setter
+        def x(self, value):
+            self._x = value
+
+        @x.on("change")
+        def x_changed(self, value):
+            self.changes.append(value)
+
+    t = XTest()
+    assert not hasattr(t, "__dict__")
+    assert XTest.x.storage_empty and not XTest.x.signalers_dict
+    t.x = 1
+    assert t.x == 1
+    assert t.changes == [1]
+    assert not hasattr(t, "_XTest__x_signaler"), "A signaler that shares the class signals should not be stored"
+
+    values = []
+    XTest.x.on(t, "change", values.append)
+    assert not XTest.x.storage_empty
+    assert t._XTest__x_signaler is XTest.x.get_signaler_instance(t)
+    t.x = 2
+    assert t.changes == [1, 2]
+    assert values == [2]
+
+    # Objects with an empty slot still share the class signals after another object stored its signaler
+    t2 = XTest()
+    t2.x = 3
+    assert t2.changes == [3]
+    assert values == [2]
+    assert XTest.x.get_signaler_instance(t2).shares_signals
+
+    # A subclass with a __dict__ of a slots class without the storage slot stores the signaler in the __dict__
+    class Base(object):
+        __slots__ = ('_x',)
+
+        def __init__(self):
+            self._x = 0
+
+        def get_x(self):
+            return self._x
+
+        def set_x(self, value):
+            self._x = value
+
+        x = signaler_property(get_x, set_x)
+
+    class Sub(Base):
+        pass
+
+    assert Base.x.signalers_dict
+    sub = Sub()
+    sub_values = []
+    Base.x.on(sub, "change", sub_values.append)
+    assert "_Base__x_signaler" in sub.__dict__
+    sub.x = 4
+    assert sub_values == [4]
+
+    # A slots class without the storage slot cannot store the signaler instance
+    class NoSlot(object):
+        __slots__ = ('_x',)
+        x = signaler_property(lambda self: self._x)
+
+    try:
+        NoSlot.x.on(NoSlot(), "change", print)
+        raise AssertionError("The signaler instance should not be stored without a slot")
+    except AttributeError as error:
+        assert "_NoSlot__x_signaler" in str(error)
+
+    print("test_property_slots passed!")
+
+
+def test_update():
+    class Rect(object):
+        def __init__(self):
+            self._x = self._y = self._width = 0
+            self.events = []
+
+        @signaler_property
+        def x(self):
+            return self._x
+
+        @x.setter
+        def x(self, value):
+            self.events.append(("set", "x", value))
+            self._x = value
+
+        @signaler_property
+        def y(self):
+            return self._y
+
+        @y.setter
+        def y(self, value):
+            self.events.append(("set", "y", value))
+            self._y = value
+
+        @signaler_property
+        def width(self):
+            return self._width
+
+        @width.setter
+        def width(self, value):
+            self._width = max(value, 0)
+
+        @x.on("before_change")
+        @y.on("before_change")
+        def before_change(self, value):
+            self.events.append(("before_change", value))
+
+        @x.on("change")
+        @y.on("change")
+        def changed(self, value):
+            # Listeners see the final state of all fields
+            self.events.append(("change", value, self._x, self._y))
+
+    r = Rect()
+    fields = []
+    on_signal(r, "changed_fields", fields.append)
+
+    changed = update(r, x=1, y=2, width=-5)
+    assert changed == {"x": 1, "y": 2, "width": 0}, "The new values should come from the getter"
+    assert fields == [changed]
+    assert r.events == [("before_change", 1), ("before_change", 2),
+                        ("set", "x", 1), ("set", "y", 2),
+                        ("change", 1, 1, 2), ("change", 2, 1, 2)]
+
+    # Unchanged fields are skipped
+    assert update(r, x=1, y=3) == {"y": 3}
+    assert update(r, x=1) == {}
+    assert fields == [changed, {"y": 3}]
+
+    try:
+        update(r, events=[])
+        raise AssertionError("Only signaler_property values can be updated")
+    except AttributeError:
+        pass
+
+    # A batch fires changed_fields once with the fields of every update
+    del fields[:]
+    with batch():
+        update(r, x=4)
+        update(r, y=5, x=6)
+        assert fields == []
+    assert fields == [{"x": 6, "y": 5}]
+
+    # Objects without a changed_fields signal are updated normally
+    other = Rect()
+    assert update(other, x=3) == {"x": 3}
+    assert other.x == 3
+
+    print("test_update passed!")
+
+
+def test_check_change():
+    class Array(list):
+        """Compare elementwise like a numpy array."""
+        def __eq__(self, other):
+            raise ValueError('The truth value of an array is ambiguous')
+
+        __hash__ = None
+
+    class Item(object):
+        def __init__(self, value=None):
+            self._value = value
+            self.gets = 0
+
+        def get_value(self):
+            self.gets += 1
+            return self._value
+
+        def set_value(self, value):
+            self._value = value
+
+        identity = signaler_property(get_value, set_value, check_change='identity')
+        equality = signaler_property(get_value, set_value)
+        length = signaler_property(get_value, set_value, check_change=lambda old, new: len(old) == len(new))
+        hashed = signaler_property(get_value, set_value, check_change='hash')
+        verbatim = signaler_property(get_value, set_value, verbatim=True)
+        unchecked = signaler_property(get_value, set_value, check_change=False, verbatim=True)
+
+    changes = []
+    for name in ('identity', 'equality', 'length', 'hashed', 'verbatim', 'unchecked'):
+        getattr(Item, name).on('change', lambda self, value, name=name: changes.append(
+            (name, list(value) if isinstance(value, Array) else value)))
+
+    item = Item([1, 2])
+    item.identity = [1, 2]
+    item.identity = item._value
+    item.equality = [1, 2]
+    item.equality = Array([1, 3])  # numpy arrays are compared with array_equal
+    item.equality = Array([1, 3])
+    item.length = [4, 5]
+    item.length = [4, 5, 6]
+    item._value = (4, 5)
+    item.hashed = (4, 5, 6)
+    item.hashed = (4, 5, 6)
+    item.hashed = [4, 5, 6]  # Unhashable values are compared with ==
+    item.hashed = [4, 5, 6]
+    item.hashed = {'a': 1}
+    item.hashed = -2
+    item.hashed = -1  # hash(-1) == hash(-2) in CPython, equal hashes are confirmed with ==
+    assert item._value == -1
+    assert changes == [('identity', [1, 2]), ('equality', [1, 3]), ('length', [4, 5, 6]), ('hashed', (4, 5, 6)),
+                       ('hashed', [4, 5, 6]), ('hashed', {'a': 1}), ('hashed', -2), ('hashed', -1)]
+    assert Item.verbatim.setter(Item.set_value).verbatim
+    assert Item.identity.setter(Item.set_value).check_change is Item.identity.check_change
+
+    # Verbatim setters do not call the getter to fire the 'change' signal
+    item.gets = 0
+    item.equality = 1
+    assert item.gets == 2
+    item.gets = 0
+    item.verbatim = 2
+    assert item.gets == 1
+    item.gets = 0
+    item.unchecked = 2
+    assert item.gets == 0
+    assert changes[-3:] == [('equality', 1), ('verbatim', 2), ('unchecked', 2)]
+
+    try:
+        signaler_property(check_change='unknown')
+        raise AssertionError('Invalid check_change name')
+    except ValueError:
+        pass
+    try:
+        signaler_property(check_change=1)
+        raise AssertionError('Invalid check_change type')
+    except TypeError:
+        pass
+
+    print("test_check_change passed!")
+
+
 if __name__ == '__main__':
     test_property()
     test_no_setter()
@@ -345,4 +712,10 @@ if __name__ == '__main__':
     test_delete()
     test_property_block_signal()
     test_signal_dot_property()
+    test_property_no_receivers()
+    test_property_shared_callbacks()
+    test_property_read()
+    test_property_slots()
+    test_update()
+    test_check_change()
     print("All tests passed!")
@@ -0,0 +1,165 @@
+from __future__ import print_function
+
+import sys
+import threading
+
+from event_signal import add_signal, on_signal, off_signal, fire_signal, block_signals, is_blocked, get_signal, \
+    signaler
+
+
+THREADS = 8
+LOOPS = 1000
+
+
+class Counter(object):
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.value = 0
+
+    def __call__(self, *args):
+        with self.lock:
+            self.value += 1
+
+
+def run_threads(target, count=THREADS):
+    """Run the target in multiple threads with a short switch interval. Return the errors that were raised."""
+    errors = []
+    start = threading.Barrier(count)
+
+    def run(i):
+        try:
+            start.wait()
+            target(i)
+        except Exception as error:
+            errors.append(error)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+    return errors
+
+
+def test_connect_fire_threads():
+    class Obj(object):
+        pass
+
+    obj = add_signal(Obj(), "change")
+    persistent = Counter()
+    on_signal(obj, "change", persistent)
+    fires = Counter()
+
+    def work(i):
+        for j in range(LOOPS):
+            func = Counter()
+            on_signal(obj, "change", func)
+            fire_signal(obj, "change", j)
+            fires()
+            assert func.value >= 1
+            assert off_signal(obj, "change", func)
+
+    errors = run_threads(work)
+    assert errors == [], errors
+    assert persistent.value == fires.value == THREADS * LOOPS, (persistent.value, fires.value)
+    assert get_signal(obj, "change") == [persistent]
+
+    print("test_connect_fire_threads passed!")
+
+
+def test_block_threads():
+    class Obj(object):
+        pass
+
+    obj = add_signal(Obj(), "change")
+    counter = Counter()
+    on_signal(obj, "change", counter)
+
+    def work(i):
+        for j in range(LOOPS):
+            block_signals(obj, "change", True)
+            fire_signal(obj, "change", j)
+            block_signals(obj, "change", False)
+
+    errors = run_threads(work)
+    assert errors == [], errors
+    assert not is_blocked(obj, "change")
+    fire_signal(obj, "change", 1)
+    assert counter.value >= 1
+
+    print("test_block_threads passed!")
+
+
+def test_bound_signaler_threads():
+    class_calls = Counter()
+
+    class Model(object):
+        @signaler
+        def set_x(self, value):
+            self.x = value
+
+        @set_x.on("change")
+        def x_changed(self, value):
+            class_calls()
+
+    for _ in range(20):
+        m = Model()
+        calls = Counter()
+
+        def work(i):
+            # Half of the threads connect instance callbacks while the signals are copied for the instance
+            for j in range(50):
+                if i % 2:
+                    m.set_x.on("change", lambda value, j=j: None)
+                m.set_x(j)
+                calls()
+
+        errors = run_threads(work)
+        assert errors == [], errors
+        assert class_calls.value == calls.value, (class_calls.value, calls.value)
+        class_calls.value = 0
+
+    print("test_bound_signaler_threads passed!")
+
+
+def test_bound_dispatch_table_threads():
+    for _ in range(20):
+        class Model(object):
+            @signaler
+            def set_x(self, value):
+                self.x = value
+
+        models = [Model() for _ in range(THREADS)]
+        sigs = [None] * THREADS
+
+        def work(i):
+            # Every thread creates the first instance signaler of the descriptor at the same time
+            sigs[i] = models[i].set_x
+
+        errors = run_threads(work)
+        assert errors == [], errors
+        table = Model.set_x.event_bound_dispatch
+        assert all(sig._bound_dispatch is table for sig in sigs)
+
+        calls = Counter()
+        for model in models:
+            model.set_x(1)  # Compile the bound dispatch
+        Model.set_x.on("change", calls)
+        for model in models:
+            model.set_x(2)
+        assert calls.value == THREADS, calls.value
+
+    print("test_bound_dispatch_table_threads passed!")
+
+
+if __name__ == '__main__':
+    test_connect_fire_threads()
+    test_block_threads()
+    test_bound_signaler_threads()
+    test_bound_dispatch_table_threads()
+    print("All tests passed!")